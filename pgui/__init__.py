@@ -7,7 +7,69 @@
 # @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
 
 
-from .entry import *
-from .slider import *
-from .button import *
-from .checkbox import *
+import importlib
+
+# Public names and the submodule that defines each one.
+# The submodules, and pygame with them, are only imported the first time one of their names is used
+_names = {
+    "Widget": "widget",
+    "Entry": "entry",
+    "Slider": "slider",
+    "Button": "button",
+    "CheckBox": "checkbox",
+    "FontCache": "fonts",
+    "font_cache": "fonts",
+    "get_font": "fonts",
+    "LabelCache": "labels",
+    "label_cache": "labels",
+    "render_label": "labels",
+    "LabelLayout": "labels",
+    "Compositor": "compositor",
+    "UIManager": "manager",
+    "SpatialGrid": "spatial",
+    "TextInput": "textinput",
+    "text_input": "textinput",
+    "TextBuffer": "textbuffer",
+    "GlyphTable": "glyphs",
+    "TextWidths": "glyphs",
+    "get_glyph_table": "glyphs",
+    "Scheduler": "timers",
+    "Timer": "timers",
+    "scheduler": "timers",
+    "MainLoop": "loop",
+    "Style": "style",
+    "Theme": "style",
+    "get_theme": "style",
+    "set_theme": "style",
+    "WidgetGroup": "group",
+    "Profiler": "profiling",
+    "profiler": "profiling",
+    "stats": "profiling",
+    "Layout": "layout",
+    "HBox": "layout",
+    "VBox": "layout",
+    "Grid": "layout",
+    "AnchorLayout": "layout",
+    "ListView": "listview",
+    "ListRow": "listview",
+    "TextArea": "textarea",
+}
+
+_submodules = {"attributes"} | set(_names.values())
+
+__all__ = list(_names)
+
+
+def __getattr__(name):
+    if name in _names:
+        value = getattr(importlib.import_module("." + _names[name], __name__), name)
+        # Keep it so this function is not called again for the same name
+        globals()[name] = value
+        return value
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,201 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+_missing = object()
+
+
+class Attribute:
+    """
+    ### Description
+    Public widget attribute.
+    The value is checked once when it is assigned, and the widget is marked dirty if it changed.
+    The value is stored in the widget under the same name with a leading underscore, and overrides the theme.
+    Until it is assigned, the value comes from the `style` of the widget class.
+
+    ### Usage
+    ```python
+    class MyWidget(Widget):
+        color = Attribute()
+    ```
+
+    #### Parameters
+    `alias: str`
+    Name used in the error messages instead of the attribute name.
+
+    ---
+
+    """
+
+    def __init__(self, alias=None):
+        self.alias = alias
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.alias = self.alias or name
+        self.slot = "_" + name
+
+    def __get__(self, widget, owner=None):
+        if widget is None:
+            return self
+        value = getattr(widget, self.slot, _missing)
+        if value is _missing:
+            # Not assigned yet, use the default value shared by every widget of the class
+            value = widget.style.get(self.name, _missing)
+            if value is _missing:
+                raise AttributeError(f"{type(widget).__name__!r} object has no attribute {self.name!r}")
+        return value
+
+    def __set__(self, widget, value):
+        self.check(value)
+        current = getattr(widget, self.slot, _missing)
+        if current is _missing:
+            current = widget.style.get(self.name, _missing)
+        # The value is stored even if it is the one of the style, so it overrides the theme
+        setattr(widget, self.slot, value)
+        if current != value:
+            widget._dirty = True
+            if self.name in widget._layout_attributes:
+                widget._hint_changed()
+
+    def check(self, value):
+        pass
+
+
+class Color(Attribute):
+    """
+    ### Description
+    Attribute holding a 3-tuple with an RGB value.
+
+    #### Parameters
+    `optional: bool`
+    Allow the attribute to be None.
+
+    ---
+
+    """
+
+    def __init__(self, optional=False, alias=None):
+        super().__init__(alias)
+        self.optional = optional
+
+    def check(self, value):
+        if value is None and self.optional:
+            return
+        if type(value) != tuple:
+            raise TypeError(f".{self.alias} must be a tuple, not", type(value))
+        elif len(value) != 3:
+            raise ValueError("Expected 3 values, got,", len(value))
+        else:
+            for i, n in enumerate(value):
+                if type(n) != int:
+                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
+
+
+class Integer(Attribute):
+    """
+    ### Description
+    Attribute holding an integer.
+
+    #### Parameters
+    `minimum: int`
+    Smallest value allowed. Set to None for no limit.
+
+    ---
+
+    """
+
+    def __init__(self, minimum=0, alias=None):
+        super().__init__(alias)
+        self.minimum = minimum
+
+    def check(self, value):
+        if type(value) != int:
+            raise TypeError(f".{self.alias} must be an integer, not", type(value))
+        elif self.minimum is not None and value < self.minimum:
+            raise ValueError(f".{self.alias} must be equal or greater than {self.minimum}.")
+
+
+class String(Attribute):
+    """
+    ### Description
+    Attribute holding a string.
+
+    ---
+
+    """
+
+    def check(self, value):
+        if type(value) != str:
+            raise TypeError(f".{self.alias} must be a string, not", type(value))
+
+
+class Boolean(Attribute):
+    """
+    ### Description
+    Attribute holding a bool.
+
+    ---
+
+    """
+
+    def check(self, value):
+        if type(value) != bool:
+            raise TypeError(f".{self.alias} must be a bool, not", type(value))
+
+
+class Choice(Attribute):
+    """
+    ### Description
+    Attribute holding a string from a list of options.
+
+    #### Parameters
+    `options: list`
+    The strings allowed.
+
+    `message: str`
+    Error message used when the value is not one of the options.
+
+    ---
+
+    """
+
+    def __init__(self, options, alias=None, message=None):
+        super().__init__(alias)
+        self.options = options
+        self.message = message
+
+    def check(self, value):
+        if type(value) != str:
+            raise TypeError(f".{self.alias} must be a string, not", type(value))
+        elif value not in self.options:
+            raise ValueError(self.message or f".{self.alias} must be in {self.options}")
+
+
+class Function(Attribute):
+    """
+    ### Description
+    Attribute holding a function or method.
+
+    #### Parameters
+    `optional: bool`
+    Allow the attribute to be None.
+
+    ---
+
+    """
+
+    def __init__(self, optional=False, alias=None):
+        super().__init__(alias)
+        self.optional = optional
+
+    def check(self, value):
+        if value is None and self.optional:
+            return
+        if not callable(value):
+            raise TypeError(f".{self.alias} must be a function or method, not", type(value))
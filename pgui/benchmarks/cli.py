@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# Command line shared by the benchmarks that check a single limit, so they all      #
+# answer `--help` and reject unknown options the same way.                          #
+#####################################################################################
+
+import argparse
+
+
+def parse_limit(description, default=None, help=None):
+    """
+    #### Description
+    Read the command line of a benchmark. It takes the limit the benchmark checks as an optional
+    positional argument, or no argument if `default` is None.
+
+    #### Parameters
+    `description: str`
+    What the benchmark does, shown by `--help`.
+
+    `default: float`
+    Limit used when none is given, or None if the benchmark takes no limit.
+
+    `help: str`
+    Description of the limit, such as "time limit in ms".
+
+    #### Returns
+    `float` with the limit, or None if the benchmark takes no limit.
+
+    #### Usage
+    `parse_limit("pgui memory benchmark", LIMIT, "memory limit of the process in MB")`
+
+    ---
+
+    """
+    parser = argparse.ArgumentParser(description=description)
+    if default is not None:
+        parser.add_argument("limit", nargs="?", type=float, default=default, help=f"{help} (default: {default})")
+    args = parser.parse_args()
+    return args.limit if default is not None else None
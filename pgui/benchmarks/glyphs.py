@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark checks that the widths measured by the shared glyph tables add up  #
+# to the width pygame renders, for several texts and font sizes, and measures how   #
+# long measuring a text takes. It fails if a measured width is off.                 #
+# Run it with `python -m pgui.benchmarks.glyphs`                                    #
+#####################################################################################
+
+import os
+import sys
+import time
+
+# The benchmark does not need a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pgui
+import pygame
+from pgui.benchmarks.cli import parse_limit
+
+pygame.init()
+
+SIZES = (12, 16, 20, 24, 33)
+# Repeated letters, kerning pairs, digits, overhangs and a pangram
+TEXTS = (
+    "W" * 10,
+    "The quick brown fox jumps over the lazy dog",
+    "0123456789" * 4,
+    "AVAVA To Ta WAVE",
+    "iiilll111 ,.;: fff jjj",
+    "\\_\\_ /// |||",
+)
+CALLS = 200
+
+
+def run():
+    failed = False
+    for size in SIZES:
+        font = pgui.get_font("Arial", size)
+        glyphs = pgui.get_glyph_table("Arial", size)
+        for text in TEXTS:
+            measured = sum(glyphs.measure(text))
+            rendered = font.size(text)[0]
+            if measured != rendered:
+                print(f"FAIL: {text!r} at {size} px measures {measured} px, pygame renders {rendered} px")
+                failed = True
+            # After another character, only the width the text adds is measured
+            measured = sum(glyphs.measure(text[1:], text[0]))
+            rendered = font.size(text)[0] - font.size(text[0])[0]
+            if measured != rendered:
+                print(f"FAIL: {text[1:]!r} after {text[0]!r} at {size} px measures {measured} px, "
+                      f"pygame renders {rendered} px")
+                failed = True
+
+    glyphs = pgui.get_glyph_table("Arial", 20)
+    for text in TEXTS:
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            glyphs.measure(text)
+        print(f"{len(text):>4} characters: {(time.perf_counter() - start) / CALLS * 1e6:.1f} us")
+
+    if not failed:
+        print("OK")
+    return not failed
+
+
+if __name__ == "__main__":
+    parse_limit("pgui glyph width check")
+    sys.exit(0 if run() else 1)
@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark compares finding the widget under the mouse with the spatial grid  #
+# of the UIManager against checking every widget, for up to 100k check boxes.       #
+# Run it with `python -m pgui.benchmarks.hit_testing`                               #
+#####################################################################################
+
+import os
+import random
+import time
+
+# The benchmark does not need a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pgui
+import pygame
+from pgui.benchmarks.cli import parse_limit
+
+pygame.init()
+
+COUNTS = (100, 1000, 10000, 100000)
+QUERIES = 10000
+LINEAR_QUERIES = 100
+
+
+class Main:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((1, 1))
+
+
+def linear_widget_at(widgets, pos):
+    # This is how every widget checked the mouse before the spatial grid
+    for widget in reversed(widgets):
+        if widget._rect.collidepoint(pos):
+            return widget
+    return None
+
+
+def per_query(func, points):
+    start = time.perf_counter()
+    for point in points:
+        func(point)
+    return (time.perf_counter() - start) / len(points)
+
+
+def run():
+    main = Main()
+    random.seed(0)
+    print(f"{'widgets':>8} {'grid (us)':>10} {'linear (us)':>12} {'rect query (us)':>16}")
+    for count in COUNTS:
+        # Lay out the check boxes in a square grid, 24 pixels apart
+        columns = int(count ** 0.5) + 1
+        widgets = [pgui.CheckBox(main, x=(i % columns) * 24, y=(i // columns) * 24) for i in range(count)]
+        manager = pgui.UIManager()
+        manager.add(*widgets)
+
+        side = columns * 24
+        points = [(random.randrange(side), random.randrange(side)) for _ in range(QUERIES)]
+        rects = [pygame.Rect(x, y, 100, 100) for x, y in points[:1000]]
+
+        grid = per_query(manager.widget_at, points)
+        linear = per_query(lambda pos: linear_widget_at(widgets, pos), points[:LINEAR_QUERIES])
+        area = per_query(manager.widgets_in, rects)
+        print(f"{count:>8} {grid * 1e6:>10.2f} {linear * 1e6:>12.2f} {area * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    parse_limit("pgui hit-testing benchmark")
+    run()
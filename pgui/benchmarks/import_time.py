@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark measures how long it takes to import pgui in a new interpreter and #
+# checks that importing it has no side effects. It fails if `import pgui` imports   #
+# pygame or keyboard, or if it takes longer than the limit.                         #
+# Run it with `python -m pgui.benchmarks.import_time [limit in ms]`                 #
+#####################################################################################
+
+import os
+import statistics
+import subprocess
+import sys
+
+from pgui.benchmarks.cli import parse_limit
+
+RUNS = 10
+# Time limit in milliseconds for `import pgui`, without pygame
+LIMIT = 20
+
+STATEMENTS = {
+    "python": "pass",
+    "import pygame": "import pygame",
+    "import pgui": "import pgui",
+    "pgui.Slider": "import pgui; pgui.Slider",
+    "pgui.Entry": "import pgui; pgui.Entry",
+}
+
+# Printed by a new interpreter after importing pgui
+CHECK = """
+import sys
+import pgui
+loaded = [name for name in ("pygame", "keyboard") if name in sys.modules]
+print(",".join(loaded))
+"""
+
+
+# Without the pygame welcome message in the output
+ENV = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+
+
+def measure(statement):
+    # Time a new interpreter running the statement, so nothing is already imported
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    times = []
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=ENV, check=True)
+        times.append(float(output.stdout.split()[-1]) * 1000)
+    return statistics.median(times)
+
+
+def run(limit=LIMIT):
+    print(f"{'statement':>14} {'median (ms)':>12}")
+    results = {}
+    for name, statement in STATEMENTS.items():
+        results[name] = measure(statement)
+        print(f"{name:>14} {results[name]:>12.2f}")
+
+    loaded = subprocess.run([sys.executable, "-c", CHECK], capture_output=True, text=True, env=ENV, check=True).stdout.strip()
+    failed = False
+    if loaded:
+        print(f"FAIL: importing pgui also imports {loaded}")
+        failed = True
+    if results["import pgui"] > limit:
+        print(f"FAIL: importing pgui takes {results['import pgui']:.2f} ms, the limit is {limit} ms")
+        failed = True
+    if not failed:
+        print("OK")
+    return not failed
+
+
+if __name__ == "__main__":
+    limit = parse_limit("pgui import time benchmark", LIMIT, "time limit in ms for `import pgui`")
+    sys.exit(0 if run(limit) else 1)
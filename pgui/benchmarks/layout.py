@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark lays out 1000 widgets in rows of a VBox, managed by a UIManager,   #
+# and measures resizing the window and changing one label, including updating the   #
+# spatial grid of the manager. It fails if a resize, or building the grid again     #
+# after it, takes more than a budget.                                               #
+# Run it with `python -m pgui.benchmarks.layout [budget in ms]`                     #
+#####################################################################################
+
+import os
+import sys
+import time
+
+# The benchmark does not need a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pgui
+import pygame
+from pgui.benchmarks.cli import parse_limit
+
+pygame.init()
+
+ROWS = 100
+RESIZES = 50
+LABELS = 200
+# Budget in milliseconds for laying out the 1000 widgets after a resize, about half a 60 FPS frame
+BUDGET = 8
+
+
+class Main:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((1, 1))
+
+
+def build(main):
+    # Each row has a labeled slider, an entry and a labeled check box, and 7 buttons
+    root = pgui.VBox(spacing=4, padding=8)
+    widgets = []
+    for index in range(ROWS):
+        row = pgui.HBox(spacing=4)
+        slider = pgui.Slider(main, length=100)
+        slider.set_label(f"Slider {index}")
+        entry = pgui.Entry(main, width=120)
+        checkbox = pgui.CheckBox(main)
+        checkbox.set_label("On")
+        buttons = [pgui.Button(main, text=f"Button {index}.{column}") for column in range(7)]
+        row.add(slider, stretch=1)
+        row.add(entry, stretch=1)
+        row.add(checkbox, align="center")
+        for button in buttons:
+            row.add(button)
+        root.add(row)
+        widgets += [slider, entry, checkbox, *buttons]
+    manager = pgui.UIManager()
+    manager.add(*widgets)
+    return root, widgets, manager
+
+
+def per_call(func, count):
+    start = time.perf_counter()
+    for index in range(count):
+        func(index)
+    return (time.perf_counter() - start) / count
+
+
+def run(budget=BUDGET):
+    main = Main()
+    root, widgets, manager = build(main)
+    print(f"{len(widgets)} widgets")
+
+    start = time.perf_counter()
+    root.apply((0, 0, 1600, 900))
+    print(f"first layout: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    unchanged = per_call(lambda index: root.apply(), RESIZES)
+    print(f"nothing changed: {unchanged * 1e6:.2f} us")
+
+    def resize(index):
+        root.apply((0, 0, 1600 + index % 2 * 200, 900 + index % 2 * 100))
+        # The manager gets an event after every resize. Its spatial grid is built again once the widgets stop moving
+        manager.widget_at((0, 0))
+
+    resize = per_call(resize, RESIZES)
+    print(f"window resize: {resize * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    manager.widget_at((0, 0))
+    rebuild = time.perf_counter() - start
+    print(f"grid built again after resizing: {rebuild * 1000:.2f} ms")
+
+    buttons = [widget for widget in widgets if isinstance(widget, pgui.Button)]
+
+    def relabel(index):
+        buttons[index * 37 % len(buttons)].set_label(f"Label {index}")
+        root.apply()
+        manager.widget_at((0, 0))
+
+    label = per_call(relabel, LABELS)
+    print(f"one label changed: {label * 1000:.3f} ms")
+
+    if resize * 1000 > budget:
+        print(f"FAIL: a resize takes {resize * 1000:.2f} ms, the budget is {budget} ms")
+        return False
+    if rebuild * 1000 > budget:
+        print(f"FAIL: building the grid again takes {rebuild * 1000:.2f} ms, the budget is {budget} ms")
+        return False
+    print("OK")
+    return True
+
+
+if __name__ == "__main__":
+    budget = parse_limit("pgui layout benchmark", BUDGET, "budget in ms for a window resize")
+    sys.exit(0 if run(budget) else 1)
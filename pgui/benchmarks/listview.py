@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark scrolls lists of 1000, 100k and 10M rows and measures a scroll     #
+# step, including building the rows that scroll in and drawing the list. It fails   #
+# if the largest list scrolls more than a factor slower than the smallest one.      #
+# Run it with `python -m pgui.benchmarks.listview [factor]`                         #
+#####################################################################################
+
+import os
+import sys
+import time
+
+# The benchmark does not need a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pgui
+import pygame
+from pgui.benchmarks.cli import parse_limit
+
+pygame.init()
+
+ROW_COUNTS = (1000, 100_000, 10_000_000)
+STEPS = 300
+# The largest list may scroll at most this many times slower than the smallest one
+FACTOR = 2
+
+
+class Main:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((400, 600))
+
+
+def per_step(main, row_count):
+    view = pgui.ListView(main, width=400, height=600, row_count=row_count, provider=lambda index: f"Row {index}")
+    view.draw()
+    # Scroll a few rows at a time, like the mouse wheel, and jump now and then, like the scrollbar
+    steps = [index * 72 if index % 10 else index * row_count // STEPS * view._row_height for index in range(STEPS)]
+    start = time.perf_counter()
+    for scroll in steps:
+        view.set_scroll(scroll)
+        view.draw()
+    elapsed = (time.perf_counter() - start) / STEPS
+    return elapsed, len(view._rows) + len(view._pool)
+
+
+def run(factor=FACTOR):
+    main = Main()
+    # Load the font and fill the label cache before measuring
+    per_step(main, ROW_COUNTS[0])
+    times = []
+    for row_count in ROW_COUNTS:
+        elapsed, rows = per_step(main, row_count)
+        times.append(elapsed)
+        print(f"{row_count:>10} rows: {elapsed * 1000:.3f} ms per scroll step, {rows} row widgets")
+
+    ratio = times[-1] / times[0]
+    if ratio > factor:
+        print(f"FAIL: scrolling {ROW_COUNTS[-1]} rows is {ratio:.2f} times slower than {ROW_COUNTS[0]} rows")
+        return False
+    print("OK")
+    return True
+
+
+if __name__ == "__main__":
+    factor = parse_limit("pgui list benchmark", FACTOR, "times slower the largest list may scroll")
+    sys.exit(0 if run(factor) else 1)
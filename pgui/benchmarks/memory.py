@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark measures the memory used by each kind of widget, and builds 100k   #
+# check boxes checking that the memory of the process stays under a limit.         #
+# Run it with `python -m pgui.benchmarks.memory [limit in MB]`                      #
+#####################################################################################
+
+import os
+import sys
+import tracemalloc
+
+# The benchmark does not need a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pgui
+import pygame
+from pgui.benchmarks.cli import parse_limit
+
+pygame.init()
+
+COUNT = 100000
+SAMPLE = 1000
+# Limit in MB for the memory of the process after building and drawing the check boxes
+LIMIT = 150
+
+
+class Main:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((1, 1))
+
+
+def rss():
+    # Resident memory of the process in MB
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+def footprint(main, cls, draw):
+    # Average Python memory in bytes used by one widget, without the shared caches
+    cls(main).update()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    widgets = [cls(main) for _ in range(SAMPLE)]
+    if draw:
+        for widget in widgets:
+            widget.refresh()
+    size = (tracemalloc.get_traced_memory()[0] - before) / SAMPLE
+    tracemalloc.stop()
+    return size
+
+
+def run(limit=LIMIT):
+    main = Main()
+    print(f"{'widget':>10} {'created (B)':>12} {'drawn (B)':>10}")
+    for cls in (pgui.Button, pgui.Slider, pgui.CheckBox, pgui.Entry):
+        print(f"{cls.__name__:>10} {footprint(main, cls, False):>12.0f} {footprint(main, cls, True):>10.0f}")
+
+    start = rss()
+    widgets = [pgui.CheckBox(main, x=(i % 300) * 24, y=(i // 300) * 24) for i in range(COUNT)]
+    created = rss()
+    for widget in widgets:
+        widget.refresh()
+    drawn = rss()
+    print(f"{COUNT} check boxes: {created - start:.1f} MB created, {drawn - start:.1f} MB drawn, "
+          f"{drawn:.1f} MB process")
+    if drawn > limit:
+        print(f"FAIL: the process uses {drawn:.1f} MB, the limit is {limit} MB")
+        return False
+    print("OK")
+    return True
+
+
+if __name__ == "__main__":
+    limit = parse_limit("pgui memory benchmark", LIMIT, "memory limit of the process in MB")
+    sys.exit(0 if run(limit) else 1)
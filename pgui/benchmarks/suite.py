@@ -0,0 +1,260 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark suite measures the frames per second and the frame times of        #
+# screens full of widgets driven by scripted mouse and keyboard events, the typing  #
+# speed of the Entry, and the cost of changing labels and font sizes.               #
+# It does not need a window, and it writes the results to a JSON file that can be   #
+# compared with the results of another commit.                                      #
+# Run it with `python -m pgui.benchmarks.suite --help` to see the options           #
+#####################################################################################
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+
+# The benchmark does not need a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pgui
+import pygame
+
+pygame.init()
+
+COUNTS = (10, 100, 1000, 10000, 100000)
+FRAMES = 100
+KEYSTROKES = 2000
+CALLS = 500
+
+E = pygame.event.Event
+
+
+class Main:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((1280, 720))
+
+
+def nothing():
+    pass
+
+
+# Size of the cell each kind of widget takes in the layout, and how to create it
+WIDGETS = {
+    "Button": ((110, 60), lambda main, x, y: pgui.Button(main, x=x, y=y, func=nothing)),
+    "Slider": ((230, 40), lambda main, x, y: pgui.Slider(main, x=x, y=y)),
+    "CheckBox": ((30, 30), lambda main, x, y: pgui.CheckBox(main, x=x, y=y)),
+    "Entry": ((110, 40), lambda main, x, y: pgui.Entry(main, x=x, y=y, width=100)),
+}
+
+
+def percentiles(times):
+    # Frame time statistics in milliseconds
+    times = sorted(times)
+
+    def at(p):
+        return times[min(int(p / 100 * len(times)), len(times) - 1)] * 1000
+
+    return {"p50": at(50), "p90": at(90), "p99": at(99), "max": times[-1] * 1000, "mean": sum(times) / len(times) * 1000}
+
+
+def script(widget, frame):
+    # Synthetic input: move to a widget, press and release the mouse on it and type if it is an entry
+    pos = widget._rect.center
+    step = frame % 4
+    if step == 0:
+        return [E(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))]
+    if step == 1:
+        return [E(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)]
+    if step == 2:
+        return [E(pygame.MOUSEMOTION, pos=(pos[0] + 3, pos[1]), rel=(3, 0), buttons=(1, 0, 0))]
+    return [E(pygame.MOUSEBUTTONUP, pos=pos, button=1), E(pygame.TEXTINPUT, text="a")]
+
+
+def bench_frames(main, name, count, frames):
+    (width, height), create = WIDGETS[name]
+    columns = max(main.screen.get_width() // width, 1)
+
+    start = time.perf_counter()
+    widgets = [create(main, (i % columns) * width, (i // columns) * height) for i in range(count)]
+    manager = pgui.UIManager()
+    manager.add(*widgets)
+    compositor = pgui.Compositor(main.screen)
+    compositor.add(*widgets)
+    build = time.perf_counter() - start
+
+    # The first frame draws every widget
+    start = time.perf_counter()
+    compositor.draw()
+    first = time.perf_counter() - start
+
+    random.seed(0)
+    # The targets are on the screen, so the changes have to be drawn
+    visible = [widget for widget in widgets if main.screen.get_rect().contains(widget._rect)] or widgets
+    targets = [random.choice(visible) for _ in range(frames // 4 + 1)]
+    times = []
+    start = time.perf_counter()
+    for frame in range(frames):
+        events = script(targets[frame // 4], frame)
+        begin = time.perf_counter()
+        manager.process_events(events)
+        compositor.draw()
+        times.append(time.perf_counter() - begin)
+    total = time.perf_counter() - start
+
+    manager.remove(*widgets)
+    pgui.text_input.set_focus(None)
+    return {
+        "widget": name,
+        "count": count,
+        "frames": frames,
+        "build_ms": build * 1000,
+        "first_frame_ms": first * 1000,
+        "fps": frames / total,
+        "frame_ms": percentiles(times),
+    }
+
+
+def bench_typing(main, keystrokes, initial):
+    entry = pgui.Entry(main, x=10, y=10, width=300)
+    entry.text = "a" * initial
+    manager = pgui.UIManager()
+    manager.add(entry)
+    manager.set_focus(entry)
+    compositor = pgui.Compositor(main.screen)
+    compositor.add(entry)
+    compositor.draw()
+
+    # Type in the middle of the text, then delete some of it
+    entry.set_cursor(initial // 2)
+    times = []
+    start = time.perf_counter()
+    for i in range(keystrokes):
+        if i % 10 == 9:
+            event = E(pygame.KEYDOWN, key=pygame.K_BACKSPACE, mod=0, unicode="")
+        else:
+            event = E(pygame.TEXTINPUT, text="abcdefghij"[i % 10])
+        begin = time.perf_counter()
+        manager.process_events([event])
+        compositor.draw()
+        times.append(time.perf_counter() - begin)
+    total = time.perf_counter() - start
+
+    pgui.text_input.set_focus(None)
+    return {
+        "initial_length": initial,
+        "keystrokes": keystrokes,
+        "keys_per_second": keystrokes / total,
+        "keystroke_ms": percentiles(times),
+    }
+
+
+def bench_calls(main, name, method, values, calls):
+    # Time a method of a widget and composing the widget again
+    widget = WIDGETS[name][1](main, 10, 10)
+    widget.refresh()
+    times = []
+    for i in range(calls):
+        begin = time.perf_counter()
+        getattr(widget, method)(values(i))
+        widget.refresh()
+        times.append(time.perf_counter() - begin)
+    return {"widget": name, "method": method, "calls": calls, "call_ms": percentiles(times)}
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(map(str, pygame.get_sdl_version())),
+        "platform": platform.platform(),
+    }
+
+
+def run(counts=COUNTS, frames=FRAMES, keystrokes=KEYSTROKES, calls=CALLS):
+    main = Main()
+    results = {"meta": metadata(), "frames": [], "typing": [], "labels": [], "font_size": []}
+
+    print(f"{'widget':>9} {'count':>7} {'fps':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'build (ms)':>11}")
+    for name in WIDGETS:
+        for count in counts:
+            result = bench_frames(main, name, count, frames)
+            results["frames"].append(result)
+            print(f"{name:>9} {count:>7} {result['fps']:>9.1f} {result['frame_ms']['p50']:>9.3f} "
+                  f"{result['frame_ms']['p99']:>9.3f} {result['build_ms']:>11.1f}")
+
+    print(f"\n{'text length':>12} {'keys/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for initial in (0, 10000, 100000):
+        result = bench_typing(main, keystrokes, initial)
+        results["typing"].append(result)
+        print(f"{initial:>12} {result['keys_per_second']:>9.0f} {result['keystroke_ms']['p50']:>9.3f} "
+              f"{result['keystroke_ms']['p99']:>9.3f}")
+
+    print(f"\n{'widget':>9} {'method':>14} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for name in WIDGETS:
+        # A new text every call, so the label cache can't help
+        result = bench_calls(main, name, "set_label", lambda i: f"Label {i}", calls)
+        results["labels"].append(result)
+        print(f"{name:>9} {'set_label':>14} {result['call_ms']['p50']:>9.3f} {result['call_ms']['p99']:>9.3f}")
+        result = bench_calls(main, name, "set_font_size", lambda i: 12 + i % 8, calls)
+        results["font_size"].append(result)
+        print(f"{name:>9} {'set_font_size':>14} {result['call_ms']['p50']:>9.3f} {result['call_ms']['p99']:>9.3f}")
+    return results
+
+
+def compare(results, previous):
+    # Print how much each measure changed since the previous results
+    def rows(data):
+        for result in data["frames"]:
+            yield f"{result['widget']} x{result['count']} frame p50", result["frame_ms"]["p50"]
+        for result in data["typing"]:
+            yield f"typing into {result['initial_length']} chars p50", result["keystroke_ms"]["p50"]
+        for result in data["labels"] + data["font_size"]:
+            yield f"{result['widget']}.{result['method']} p50", result["call_ms"]["p50"]
+
+    before = dict(rows(previous))
+    print(f"\nCompared with {previous['meta']['commit'] or 'the previous results'} (time, lower is better):")
+    for name, value in rows(results):
+        if before.get(name):
+            print(f"{name:>40} {before[name]:>9.3f} -> {value:>9.3f} ms ({(value / before[name] - 1) * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pgui benchmark suite")
+    parser.add_argument("--counts", default=",".join(map(str, COUNTS)), help="widget counts, separated by commas")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="frames measured for each widget count")
+    parser.add_argument("--keystrokes", type=int, default=KEYSTROKES, help="keys typed into the entry")
+    parser.add_argument("--calls", type=int, default=CALLS, help="calls to set_label and set_font_size")
+    parser.add_argument("--output", default="pgui-benchmark.json", help="JSON file for the results")
+    parser.add_argument("--compare", help="JSON file with previous results to compare with")
+    args = parser.parse_args()
+
+    results = run(tuple(int(n) for n in args.counts.split(",")), args.frames, args.keystrokes, args.calls)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResults written to {args.output}")
+    if args.compare:
+        with open(args.compare) as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
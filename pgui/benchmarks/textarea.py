@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This benchmark types in the middle of text areas of 1000, 10k and 100k lines and  #
+# measures a key press, including wrapping and drawing the text area again. It      #
+# fails if typing in the largest text is more than a factor slower than typing in   #
+# the smallest one, or if a wrapped row is wider than the text area once rendered.  #
+# Run it with `python -m pgui.benchmarks.textarea [factor]`                         #
+#####################################################################################
+
+import os
+import sys
+import time
+
+# The benchmark does not need a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pgui
+import pygame
+from pgui.benchmarks.cli import parse_limit
+
+pygame.init()
+
+LINE_COUNTS = (1000, 10_000, 100_000)
+KEYS = 500
+# Typing in the largest text may be at most this many times slower than in the smallest one
+FACTOR = 2
+
+
+class Main:
+    def __init__(self):
+        self.screen = pygame.display.set_mode((600, 800))
+
+
+def document(line_count):
+    # Lines of different lengths, some of them wrapped
+    words = "the quick brown fox jumps over the lazy dog ".split()
+    return "\n".join(" ".join(words[:index % 30]) + f" {index}" for index in range(line_count))
+
+
+def per_key(main, line_count):
+    start = time.perf_counter()
+    area = pgui.TextArea(main, width=600, height=800, text=document(line_count))
+    load = time.perf_counter() - start
+    area.typing = True
+    area.set_cursor(line_count // 2, 0)
+    area.draw()
+    enter = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="")
+    backspace = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, mod=0, unicode="")
+    start = time.perf_counter()
+    for index in range(KEYS):
+        # Type a few characters, then break the line and join it again
+        if index % 20 == 18:
+            area.on_key_down(enter)
+        elif index % 20 == 19:
+            area.on_key_down(backspace)
+        else:
+            area.on_text_input("abcdefghijklmnopqrstuvwxyz "[index % 27])
+        area.draw()
+    return (time.perf_counter() - start) / KEYS, load
+
+
+def check_rows(main):
+    # Every wrapped row must fit in the text area once rendered on its own
+    text = "W" * 200 + "\n" + "0123456789" * 40 + "\n" + "AVAVA To Ta WAVE " * 20 + "\n" + document(30)
+    for width, size in ((300, 20), (250, 14), (420, 24), (600, 16)):
+        area = pgui.TextArea(main, width=width, height=800, size=size, text=text)
+        area.draw()
+        font = area._font
+        limit = area._text_rect().width
+        for line in area._lines:
+            if line.breaks is None:
+                continue
+            ends = line.breaks[1:] + [len(line.text)]
+            for start, end in zip(line.breaks, ends):
+                if font.size(line.text[start:end])[0] > limit:
+                    print(f"FAIL: the row {line.text[start:end]!r} is wider than the text area "
+                          f"({font.size(line.text[start:end])[0]} > {limit} px)")
+                    return False
+    return True
+
+
+def run(factor=FACTOR):
+    main = Main()
+    if not check_rows(main):
+        return False
+    # Load the font and fill the glyph tables before measuring
+    per_key(main, LINE_COUNTS[0])
+    times = []
+    for line_count in LINE_COUNTS:
+        elapsed, load = per_key(main, line_count)
+        times.append(elapsed)
+        print(f"{line_count:>7} lines: {elapsed * 1000:.3f} ms per key, loaded in {load * 1000:.1f} ms")
+
+    ratio = times[-1] / times[0]
+    if ratio > factor:
+        print(f"FAIL: typing in {LINE_COUNTS[-1]} lines is {ratio:.2f} times slower than in {LINE_COUNTS[0]} lines")
+        return False
+    print("OK")
+    return True
+
+
+if __name__ == "__main__":
+    factor = parse_limit("pgui text area benchmark", FACTOR, "times slower typing in the largest text may be")
+    sys.exit(0 if run(factor) else 1)
@@ -9,14 +9,24 @@
 
 import pygame as pg
 
-pg.init()
+from .attributes import Boolean, Color, Function, Integer, String
+from .fonts import get_font
+from .glyphs import get_glyph_table
+from .labels import render_label
+from .style import Style
+from .widget import Widget
 
 
-class Button:
+class Button(Widget):
     """
     ### Description
     Button widget used to execute functions either on press or on release
 
+    The button has a "normal", "hover", "pressed" and "disabled" state. Each state is composed once,
+    with its background, label and border, and kept until the style, the size or the label change,
+    so changing the state only swaps the surface that is drawn. A button with `enabled` set to False
+    shows the disabled state and ignores the mouse.
+
     ### Usage
     `Button(parent, *, x=0, y=0, width=100, height=50, func=None, text="Button", valuetopass=None)`
 
@@ -46,65 +56,75 @@ class Button:
 
     """
 
+    # ------- ATTRIBUTES -------
+    bg_color = Color()
+    border_width = Integer()
+    border_color = Color()
+    # Background colors of the other states. When they are None they are made from bg_color
+    hover_color = Color(optional=True)
+    pressed_color = Color(optional=True)
+    disabled_color = Color(optional=True)
+    disabled_font_color = Color()
+    enabled = Boolean()
+    font_name = String()
+    font_size = Integer(minimum=1)
+    font_color = Color()
+    func = Function(optional=True)
+    width = Integer(minimum=None)
+    height = Integer(minimum=None)
+    # --------------------------
+
+    __slots__ = ("_bg_color", "_border_width", "_border_color", "_hover_color", "_pressed_color", "_disabled_color",
+                 "_disabled_font_color", "_enabled", "_func", "_width", "_height", "valuetopass",
+                 "_rect", "_text", "_font_name", "_font_size", "_font_color", "_label",
+                 "_pressed", "_holding", "_state", "_states", "_states_key")
+
+    style = Style(bg_color=(255, 255, 255), border_width=5, border_color=(0, 0, 0), hover_color=None,
+                  pressed_color=None, disabled_color=None, disabled_font_color=(128, 128, 128), enabled=True,
+                  font_name="Arial", font_size=20, font_color=(0, 0, 0))
+
     def __init__(self, parent, *, x=0, y=0, width=100, height=50, func=None, text="Button", valuetopass=None):
-        self.parent = parent
-        # Take the parent's screen to display the widget
-        self._screen = parent.screen
+        super().__init__(parent)
         # Create a rect based on the dimensions given
         self._rect = pg.Rect((x, y), (width, height))
         # Save the values passed
         self._text = text
 
         # ------- ATTRIBUTES -------
-        self.bg_color = (255, 255, 255)
+        # The colors, the border and the font come from Button.style
         self.valuetopass = valuetopass
-        self.border_width = 5
-        self.border_color = (0, 0, 0)
         self.func = func
         self.width = width
         self.height = height
         # --------------------------
 
-        # Create a font
-        self._font_name = "Arial"
-        self._font_size = 20
-        self._font_color = (0, 0, 0)
-        self._font = pg.font.SysFont(self._font_name, self._font_size)
-
-        self._label = self._font.render(self._text, 1, self._font_color)
-        # Create an image and fill it with the background color
-        self._image = pg.Surface((self._rect.size)).convert_alpha()
-        self._image.fill(self.bg_color)
+        # The label is taken from the shared label cache when the button is composed
+        self._label = None
 
         # Create two values to keep track of the user interactions with the button
         self._pressed = False
         self._holding = False
-
-    def update(self):
-        """
-        #### Description
-        Update and display the widget
-
-        #### Usage
-        `Button.update()`
-        """
-        self._check_attributes()
-        self._rect.width = self.width
-        self._rect.height = self.height
-        self._image = pg.Surface((self._rect.size)).convert_alpha()
-        self._image.fill(self.bg_color)
+        # The state shown, and a composed surface for each state, made the first time it is shown
+        self._state = "normal"
+        self._states = None
+        self._states_key = None
+
+    def _poll_input(self, mousepos, pressed):
+        # A disabled button ignores the mouse
+        if not self.enabled:
+            self._pressed = False
+            self._holding = False
+            return
         # Keep track of the mouse
-        mousepos = pg.mouse.get_pos()
-        p1, p2, p3 = pg.mouse.get_pressed()
+        p1, p2, p3 = pressed
+        over = self._rect.collidepoint(mousepos)
 
         # If the mouse is over the button
-        if self._rect.collidepoint(mousepos):
+        if over:
             # If the has just been clicked
             if p1:
-                # Set self._pressed to True and make the background colo a little darker to give som visual feedback to the user
+                # Set self._pressed to True, the button will show its pressed state to give some feedback to the user
                 self._pressed = True
-                color = (self.bg_color[0] - 40, self.bg_color[1] - 40, self.bg_color[2] - 40)
-                self._image.fill(color)
             # If the user is _holding the button
             elif self._pressed and not self._holding:
                 # Set self._holding to True and if there is no function specified, give some feedback to the user via terminal
@@ -118,67 +138,142 @@ class Button:
                 # Reset the values
                 self._pressed = False
                 self._holding = False
-                # If there is not function to call, give some feedback via terminal
-                if not self.func:
-                    print(self, "has been released")
-
-                # If there is a function
-                else:
-                    # If we have a value to pass, pass it to the function
-                    if self.valuetopass:
-                        self.func(self.valuetopass)
-
-                    # Otherwise just call it
-                    else:
-                        self.func()
-
-                # Set the background color back to the original
-                self._image.fill(self.bg_color)
-        # Show everything we need on screen
-        self._screen.blit(self._image, self._rect)
+                self._call()
+
+        self._set_state("pressed" if over and p1 and self._pressed else "hover" if over else "normal")
+
+    def on_mouse_down(self, pos, button):
+        if button == 1 and self.enabled:
+            # Show the pressed state to give some visual feedback to the user
+            self._pressed = True
+            self._set_state("pressed")
+            if not self.func:
+                print(self, "has been pressed")
+
+    def on_mouse_motion(self, pos, buttons):
+        # The button only looks pressed while the mouse is over it
+        over = self._rect.collidepoint(pos)
+        self._set_state("pressed" if over and self._pressed else "hover" if over else "normal")
+
+    def on_mouse_leave(self):
+        self._set_state("normal")
+
+    def on_mouse_up(self, pos, button):
+        if button == 1 and self._pressed:
+            self._pressed = False
+            over = self._rect.collidepoint(pos)
+            self._set_state("hover" if over else "normal")
+            # Only call the function if the button is released over the widget
+            if over and self.enabled:
+                self._call()
+
+    def _call(self):
+        # If there is not function to call, give some feedback via terminal
+        if not self.func:
+            print(self, "has been released")
+
+        # If there is a function
+        else:
+            # If we have a value to pass, pass it to the function
+            if self.valuetopass:
+                self.func(self.valuetopass)
+
+            # Otherwise just call it
+            else:
+                self.func()
+
+    def get_state(self):
+        """
+        #### Description
+        Get the visual state of the button.
+
+        #### Returns
+        `str` "normal", "hover", "pressed" or "disabled".
+
+        #### Usage
+        `Button.get_state()`
+
+        ---
+
+        """
+        return self._state if self.enabled else "disabled"
+
+    def _set_state(self, state):
+        # Showing another state only swaps the composed surface
+        if state != self._state:
+            self._state = state
+            self.mark_dirty()
+
+    def _state_color(self, state):
+        # Background color of a state, made from bg_color if it was not set
+        if state == "hover":
+            color = self.hover_color
+            shift = -20
+        elif state == "pressed":
+            color = self.pressed_color
+            shift = -40
+        elif state == "disabled":
+            color = self.disabled_color
+            shift = None
+        else:
+            return self.bg_color
+        if color is not None:
+            return color
+        if shift is None:
+            # Halfway to grey
+            return tuple((c + 160) // 2 for c in self.bg_color)
+        return tuple(max(c + shift, 0) for c in self.bg_color)
+
+    def _compose(self):
+        # Render the label with the text, font and color specified
+        self._label = render_label(self.font_name, self.font_size, self._text, self.font_color)
+        if self._rect.size != (self.width, self.height):
+            self._rect.size = (self.width, self.height)
+            self._geometry_changed()
+
+        # The surfaces of the states are made again when anything they show changes
+        key = (self._rect.size, self.bg_color, self.border_width, self.border_color, self.hover_color,
+               self.pressed_color, self.disabled_color, self.disabled_font_color, self._label)
+        if key != self._states_key:
+            self._states = {}
+            self._states_key = key
+
+        state = self.get_state()
+        surface = self._states.get(state)
+        if surface is None:
+            surface = self._states[state] = self._compose_state(state)
+        self._surface = surface
+        self._bounds = self._rect.copy()
+
+    def _compose_state(self, state):
+        # The surfaces are kept for each state, so a new one is always made
+        self._surface = None
+        image = self._begin_compose(self._rect)
+
+        # Fill the background with the color of the state
+        image.fill(self._state_color(state))
+        label = self._label
+        if state == "disabled":
+            label = render_label(self.font_name, self.font_size, self._text, self.disabled_font_color)
         try:
-            self._screen.blit(self._label, (
-                self._rect.centerx - self._label.get_rect().width / 2, self._rect.centery - self._label.get_rect().height / 2))
+            image.blit(label, (self._rect.width / 2 - label.get_rect().width / 2,
+                               self._rect.height / 2 - label.get_rect().height / 2))
         except:
             pass
         # Only draw the border if the width is greater than 0
         if self.border_width > 0:
-            pg.draw.rect(self._screen, self.border_color, self._rect, self.border_width)
-
-    def _check_attributes(self):
-        # Check the background color
-        if type(self.bg_color) != tuple:
-            raise TypeError(".bg_color must be a tuple, not", type(self.bg_color))
-        elif len(self.bg_color) != 3:
-            raise ValueError("Expected 3 values, got,", len(self.bg_color))
-        else:
-            for i, n in enumerate(self.bg_color):
-                if type(n) != int:
-                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
-
-        # Check the border width
-        if type(self.border_width) != int:
-            raise TypeError(".border_width must be an integer, not", type(self.border_width))
-        elif self.border_width < 0:
-            raise ValueError(".border_width must be equal or greater than 0.")
-
-        # Check the border color
-        if type(self.border_color) != tuple:
-            raise TypeError(".border_color must be a tuple, not", type(self.border_color))
-        elif len(self.border_color) != 3:
-            raise ValueError("Expected 3 values, got,", len(self.bg_color))
-        else:
-            for i, n in enumerate(self.border_color):
-                if type(n) != int:
-                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
+            pg.draw.rect(image, self.border_color, image.get_rect(), self.border_width)
+        return image
 
-        if str(type(self.func)) != "<class 'function'>" and str(type(self.func)) != "<class 'builtin_function_or_method'>" and str(type(self.func)) != "<class 'method'>":
-            raise TypeError(".func must be a function or method, not", type(self.func))
+    def _size_hint(self):
+        # The label with half the font size around it, and the border
+        width, height = get_glyph_table(self.font_name, self.font_size).size(self._text)
+        return (width + self.font_size + self.border_width * 2,
+                height + self.font_size // 2 + self.border_width * 2)
 
-        if type(self.width) != int:
-            raise TypeError(".width must be an integer, not", type(self.width))
-        if type(self.height) != int:
-            raise TypeError(".height must be an integer, not", type(self.height))
+    def _layout_resize(self, width, height):
+        self.set_size(width, height)
+        return width, height
 
     def move(self, x, y):
         """
@@ -202,16 +297,46 @@ class Button:
         """
         # Reposition the widget components
         if type(x) == int and type(y) == int:
-            self._x = x
-            self._y = y
-            self._pos = (x, y)
-            self._rect.topleft = self._pos
+            self._rect.topleft = (x, y)
+            self.mark_dirty()
+            self._geometry_changed()
         if type(x) != int:
             raise TypeError("x must be an integer, not", type(x))
 
         if type(y) != int:
             raise TypeError("y must be an integer, not", type(y))
 
+    def set_size(self, width, height):
+        """
+        #### Description
+        Set the size of the widget.
+
+        #### Parameters
+        `width: int`
+        Width in pixels.
+
+        `height: int`
+        Height in pixels.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Button.set_size(120, 40)`
+
+        ---
+
+        """
+        if type(width) != int:
+            raise TypeError("width must be an integer, not", type(width))
+        if type(height) != int:
+            raise TypeError("height must be an integer, not", type(height))
+        self.width = width
+        self.height = height
+        if self._rect.size != (width, height):
+            self._rect.size = (width, height)
+            self._geometry_changed()
+
     def set_font(self, font):
         """
         #### Description
@@ -232,23 +357,15 @@ class Button:
 
         """
         if type(font) == str:
-            # Try to find a font file using the value as a path
+            # The font cache will look for a font file using the value as a path,
+            # and for a font installed in the system if there is no such file
             try:
-                self._font = pg.font.Font(font, self._font_size)
-                self._font_name = font
-
-            # If it does not find a font file, try finding a font installed in the system
-            except FileNotFoundError:
-                try:
-                    self._font_name = font
-                    self._font = pg.font.SysFont(font, self._font_size)
+                get_font(font, self.font_size)
+                self.font_name = font
 
-                # If it also fails, do not change the font and give a warning
-                except:
-                    print("WARNING: Font not found")
-
-            # Render the label with the text, font and color specified
-            self._label = self._font.render(self._text, 1, self._font_color)
+            # If it fails, do not change the font and give a warning
+            except:
+                print("WARNING: Font not found")
         else:
             raise TypeError("font must be a string")
 
@@ -276,8 +393,7 @@ class Button:
             raise ValueError(f"Expected 3 values, got, {len(color)}")
 
         else:
-            self._font_color = color
-            self._label = self._font.render(self._text, 1, self._font_color)
+            self.font_color = color
 
     def set_font_size(self, size):
         """
@@ -301,15 +417,7 @@ class Button:
         if type(size) != int:
             raise TypeError("size must be an integer, not", type(size))
         else:
-
-            self._font_size = size
-
-            try:
-                self._font = pg.font.Font(self._font_name, self._font_size)
-            except:
-                self._font = pg.font.SysFont(self._font_name, self._font_size)
-            # Render the label with the text, font and color specified
-            self._label = self._font.render(self._text, 1, self._font_color)
+            self.font_size = size
 
     def set_label(self, text):
         """
@@ -331,9 +439,9 @@ class Button:
         """
 
         if type(text) == str:
-            # Save the text to a variable
+            # Save the text to a variable, the label is rendered when the button is composed
             self._text = text
-            # Render the label with the text, font and color specified
-            self._label = self._font.render(self._text, 1, self._font_color)
+            self.mark_dirty()
+            self._hint_changed()
         else:
             raise TypeError("text must be a string, not", type(text))
@@ -6,12 +6,24 @@
 # @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
 
 
+from collections import OrderedDict
+
 import pygame as pg
 
+from .attributes import Boolean, Choice, Color, Integer, String
+from .fonts import get_font
+from .labels import LabelLayout, render_label
+from .style import Style
+from .widget import Widget
+
 vec = pg.Vector2
 
+# Composed boxes shared by every check box that looks the same, least recently used first
+_boxes = OrderedDict()
+_box_limit = 256
 
-class CheckBox:
+
+class CheckBox(Widget):
     """
     ### Description
     A checkable box that can be used to enable or disable functionalities.
@@ -36,43 +48,47 @@ class CheckBox:
 
     """
 
+    # ------- ATTRIBUTES -------
+    bg_color = Color()
+    border_width = Integer()
+    border_color = Color()
+    check_color = Color()
+    cross_width = Integer()
+    checked = Boolean()
+    check_style = Choice(["fill", "cross"], message=".check_style must be either \"fill\" or \"cross\"")
+    label_side = Choice(["top", "left", "right", "bottom"], alias="text_side")
+    label_align = Choice(["left", "center", "right"], alias="text_align")
+    label_padding = Integer()
+    font_name = String()
+    font_size = Integer(minimum=1)
+    font_color = Color()
+    # --------------------------
+
+    __slots__ = ("_bg_color", "_border_width", "_border_color", "_check_color", "_cross_width", "_checked",
+                 "_check_style", "_label_side", "_label_align", "_label_padding", "clicked",
+                 "_size", "_x", "_y", "_pos", "_sq_border_width", "_rect", "_check_rect", "_style",
+                 "_text", "_font_size", "_font_color", "_font_name", "_label", "_label_layout", "_box")
+
+    style = Style(bg_color=(255, 255, 255), border_width=3, border_color=(0, 0, 0), check_color=(0, 200, 0),
+                  cross_width=5, check_style="fill", label_side="top", label_align="left", label_padding=3,
+                  font_name="Arial", font_size=20, font_color=(0, 0, 0))
+
     def __init__(self, parent, *, x=0, y=0, size=20):
-        self.parent = parent
-        # Take the parent's screen to display the widget
-        self._screen = parent.screen
+        super().__init__(parent)
         self._size = size
         self._x = x
         self._y = y
         self._pos = (self._x, self._y)
 
         # ------- ATTRIBUTES -------
-        # Set the default background color
-        self.bg_color = (255, 255, 255)
-        # Set the default border width
-        self.border_width = 3
-        # Set the default border color
-        self.border_color = (0, 0, 0)
-        # Set the default check mark color
-        self.check_color = (0, 200, 0)
-        # Set the 'cross' style check mark width
-        self.cross_width = 5
+        # The colors, the border, the check style and the label position come from CheckBox.style
         # self.checked will be True only when the box is checked
         self.checked = False
-        # Set the default box style and check style
-        self.check_style = "fill"
-        # Set the default side for the text
-        self.label_side = "top"
-        # Set the default alignment of the text
-        self.label_align = "left"
-        self.label_padding = 3
         # --------------------------
         self._sq_border_width = self.border_width
 
-        # Create a surface with the specified size. This will be the background
-        self._image = pg.Surface((size, size)).convert_alpha()  # Convert to alpha so it supports transparency
-
-        # Get rect from surface
-        self._rect = self._image.get_rect()
+        # Create a rect with the specified size. This will be the background
+        self._rect = pg.Rect(0, 0, size, size)
 
         # Create a smaller rect to contain the check mark
         self._check_rect = pg.Rect(x + size / 4, y + size / 4, size - size / 2, size - size / 2) if size % 2 == 0 else pg.Rect(
@@ -86,190 +102,141 @@ class CheckBox:
         # self.clicked will be True whenever the primary mouse button is pressed over the widget
         self.clicked = False
 
-        # Set the default text
+        # Set the default text. The font comes from CheckBox.style
         self._text = ""
-        # Set the default font values
-        self._font_size = 20
-        self._font_color = (0, 0, 0)
-        self._font_name = "Arial"
-        self._font = pg.font.SysFont("Arial", self._font_size)
-
-        # Create a label rendering the text with the specified font
-        self._label = self._font.render(self._text, 1, self._font_color)
-
-    def _check_attributes(self):
-        if type(self.bg_color) != tuple:
-            raise TypeError(".bg_color must be a tuple, not", type(self.bg_color))
-        elif len(self.bg_color) != 3:
-            raise ValueError("Expected 3 values, got,", len(self.bg_color))
-        else:
-            for i, n in enumerate(self.bg_color):
-                if type(n) != int:
-                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
-
-        if type(self.border_width) != int:
-            raise TypeError(".border_width must be an integer, not", type(self.border_width))
-        elif self.border_width < 0:
-            raise ValueError(".border_width must be equal or greater than 0.")
-
-        if type(self.border_color) != tuple:
-            raise TypeError(".border_color must be a tuple, not", type(self.border_color))
-        elif len(self.border_color) != 3:
-            raise ValueError("Expected 3 values, got,", len(self.bg_color))
-        else:
-            for i, n in enumerate(self.border_color):
-                if type(n) != int:
-                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
-
-        if type(self.check_color) != tuple:
-            raise TypeError(".check_color must be a tuple, not", type(self.check_color))
-        elif len(self.check_color) != 3:
-            raise ValueError("Expected 3 values, got,", len(self.check_color))
-        else:
-            for i, n in enumerate(self.check_color):
-                if type(n) != int:
-                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
-
-        if type(self.cross_width) != int:
-            raise TypeError(".cross_width must be an integer, not", type(self.cross_width))
-        elif self.cross_width < 0:
-            raise ValueError(".cross_width must be equal or greater than 0.")
-
-        if type(self.checked) != bool:
-            raise TypeError(".checked must be a bool, not", type(self.checked))
-
-        if type(self.check_style) != str:
-            raise TypeError(".check_style must be a string, not", type(self.check_style))
-        elif self.check_style not in ["fill", "cross"]:
-            raise ValueError(".check_style must be either \"fill\" or \"cross\"")
-
-        if type(self.label_side) != str:
-            raise TypeError(".text_side must be a string, not", type(self.label_side))
-        elif self.label_side not in ["top", "left", "right", "bottom"]:
-            raise ValueError(".text_side must be in ['top', 'left', 'right', 'bottom']")
-
-        if type(self.label_align) != str:
-            raise TypeError(".text_align must be a string, not", type(self.label_align))
-        elif self.label_align not in ["left", "center", "right"]:
-            raise ValueError(".text_align must be in ['left', 'center', 'right']")
-
-        if type(self.label_padding) != int:
-            raise TypeError(".label_padding must be an integer, not", type(self.label_padding))
-        elif self.label_padding < 0:
-            raise ValueError(".label_padding must be equal or greater than 0.")
-
-    def update(self):
-        """
-        #### Description
-        Update and draw the widget.
 
-        #### Usage
-        `CheckBox.update()`
-        """
+        # The label is taken from the shared label cache when the check box is composed
+        self._label = None
+        # Position of the label, computed when something it depends on changes
+        self._label_layout = LabelLayout()
+        # Shared composed box used as the surface of the widget, if it has no label
+        self._box = None
 
-        self._check_attributes()
-
-        # Detect mouse position and button presses
+    def _poll_input(self, mousepos, pressed):
         # mousepos is a tuple of this format (x, y)
         # p1, p2, p3 are primary click, wheel click and secondary click
-        mousepos = pg.mouse.get_pos()
-        p1, p2, p3 = pg.mouse.get_pressed()
+        p1, p2, p3 = pressed
 
         # Detect if the widget is being clicked
-        if self._rect.collidepoint(mousepos) and p1:
+        if self._rect.collidepoint(mousepos) and p1 and not self.clicked:
             self.clicked = True
 
-        # Fill the background with the background color
-        self._image.fill(self.bg_color)
-
-        # Draw the correct shape corresponding to the style
-        if self._style == "square":
-            self._screen.blit(self._image, self._rect)
-        elif self._style == "circle":
-            pg.draw.ellipse(self._screen, self.bg_color, self._rect)
-        else:
-            raise ValueError("Style must be either \"square\" or \"circle\".")
         # Swap the value of self.checked whenever the box is released from the mouse
         if self.clicked and not p1:
             self.checked = not self.checked
             self.clicked = False
 
+    def on_mouse_down(self, pos, button):
+        if button == 1:
+            self.clicked = True
+
+    def on_mouse_up(self, pos, button):
+        # Swap the value of self.checked whenever the box is released from the mouse
+        if button == 1 and self.clicked:
+            self.checked = not self.checked
+            self.clicked = False
+
+    def _compose(self):
+
+        if self._style not in ["square", "circle"]:
+            raise ValueError("Style must be either \"square\" or \"circle\".")
+
+        # A cross can not be drawn inside a circle
+        if self.check_style == "cross" and self._style == "circle":
+            self.check_style = "fill"
+
+        # Modify the dimensions of the check rect to make a good-looking round border
+        if self._style == "circle":
+            x = 2 * round((self._x - self.border_width / 2) / 2)
+            y = 2 * round((self._y - self.border_width / 2) / 2)
+            d = self._rect.width + self.border_width
+            d = d + 1 if d % 2 != 0 else d  # Make sure the border' center meets the box center
+            border_rect = pg.Rect(x, y, d, d)
+        else:
+            border_rect = self._rect
+        box_rect = self._rect.union(border_rect)
+        box = self._get_box(box_rect, border_rect)
+
+        # Only show the label if the text string is not empty.
+        # Stripping the string will avoid drawing the label if the string contains only invisible characters
+        show_label = self._text.strip() != ""
+        if not show_label:
+            # Without a label the shared box is drawn as it is
+            self._surface = self._box = box
+            self._bounds = box_rect
+            return
+
+        self._label = render_label(self.font_name, self.font_size, self._text, self.font_color)
+        label_pos = self._label_layout.place(self._rect, self._label, self.label_side, self.label_align,
+                                             self.label_padding, self.font_size)
+        bounds = box_rect.union(self._label.get_rect(topleft=label_pos))
+        # The shared box can't be drawn on
+        if self._surface is self._box:
+            self._surface = None
+        self._box = None
+        self._begin_compose(bounds)
+        self._blit_outside(box, box_rect.topleft)
+        self._blit_outside(self._label, label_pos)
+
+    def _get_box(self, box_rect, border_rect):
+        # Rects relative to the top left corner of the box
+        rects = [rect.move(-box_rect.x, -box_rect.y) for rect in (self._rect, self._check_rect, border_rect)]
+        # Everything the box looks like
+        key = (self._style, self.check_style, self.checked, self.bg_color, self.border_color, self.check_color,
+               self.border_width, self.cross_width, box_rect.size, *(tuple(rect) for rect in rects))
+        box = _boxes.get(key)
+        if box is not None:
+            _boxes.move_to_end(key)
+            return box
+
+        box = _boxes[key] = self._draw_box(box_rect.size, *rects)
+        while len(_boxes) > _box_limit:
+            _boxes.popitem(last=False)
+        return box
+
+    def _draw_box(self, size, rect, check_rect, border_rect):
+        image = pg.Surface(size, pg.SRCALPHA)
+
+        # Draw the correct shape corresponding to the style
+        if self._style == "square":
+            # Fill the background with the background color
+            image.fill(self.bg_color, rect)
+        elif self._style == "circle":
+            pg.draw.ellipse(image, self.bg_color, rect)
+
         # Display the check mark if the box is checked depending on the style
         if self.checked:
-
             # Fill the box if the check style is 'fill'
             if self.check_style == "fill":
                 if self._style == "square":
-                    pg.draw.rect(self._screen, self.check_color, self._check_rect)
+                    pg.draw.rect(image, self.check_color, check_rect)
                 elif self._style == "circle":
-                    pg.draw.ellipse(self._screen, self.check_color, self._check_rect)
+                    pg.draw.ellipse(image, self.check_color, check_rect)
             # Draw a cross if the style is 'square' and the check style is 'cross'
             elif self.check_style == "cross":
-                if self._style == "square":
-                    self._draw_cross()
-                elif self._style == "circle":
-                    self.check_style = "fill"
-            else:
-                raise ValueError("Style must be either \"fill\" or \"cross\".")
-        # Only show the label if the text string is not empty.
-        # Stripping the string will avoid drawing the label if the string contains only invisible characters
-        if self._text.strip() != "":
-            # Display the label on top of the box
-            if self.label_side == "top":
-                # Align the label to the left
-                if self.label_align == "left":
-                    self._screen.blit(self._label, (self._rect.x, self._rect.y - self._font_size - self.label_padding))
-                # Align the label to the center
-                elif self.label_align == "center":
-                    self._screen.blit(self._label, (
-                        self._rect.centerx - self._label.get_rect().width / 2, self._rect.y - self._font_size - self.label_padding))
-                # Align the label to the right
-                elif self.label_align == "right":
-                    self._screen.blit(self._label, (
-                        self._rect.x + self._rect.width - self._label.get_rect().width, self._rect.y - self._font_size - self.label_padding))
-
-            # Display the label on the bottom of the box
-            if self.label_side == "bottom":
-                # Align the label to the left
-                if self.label_align == "left":
-                    self._screen.blit(self._label, (self._rect.x, self._rect.y +
-                                                    self._rect.height + self.label_padding))
-                # Align the label to the center
-                elif self.label_align == "center":
-                    self._screen.blit(self._label, (
-                        self._rect.centerx - self._label.get_rect().width / 2, self._rect.y + self._rect.height + self.label_padding))
-                # Align the label to the right
-                elif self.label_align == "right":
-                    self._screen.blit(self._label, (
-                        self._rect.x + self._rect.width - self._label.get_rect().width, self._rect.y + self._rect.height + self.label_padding))
-
-            # Display the label on the left side of the box
-            if self.label_side == "left":
-                self._screen.blit(self._label, (self._rect.x - self._label.get_rect().width - self.label_padding,
-                                                self._rect.y + self._rect.height - self._label.get_rect().height))
-            # Display the label on the right side of the box
-            if self.label_side == "right":
-                self._screen.blit(self._label, (self._rect.x + self._rect.width + self.label_padding,
-                                                self._rect.y + self._rect.height - self._label.get_rect().height))
+                self._draw_cross(image, check_rect)
 
         # Draw a square border if the style is "square" and a round border if the style is "circle"
         if self._style == "square":
-            pg.draw.rect(self._screen, self.border_color, self._rect, self.border_width)
+            pg.draw.rect(image, self.border_color, rect, self.border_width)
         elif self._style == "circle":
-            # Modify the dimensions of the check rect to make a good-looking round border
-            x = 2 * round((self._x - self.border_width / 2) / 2)
-            y = 2 * round((self._y - self.border_width / 2) / 2)
-            d = self._rect.width + self.border_width
-            d = d + 1 if d % 2 != 0 else d  # Make sure the border' center meets the box center
-            pg.draw.ellipse(self._screen, self.border_color, (x, y, d, d), self.border_width)
-        else:
-            raise ValueError("Style must be either \"square\" or \"circle\".")
+            pg.draw.ellipse(image, self.border_color, border_rect, self.border_width)
+        return image
+
+    def _draw_cross(self, image, check_rect):
+        pg.draw.line(image, self.check_color, check_rect.topleft,
+                     check_rect.bottomright, self.cross_width)
+        pg.draw.line(image, self.check_color, check_rect.bottomleft,
+                     check_rect.topright, self.cross_width)
 
-    def _draw_cross(self):
-        pg.draw.line(self._screen, self.check_color, self._check_rect.topleft,
-                     self._check_rect.bottomright, self.cross_width)
-        pg.draw.line(self._screen, self.check_color, self._check_rect.bottomleft,
-                     self._check_rect.topright, self.cross_width)
+    def _size_hint(self):
+        return self._size, self._size
+
+    def _label_margins(self, width, height):
+        if self._text.strip() == "":
+            return 0, 0, 0, 0
+        return LabelLayout.margins((width, height), self._text, self.font_name, self.font_size,
+                                   self.label_side, self.label_align, self.label_padding)
 
     def move(self, x, y):
         """
@@ -302,6 +269,8 @@ class CheckBox:
         self._rect.topleft = self._pos
         self._check_rect = pg.Rect(x + self._size / 4, y + self._size / 4, self._size - self._size / 2, self._size - self._size / 2) if self._size % 2 == 0 else pg.Rect(
             x + self._size / 4 - 1, y + self._size / 4 - 1, self._size - self._size / 2 + 3, self._size - self._size / 2 + 3)
+        self.mark_dirty()
+        self._geometry_changed()
 
     def set_font(self, font):
         """
@@ -323,25 +292,17 @@ class CheckBox:
 
         """
 
-        # Try to use the string as a path to a font.
-        # If it does not find a font file, it will raise a FileNotFoundError exception
+        # The font cache tries to use the string as a path to a font,
+        # and looks for a font installed in the system if it does not find a font file
         if type(font) == str:
             try:
-                self._font = pg.font.Font(font, self._font_size)
-                # Save the font name or path to a variable
-                self._font_name = font
-
-            # We catch the exception and try to find a font installed in the system.
-            except FileNotFoundError:
-                try:
-                    self._font = pg.font.SysFont(font, self._font_size)
-                    # Save the font name or path to a variable
-                    self._font_name = font
-
-                # If it doesn't find any fonts, we raise a warning saying no font was found
-                except:
-                    print("WARNING: Font not found")
-            self._label = self._font.render(self._text, 1, self._font_color)
+                get_font(font, self.font_size)
+                # Save the font name or path, the label is rendered again when the box is composed
+                self.font_name = font
+
+            # If it doesn't find any fonts, we raise a warning saying no font was found
+            except:
+                print("WARNING: Font not found")
         else:
             raise TypeError(f"font must be a string, not {type(font)}")
 
@@ -364,17 +325,9 @@ class CheckBox:
 
         """
 
-        # If it is not installed, follow a path to the font file
         if type(size) == int:
-            try:
-                self._font = pg.font.Font(self._font_name, size)
-
-            # If it is installed in the system, use the system one
-            except FileNotFoundError:
-                self._font = pg.font.SysFont(self._font_name, size)
-                # Store the font size in a variable
-                self._font_size = size
-            self._label = self._font.render(self._text, 1, self._font_color)
+            # Store the font size, the label is rendered again when the box is composed
+            self.font_size = size
         else:
             raise TypeError(f"size must be an integer, not {type(size)}")
 
@@ -398,9 +351,8 @@ class CheckBox:
         """
         if type(color) == tuple:
             if len(color) == 3:
-                # Change the font color and re-render the label
-                self._font_color = color
-                self._label = self._font.render(self._text, 1, color)
+                # Change the font color, the label is rendered again when the box is composed
+                self.font_color = color
             else:
                 raise ValueError(f"Expected 3 values, got {len(color)}" )
         else:
@@ -428,14 +380,12 @@ class CheckBox:
             if size > 0:
                 # Save the size to a variable and resize and reposition the rects
                 self._size = size
-                self.check_surface = pg.Surface((self._size - self._size / 10 * 2, self._size -
-                                                 self._size / 10 * 2)).convert_alpha()
-                self._check_rect = self.check_surface.get_rect()
+                self._check_rect = pg.Rect(0, 0, self._size - self._size / 10 * 2, self._size - self._size / 10 * 2)
                 self._check_rect.topleft = (self._x + self._size / 10, self._y + self._size / 10)
-                self._image = pg.Surface((size, size))
-                self._rect = self._image.get_rect()
-                self._rect.x = self._x
-                self._rect.y = self._y
+                self._rect = pg.Rect(self._x, self._y, size, size)
+                self.mark_dirty()
+                self._geometry_changed()
+                self._hint_changed()
             else:
                 raise ValueError("Size must be greater than 0.")
 
@@ -476,6 +426,7 @@ class CheckBox:
                 if self._size % 2 != 0:
                     self._check_rect = pg.Rect(self._check_rect.x - 2, self._check_rect.y - 2, self._check_rect.width + 3,
                                                self._check_rect.height + 3)
+            self.mark_dirty()
 
     def set_label(self, text):
         """
@@ -495,9 +446,10 @@ class CheckBox:
         ---
 
         """
-        # Save the text in a variable and re-render the label
+        # Save the text in a variable, the label is rendered when the box is composed
         if type(text) == str:
             self._text = text
-            self._label = self._font.render(self._text, 1, self._font_color)
+            self.mark_dirty()
+            self._hint_changed()
         else:
             raise TypeError("text must be a string, not", type(text))
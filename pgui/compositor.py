@@ -0,0 +1,254 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import pygame as pg
+
+from .timers import scheduler
+
+
+class Compositor:
+    """
+    ### Description
+    Draws a set of widgets on a screen, only touching the areas that changed since the last frame.
+    The background is restored under widgets that moved, shrank or changed, and the widgets
+    covering those areas are drawn again in the order they were added.
+
+    `update()` and `draw()` return the list of changed rects that can be passed to `pygame.display.update()`.
+
+    ### Usage
+    `Compositor(screen, background=(0, 0, 0))`
+
+    #### Parameters
+    `screen: pygame.Surface`
+    Surface where the widgets are displayed.
+
+    `background: tuple or pygame.Surface`
+    An RGB color or a surface the size of the screen to draw behind the widgets.
+
+    ---
+
+    """
+
+    def __init__(self, screen, background=(0, 0, 0)):
+        self._screen = screen
+        self._background = background
+        self._widgets = []
+        # Screen area where each widget was drawn during the last frame
+        self._drawn = {}
+        self._pending = [screen.get_rect()]
+
+    def add(self, *widgets):
+        """
+        #### Description
+        Add widgets to the compositor. Widgets added later are drawn on top.
+
+        #### Parameters
+        `widgets: Widget`
+        The widgets to add.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Compositor.add(button, slider)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget not in self._drawn:
+                self._widgets.append(widget)
+                self._drawn[widget] = None
+
+    def remove(self, *widgets):
+        """
+        #### Description
+        Remove widgets from the compositor. The background will be restored where they were.
+
+        #### Parameters
+        `widgets: Widget`
+        The widgets to remove.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Compositor.remove(button)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget in self._drawn:
+                self._widgets.remove(widget)
+                bounds = self._drawn.pop(widget)
+                if bounds:
+                    self._pending.append(bounds)
+
+    def set_background(self, background):
+        """
+        #### Description
+        Change the background and draw the whole screen again on the next frame.
+
+        #### Parameters
+        `background: tuple or pygame.Surface`
+        An RGB color or a surface the size of the screen.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Compositor.set_background((200, 200, 200))`
+
+        ---
+
+        """
+        self._background = background
+        self.invalidate()
+
+    def invalidate(self, rect=None):
+        """
+        #### Description
+        Draw an area of the screen again on the next frame.
+
+        #### Parameters
+        `rect: pygame.Rect`
+        Area to draw again. If it is not specified the whole screen is drawn again.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Compositor.invalidate()`
+
+        ---
+
+        """
+        self._pending.append(pg.Rect(rect) if rect else self._screen.get_rect())
+
+    def update(self):
+        """
+        #### Description
+        Update the widgets and display the ones that changed.
+
+        #### Returns
+        `list` of `pygame.Rect` with the areas of the screen that changed.
+
+        #### Usage
+        `pygame.display.update(Compositor.update())`
+
+        ---
+
+        """
+        self.poll_input()
+        scheduler.run()
+        return self.draw()
+
+    def poll_input(self):
+        """
+        #### Description
+        Let the widgets that are not in a `UIManager` check the mouse and keyboard.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Compositor.poll_input()`
+
+        ---
+
+        """
+        # The mouse is only checked once for every widget
+        mousepos = pg.mouse.get_pos()
+        pressed = pg.mouse.get_pressed()
+        for widget in self._widgets:
+            # Widgets in a manager get their input from its events
+            if widget._manager is None and not widget._disabled:
+                widget._poll_input(mousepos, pressed)
+
+    def is_dirty(self):
+        """
+        #### Description
+        Check if something has to be drawn again.
+
+        #### Returns
+        `bool` True if a widget changed or an area of the screen was invalidated.
+
+        #### Usage
+        `Compositor.is_dirty()`
+
+        ---
+
+        """
+        return bool(self._pending) or any(widget._dirty for widget in self._widgets)
+
+    def draw(self):
+        """
+        #### Description
+        Display the widgets that changed without checking the user input.
+
+        #### Returns
+        `list` of `pygame.Rect` with the areas of the screen that changed.
+
+        #### Usage
+        `pygame.display.update(Compositor.draw())`
+
+        ---
+
+        """
+        dirty = self._pending
+        self._pending = []
+
+        for widget in self._widgets:
+            changed = widget.refresh()
+            bounds = widget._bounds
+            previous = self._drawn[widget]
+            if changed or previous != bounds:
+                # Restore what was under the widget and draw it where it is now
+                if previous:
+                    dirty.append(previous)
+                dirty.append(bounds.copy())
+                self._drawn[widget] = bounds.copy()
+
+        rects = self._merge(dirty)
+        for rect in rects:
+            self._screen.set_clip(rect)
+            self._restore(rect)
+            # Draw every widget covering the area, not only the ones that changed
+            for widget in self._widgets:
+                if widget._bounds.colliderect(rect):
+                    self._blit_widget(widget)
+        self._screen.set_clip(None)
+        return rects
+
+    def _restore(self, rect):
+        # Draw the background of an area
+        if isinstance(self._background, pg.Surface):
+            self._screen.blit(self._background, rect, rect)
+        else:
+            self._screen.fill(self._background, rect)
+
+    def _blit_widget(self, widget):
+        # A method of its own so the profiler can time the blit of each widget
+        self._screen.blit(widget._surface, widget._bounds)
+
+    def _merge(self, rects):
+        # Join the rects that overlap until none of them do
+        screen = self._screen.get_rect()
+        merged = []
+        for rect in rects:
+            rect = rect.clip(screen)
+            if not rect.width or not rect.height:
+                continue
+            i = rect.collidelist(merged)
+            while i != -1:
+                rect.union_ip(merged.pop(i))
+                i = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
@@ -0,0 +1,67 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from .textinput import text_input
+from .timers import scheduler
+
+
+class _Editable:
+    # Keyboard focus and cursor blinking of the widgets the user types in, like Entry and TextArea.
+    # It goes before the widget class in the bases, and the widget has a typing attribute
+    # and _blink and _cursor_visible in its slots
+    __slots__ = ()
+
+    # Time in milliseconds the cursor is shown and hidden while typing
+    blink_interval = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        # Timer blinking the cursor while the widget has the focus
+        self._blink = None
+        self._cursor_visible = True
+
+    def _sync_focus(self):
+        # Keep the focus of the shared dispatcher in sync with self.typing
+        if self.typing:
+            if text_input.get_focus() is not self:
+                text_input.set_focus(self)
+            # Send the keys queued by the keyboard backend, if it is used
+            text_input.pump()
+        elif text_input.get_focus() is self:
+            text_input.set_focus(None)
+
+    def on_focus(self):
+        self.typing = True
+
+    def on_blur(self):
+        self.typing = False
+        # Stop blinking now, the widget may not be drawn again
+        self._stop_blink()
+
+    def refresh(self):
+        # Blink the cursor only while typing. The widget is not checked again until the timer fires
+        if self.typing and self._blink is None:
+            self._cursor_visible = True
+            self._blink = scheduler.schedule(self._toggle_cursor, self.blink_interval, repeat=True, weak=True)
+        elif not self.typing:
+            self._stop_blink()
+        return super().refresh()
+
+    def _stop_blink(self):
+        if self._blink is not None:
+            self._blink.cancel()
+            self._blink = None
+
+    def _toggle_cursor(self):
+        self._cursor_visible = not self._cursor_visible
+        self.mark_dirty()
+
+    def _show_cursor(self):
+        # Keep the cursor visible while the user types, refresh() starts blinking it again
+        self._stop_blink()
@@ -8,10 +8,19 @@
 
 
 import pygame as pg
-import keyboard
 
+from .attributes import Attribute, Choice, Color, Integer, String
+from .editable import _Editable
+from .fonts import get_font
+from .glyphs import TextWidths, get_glyph_table
+from .labels import LabelLayout, render_label
+from .style import Style
+from .textbuffer import TextBuffer
+from .textinput import text_input
+from .widget import Widget
 
-class Entry:
+
+class Entry(_Editable, Widget):
     """
     ### Description
     Entry widget for recieving user text input.
@@ -51,26 +60,47 @@ class Entry:
 
     """
 
+    # ------- ATTRIBUTES -------
+    border_width = Integer()
+    border_color = Color()
+    bg_color = Color()
+    typing = Attribute()
+    offset = Attribute()
+    label_side = Choice(["top", "left", "right", "bottom"], alias="text_side")
+    label_align = Choice(["left", "center", "right"], alias="text_align")
+    label_padding = Integer()
+    font_name = String()
+    font_color = Color()
+    # --------------------------
+
+    __slots__ = ("_border_width", "_border_color", "_bg_color", "_typing", "_offset", "_label_side", "_label_align",
+                 "_label_padding", "width", "func", "max_length", "allowed_characters",
+                 "_rect", "_text", "_caret", "_x", "_y", "_pos", "_cursor_rect", "_blink", "_cursor_visible",
+                 "_font_size", "_font_name", "_font_color", "_font", "_glyphs", "_widths", "_window",
+                 "_label", "_label_rect", "_ltext", "_tlabel", "_label_layout")
+
+    style = Style(border_width=0, border_color=(0, 0, 0), bg_color=(255, 255, 255),
+                  label_side="top", label_align="left", label_padding=3, font_name="Arial", font_color=(0, 0, 0))
+
+    _characters = "ABCDEFGHIJKLMNÑOPQRSTUVWXYZabcdefghijklmnñopqrstuvwxyz1234567890º'¡`+´ç,.-;:_¨Ç*^¿?=)(/&%$·\"!ª\\|@#~€¬[]\{\}"
+
     def __init__(self, parent, *, x=0, y=0, width=100, size=20, border=0, func=None, max_length=0):
 
-        self.parent = parent
+        super().__init__(parent)
         self._rect = pg.Rect((x, y), (width, size + size / 4))
-        self._image = pg.Surface(self._rect.size).convert_alpha()
-        self._image.fill((255, 255, 255))
 
         # ------- ATTRIBUTES -------
         self.width = width
-        self.border_width = border
-        self.border_color = (0, 0, 0)
-        self.bg_color = (255, 255, 255)
+        # The border comes from the style, or the theme, unless another one is given
+        if border != self.border_width:
+            self.border_width = border
         self.func = func
         self.max_length = max_length
         self.typing = False
         self.offset = 0
-        self.text = ''
-        self.label_side = "top"
-        self.label_align = "left"
-        self.label_padding = 3
+        # The text is kept in a gap buffer, self.text is a string view of it
+        self._text = TextBuffer()
+        self._caret = 0
         self.func = func if func else self.clear
         self.allowed_characters = ""
         # --------------------------
@@ -79,192 +109,308 @@ class Entry:
         self._y = y
         self._pos = (x, y)
 
-        self._cursor = pg.Surface((size / 10, size)).convert_alpha()
-        self._cursor.fill((0, 0, 0))
-        self._cursor_rect = self._cursor.get_rect()
-
-        self._c = 0
-        self._cc = 1
+        # The cursor is a filled rect, so it does not need a surface
+        self._cursor_rect = pg.Rect(0, 0, size / 10, size)
 
+        # The font size is the size of the entry, the font name and color come from Entry.style
         self._font_size = size
-        self._screen = parent.screen
+        self._font = get_font(self.font_name, self._font_size)
 
-        self._font_name = "Arial"
-        self._font_color = (0, 0, 0)
-        self._font_size = size
-        self._font = pg.font.SysFont(self._font_name, self._font_size)
-
-        self._label = self._font.render(self.text, 1, self._font_color)
+        # Width of each character of the text, and the part of the text that is rendered
+        self._glyphs = get_glyph_table(self.font_name, self._font_size)
+        self._widths = TextWidths()
+        self._window = None
+        self._label_rect = pg.Rect(0, 0, 0, self._font.get_height())
         self._ltext = ""
-        self._tlabel = self._font.render(self._ltext, 1, self._font_color)
+        # The label is taken from the shared label cache when the entry is composed
+        self._tlabel = None
+        # Position of the label, computed when something it depends on changes
+        self._label_layout = LabelLayout()
 
-        keyboard.on_press(self._add_char)
+        self.allowed_characters = self._characters
 
-        self._keywords = {
-            "backspace": self._remove_char,
-            "esc": self._stop_typing,
-            "return": self.func,
-            "enter": self.func
-        }
+    def _poll_input(self, mousepos, pressed):
+        p1, p2, p3 = pressed
 
-        self._characters = "ABCDEFGHIJKLMNÑOPQRSTUVWXYZabcdefghijklmnñopqrstuvwxyz1234567890º'¡`+´ç,.-;:_¨Ç*^¿?=)(/&%$·\"!ª\\|@#~€¬[]\{\}"
-        self.allowed_characters = self._characters
+        # Clicking the entry gives it the focus, clicking anywhere else removes it
+        if p1:
+            if self._rect.collidepoint(mousepos):
+                self.typing = True
+                self.set_cursor(self._caret_at(mousepos[0]))
+            else:
+                self.typing = False
+        self._sync_focus()
+
+    def on_mouse_down(self, pos, button):
+        if button == 1:
+            self.set_cursor(self._caret_at(pos[0]))
+
+    def on_key_down(self, event):
+        if event.key == pg.K_BACKSPACE:
+            if self._caret > 0:
+                self.delete(self._caret - 1, self._caret)
+        elif event.key == pg.K_DELETE:
+            self.delete(self._caret, self._caret + 1)
+        elif event.key == pg.K_LEFT:
+            self.set_cursor(max(self._caret - 1, 0))
+        elif event.key == pg.K_RIGHT:
+            self.set_cursor(min(self._caret + 1, len(self._text)))
+        elif event.key == pg.K_HOME:
+            self.set_cursor(0)
+        elif event.key == pg.K_END:
+            self.set_cursor(len(self._text))
+        elif event.key == pg.K_ESCAPE:
+            text_input.set_focus(None)
+        elif event.key in (pg.K_RETURN, pg.K_KP_ENTER):
+            self.func()
+
+    def on_text_input(self, text):
+        text = "".join(char for char in text if char in self.allowed_characters or char == " ")
+        if self.max_length:
+            text = text[:max(self.max_length - len(self._text), 0)]
+        # Pasted text is inserted at once
+        self.insert(text)
+
+    @property
+    def text(self):
+        return str(self._text)
+
+    @text.setter
+    def text(self, text):
+        if type(text) != str:
+            raise TypeError("text must be a string, not", type(text))
+        if text != str(self._text):
+            self._text.set(text)
+            self._widths.set(self._glyphs.measure(text))
+            self._caret = len(text)
+            self._text_changed()
+
+    def _text_changed(self):
+        # Render the text again on the next frame
+        self._window = None
+        self.mark_dirty()
+
+    def _sync_font(self):
+        # Measure the text again if the font changed, like when the theme changes
+        font = get_font(self.font_name, self._font_size)
+        if font is not self._font:
+            self._font = font
+            self._measure_text()
+
+    def _measure_text(self):
+        # Measure every character again, after the font changed
+        self._glyphs = get_glyph_table(self.font_name, self._font_size)
+        self._widths.set(self._glyphs.measure(self.text))
+        self._text_changed()
+
+    def _fix_kerning(self, index):
+        # The width of a character depends on the one before it
+        if index < len(self._text):
+            self._widths.replace(index, self._glyphs.width(self._text[index], self._text[index - 1] if index else ""))
+
+    def _caret_at(self, x):
+        # Position in characters closest to a position of the screen
+        return self._widths.index_at(x - self._rect.x - self._rect.height/20 - self.border_width*2 + self.offset)
+
+    def _get_window(self):
+        # Render only the characters that can be seen, plus a margin on each side,
+        # so the cost does not depend on the length of the text
+        widths = self._widths
+        left = max(self.offset, 0)
+        right = min(self.offset + self._rect.width, widths.total())
+        if self._window is not None:
+            start, end, surface, color = self._window
+            if color == self.font_color and widths.position(start) <= left and widths.position(end) >= right:
+                return self._window
+        margin = self._rect.width // 2
+        start = widths.find(left - margin)
+        end = min(widths.find(right + margin) + 1, len(widths))
+        # The slices change while scrolling, so they don't go to the shared label cache
+        surface = self._font.render(self._text[start:end], True, self.font_color)
+        self._window = (start, end, surface, self.font_color)
+        return self._window
+
+    def _compose(self):
+        self._sync_font()
+        start, end, self._label, color = self._get_window()
+
+        # The label rect covers the whole text, but only the rendered part is drawn
+        self._label_rect = pg.Rect(0, 0, self._widths.total(), self._label.get_height())
+        self._label_rect.x = self._rect.height/20 + self.border_width*2 - self.offset
+        self._label_rect.centery = self._rect.height / 2 + self._rect.height/20
+        self._cursor_rect.x = self._widths.position(self._caret) + self._rect.height/20 + self.border_width*2 - self.offset
+        self._cursor_rect.centery = self._rect.height / 2
 
-    def _add_char(self, char):
-        if self.typing and pg.mouse.get_focused():
-            if char.name in self.allowed_characters:
-                if self.max_length:
-                    if len(self.text) < self.max_length:
-                        self.text += char.name if char.name != "space" else " "
-                else:
-                    self.text += char.name if char.name != "space" else " "
-            elif char.name in self._keywords:
-                self._keywords[char.name]()
-
-    def _stop_typing(self):
-        self.typing = False
+        # Only show the label if the text string is not empty
+        show_label = self._ltext.strip() != ""
+        bounds = self._rect.copy()
+        if show_label:
+            self._tlabel = render_label(self.font_name, self._font_size, self._ltext, self.font_color)
+            label_pos = self._label_layout.place(self._rect, self._tlabel, self.label_side, self.label_align,
+                                                 self.label_padding, self._font_size)
+            bounds.union_ip(self._tlabel.get_rect(topleft=label_pos))
+        image = self._begin_compose(bounds)
+        rect = self._local(self._rect)
+
+        # Draw the text inside the box only
+        image.set_clip(rect)
+        image.fill(self.bg_color, rect)
+        if self.typing and self._cursor_visible:
+            image.fill(self.font_color, self._cursor_rect.move(rect.topleft))
+        image.blit(self._label, self._label_rect.move(rect.left + self._widths.position(start), rect.top))
+        image.set_clip(None)
 
-    def _remove_char(self):
-        if pg.mouse.get_focused():
-            self.text = self.text[:-1]
+        if self.border_width > 0:
+            pg.draw.rect(image, self.border_color, rect, self.border_width)
 
-    def _check_attributes(self):
-        if type(self.bg_color) != tuple:
-            raise TypeError(".bg_color must be a tuple, not", type(self.bg_color))
-        elif len(self.bg_color) != 3:
-            raise ValueError("Expected 3 values, got,", len(self.bg_color))
-        else:
-            for i, n in enumerate(self.bg_color):
-                if type(n) != int:
-                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
-
-        if type(self.border_width) != int:
-            raise TypeError(".border_width must be an integer, not", type(self.border_width))
-        elif self.border_width < 0:
-            raise ValueError(".border_width must be equal or greater than 0.")
-
-        if type(self.border_color) != tuple:
-            raise TypeError(".border_color must be a tuple, not", type(self.border_color))
-        elif len(self.border_color) != 3:
-            raise ValueError("Expected 3 values, got,", len(self.bg_color))
-        else:
-            for i, n in enumerate(self.border_color):
-                if type(n) != int:
-                    raise ValueError(f"Got type {type(n)} at index {i} instead of int.")
+        if show_label:
+            self._blit_outside(self._tlabel, label_pos)
 
-        if type(self.label_side) != str:
-            raise TypeError(".text_side must be a string, not", type(self.label_side))
-        elif self.label_side not in ["top", "left", "right", "bottom"]:
-            raise ValueError(".text_side must be in ['top', 'left', 'right', 'bottom']")
+    def _size_hint(self):
+        # The width is the one the entry had when it was added to the layout
+        return None, self._rect.height
 
-        if type(self.label_align) != str:
-            raise TypeError(".text_align must be a string, not", type(self.label_align))
-        elif self.label_align not in ["left", "center", "right"]:
-            raise ValueError(".text_align must be in ['left', 'center', 'right']")
+    def _label_margins(self, width, height):
+        if self._ltext.strip() == "":
+            return 0, 0, 0, 0
+        return LabelLayout.margins((width, height), self._ltext, self.font_name, self._font_size,
+                                   self.label_side, self.label_align, self.label_padding)
 
-        if type(self.label_padding) != int:
-            raise TypeError(".label_padding must be an integer, not", type(self.label_padding))
-        elif self.label_padding < 0:
-            raise ValueError(".label_padding must be equal or greater than 0.")
+    def _layout_resize(self, width, height):
+        if width > 0:
+            self.set_width(width)
+        return self._rect.size
 
-    def update(self):
-        """Update and display the widget"""
+    def clear(self):
+        """
+        #### Description
+        Clear the text in the entry
 
-        self._check_attributes()
+        #### Parameters
+        None
 
-        self._keywords["enter"] = self.func
+        #### Returns
+        None
 
+        #### Usage
+        `Entry.clear()`
 
+        ---
 
-        mousepos = pg.mouse.get_pos()
-        p1, p2, p3 = pg.mouse.get_pressed()
+        """
+        self.text = ""
 
-        if p1:
-            if self._rect.collidepoint(mousepos):
-                self.typing = True
-            else:
-                self.typing = False
+    def insert(self, text, index=None):
+        """
+        #### Description
+        Insert text in the entry. The cursor is moved to the end of the inserted text.
+        Unlike typing, it does not check the allowed characters or the max length.
 
-        self._label = self._font.render(self.text, 1, self._font_color)
+        #### Parameters
+        `text: str`
+        The text to insert.
 
-        if self._c < 100 and self._cc == 1:
-            self._c += self._cc
-            self._cursor.fill(self._font_color)
-        elif self._c > 0 and self._cc == -1:
-            self._c += self._cc
-            self._cursor.fill((0, 0, 0, 0))
-        else:
-            self._cc *= -1
+        `index: int`
+        Position in characters where the text is inserted. If it is not specified the text is inserted at the cursor.
 
-        self._label_rect = self._label.get_rect()
-        self._label_rect.x = self._rect.height/20 + self.border_width*2 - self.offset
-        self._label_rect.centery = self._rect.height / 2 + self._rect.height/20
-        self._cursor_rect.x = self._label_rect.width + self._rect.height/20 + self.border_width*2 - self.offset
-        self._cursor_rect.centery = self._rect.height / 2
+        #### Returns
+        None
 
-        self._image.fill(self.bg_color)
-        if self.typing:
-            self._image.blit(self._cursor, self._cursor_rect)
-        self._image.blit(self._label, self._label_rect)
-        self._screen.blit(self._image, self._rect)
+        #### Usage
+        `Entry.insert("Hello")`
 
-        if self.border_width > 0:
-            pg.draw.rect(self._screen, self.border_color, self._rect, self.border_width)
-
-        # change label pos
-        if self._ltext.strip() != "":
-            if self.label_side == "top":
-                if self.label_align == "left":
-                    self._screen.blit(self._tlabel, (self._rect.x, self._rect.y - self._font_size - self.label_padding))
-                elif self.label_align == "center":
-                    self._screen.blit(self._tlabel, (
-                        self._rect.centerx - self._label_rect.width / 2, self._rect.y - self._font_size - self.label_padding))
-                elif self.label_align == "right":
-                    self._screen.blit(self._tlabel, (
-                        self._rect.x + self._rect.width - self._label_rect.width, self._rect.y - self._font_size - self.label_padding))
-            if self.label_side == "bottom":
-                if self.label_align == "left":
-                    self._screen.blit(self._tlabel, (self._rect.x, self._rect.y +
-                                                     self._rect.height + self.label_padding))
-                elif self.label_align == "center":
-                    self._screen.blit(self._tlabel, (
-                        self._rect.centerx - self._label_rect.width / 2, self._rect.y + self._rect.height + self.label_padding))
-                elif self.label_align == "right":
-                    self._screen.blit(self._tlabel, (
-                        self._rect.x + self._rect.width - self._label_rect.width, self._rect.y + self._rect.height + self.label_padding))
-            if self.label_side == "left":
-                self._screen.blit(self._tlabel, (self._rect.x - self._label_rect.width - self.label_padding,
-                                                 self._rect.y + self._rect.height - self._label_rect.height))
-            if self.label_side == "right":
-                self._screen.blit(self._tlabel, (self._rect.x + self._rect.width + self.label_padding,
-                                                 self._rect.y + self._rect.height - self._label_rect.height))
+        ---
 
-    def clear(self):
+        """
+        if index is None:
+            index = self._caret
+        self._text.insert(index, text)
+        if text:
+            self._widths.insert(index, self._glyphs.measure(text, self._text[index - 1] if index else ""))
+            self._fix_kerning(index + len(text))
+            self._caret = index + len(text)
+            self._show_cursor()
+            self._text_changed()
+
+    def delete(self, start, end=None):
         """
         #### Description
-        Clear the text in the entry
+        Remove text from the entry.
 
         #### Parameters
+        `start: int`
+        Position in characters of the first removed character.
+
+        `end: int`
+        Position after the last removed character. If it is not specified only one character is removed.
+
+        #### Returns
         None
 
+        #### Usage
+        `Entry.delete(0, 5)`
+
+        ---
+
+        """
+        if end is None:
+            end = start + 1
+        end = min(end, len(self._text))
+        if end <= start:
+            return
+        self._text.delete(start, end)
+        self._widths.delete(start, end)
+        self._fix_kerning(start)
+        # Keep the cursor on the same character
+        if self._caret > end:
+            self._caret -= end - start
+        elif self._caret > start:
+            self._caret = start
+        self._show_cursor()
+        self._text_changed()
+
+    def get_cursor(self):
+        """Return the position in characters of the cursor"""
+        return self._caret
+
+    def set_cursor(self, index):
+        """
+        #### Description
+        Move the cursor.
+
+        #### Parameters
+        `index: int`
+        Position in characters, between 0 and the length of the text.
+
         #### Returns
         None
 
         #### Usage
-        `Entry.clear()`
+        `Entry.set_cursor(0)`
 
         ---
 
         """
-        self.text = ""
-        self._label = self._font.render(self.text, 1, self._font_color)
+        if type(index) != int:
+            raise TypeError(f"index must be an integer, not {type(index)}")
+        if not 0 <= index <= len(self._text):
+            raise ValueError(f"index must be between 0 and {len(self._text)}, not {index}")
+        if index != self._caret:
+            self._caret = index
+            self._show_cursor()
+            self.mark_dirty()
 
     def get_font_size(self):
         return self._font_size
 
     def get_text_pixel_length(self):
         """Return the length in pixels of the text"""
-        return self._label_rect.width
+        return self._widths.total()
+
+    def get_max_offset(self):
+        """Return the largest offset that still shows the end of the text"""
+        padding = self._rect.height/20 + self.border_width*2
+        return max(round(self._widths.total() + self._cursor_rect.width + padding*2 - self._rect.width), 0)
 
     def set_label(self, text):
         """
@@ -285,8 +431,10 @@ class Entry:
 
         """
         if type(text) == str:
+            # The label is rendered when the entry is composed
             self._ltext = text
-            self._tlabel = self._font.render(self._ltext, 1, self._font_color)
+            self.mark_dirty()
+            self._hint_changed()
         else:
             raise TypeError("text must be a string, not", type(text))
 
@@ -308,12 +456,9 @@ class Entry:
         ---
 
         """
-        try:
-            self._font = pg.font.Font(font, self._font_size)
-        except:
-            self._font = pg.font.SysFont(font, self._font_size)
-        self._label = self._font.render(self.text, 1, self._font_color)
-        self._tlabel = self._font.render(self._ltext, 1, self._font_color)
+        get_font(font, self._font_size)
+        self.font_name = font
+        self._sync_font()
 
     def set_font_color(self, color):
         """
@@ -335,10 +480,8 @@ class Entry:
         """
         if type(color) == tuple:
             if len(color) == 3:
-                # Change the font color and re-render the label
-                self._font_color = color
-                self._label = self._font.render(self.text, 1, color)
-                self._tlabel = self._font.render(self._ltext, 1, self._font_color)
+                # Change the font color, the text and the label are rendered again when the entry is composed
+                self.font_color = color
             else:
                 raise ValueError("Expected 3 values, got", len(color))
         else:
@@ -363,25 +506,46 @@ class Entry:
 
         """
         if type(size) == int:
-            try:
-                self._font = pg.font.Font(self._font_name, size)
-
-            # If it is installed in the system, use the system one
-            except FileNotFoundError:
-                self._font = pg.font.SysFont(self._font_name, size)
-                # Store the font size in a variable
-                self._font_size = size
-            self._label = self._font.render(self.text, 1, self._font_color)
-            self._tlabel = self._font.render(self._ltext, 1, self._font_color)
+            self._font = get_font(self.font_name, size)
+            # Store the font size in a variable
+            self._font_size = size
         else:
             raise TypeError(f"size must be an integer, not {type(size)}")
 
         self._rect = pg.Rect(self._pos, (self.width, size + size / 2))
-        self._image = pg.Surface(self._rect.size).convert_alpha()
 
-        self._cursor = pg.Surface((size / 10, size)).convert_alpha()
-        self._cursor_rect = self._cursor.get_rect()
-        self._label = self._font.render(self.text, 1, self._font_color)
+        self._cursor_rect = pg.Rect(0, 0, size / 10, size)
+        self._measure_text()
+        self._geometry_changed()
+        self._hint_changed()
+
+    def set_width(self, width):
+        """
+        #### Description
+        Set the width of the entry.
+
+        #### Parameters
+        `width: int`
+        Width in pixels.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Entry.set_width(300)`
+
+        ---
+
+        """
+        if type(width) != int:
+            raise TypeError("width must be an integer, not", type(width))
+        elif width < 1:
+            raise ValueError("width must be greater than 0.")
+        self.width = width
+        if self._rect.width != width:
+            self._rect.width = width
+            self.mark_dirty()
+            self._geometry_changed()
 
     def reset_allowed_characters(self):
         self.allowed_characters = self._characters
@@ -416,3 +580,5 @@ class Entry:
         self._y = y
         self._pos = (x, y)
         self._rect.topleft = self._pos
+        self.mark_dirty()
+        self._geometry_changed()
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This example shows how we can use a compositor to only update the parts of the    #
+# screen that changed, instead of drawing and flipping the whole screen every frame #
+#####################################################################################
+
+import pgui
+import pygame
+import sys
+
+pygame.init()
+
+
+class Main:
+    def __init__(self):
+        # Create a screen so we can display our widgets
+        self.screen = pygame.display.set_mode((600, 600))
+
+        # Create some widgets
+        self.entry = pgui.Entry(self, x=50, y=50, width=200, border=1)
+        self.slider = pgui.Slider(self, x=50, y=120)
+        self.checkbox = pgui.CheckBox(self, x=50, y=180)
+        self.button = pgui.Button(self, x=480, y=530, func=sys.exit, text="Exit")
+
+        # The compositor will draw the background and the widgets for us
+        self.compositor = pgui.Compositor(self.screen, background=(200, 200, 200))
+        self.compositor.add(self.entry, self.slider, self.checkbox, self.button)
+
+    def update(self):
+        # Update the widgets and get the areas of the screen that changed
+        rects = self.compositor.update()
+
+        # Only update those areas of the screen
+        pygame.display.update(rects)
+
+    # We can use a separate method for event handling
+    def events(self):
+        for event in pygame.event.get():
+            # Send the keyboard events to the Entry being typed in
+            pgui.text_input.handle_event(event)
+            if event.type == pygame.QUIT:
+                raise SystemExit  # This is just the same as sys.exit()
+
+
+main = Main()
+while True:
+    main.update()
+    main.events()
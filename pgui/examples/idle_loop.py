@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This example shows how we can use a main loop that only draws when something      #
+# changed and sleeps while nobody is using the interface                            #
+#####################################################################################
+
+import pgui
+import pygame
+import sys
+
+pygame.init()
+
+
+class Main:
+    def __init__(self):
+        # Create a screen so we can display our widgets
+        self.screen = pygame.display.set_mode((600, 600))
+
+        # Create some widgets
+        self.entry = pgui.Entry(self, x=50, y=50, width=200, border=1)
+        self.slider = pgui.Slider(self, x=50, y=120)
+        self.checkbox = pgui.CheckBox(self, x=50, y=180)
+        self.button = pgui.Button(self, x=480, y=530, func=sys.exit, text="Exit")
+
+        # The manager sends the events to the widgets and the compositor draws them
+        self.manager = pgui.UIManager()
+        self.manager.add(self.entry, self.slider, self.checkbox, self.button)
+        self.compositor = pgui.Compositor(self.screen, background=(200, 200, 200))
+        self.compositor.add(self.entry, self.slider, self.checkbox, self.button)
+
+        # The loop waits for events and timers instead of drawing frames all the time
+        self.loop = pgui.MainLoop(self.compositor, self.manager, max_fps=60)
+
+
+main = Main()
+main.loop.run()
+print(main.loop.get_stats())
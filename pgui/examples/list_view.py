@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This example shows a list with a million rows. Only the rows that can be seen     #
+# are built, and their text is asked to a function when they scroll into the list   #
+#####################################################################################
+
+import pgui
+import pygame
+import sys
+
+pygame.init()
+
+
+class Main:
+    def __init__(self):
+        # Create a screen so we can display our widgets
+        self.screen = pygame.display.set_mode((600, 600))
+
+        # The list asks for the text of a row when it is shown
+        self.list = pgui.ListView(self, x=50, y=50, width=300, height=400, row_count=1_000_000,
+                                  provider=lambda index: f"Row number {index:,}", func=self.select)
+        self.button = pgui.Button(self, x=480, y=530, func=sys.exit, text="Exit")
+
+        # The manager sends the events, the mouse wheel too, to the widgets
+        self.manager = pgui.UIManager()
+        self.manager.add(self.list, self.button)
+        self.compositor = pgui.Compositor(self.screen, background=(200, 200, 200))
+        self.compositor.add(self.list, self.button)
+
+        self.loop = pgui.MainLoop(self.compositor, self.manager, max_fps=60)
+
+    def select(self, index):
+        pygame.display.set_caption(f"Row {index:,} selected")
+
+
+main = Main()
+main.loop.run()
@@ -45,9 +45,9 @@ class Main:
         self.slider.move(50, 80)
         self.button.move(480, 530)
 
-        # This is optional but we can but the widgets inside a list so we can
-        # then iterate through it to update the widgets
-        self.widgets = [self.entry, self.button, self.slider]
+        # This is optional but we can put the widgets inside a group so we can
+        # update and draw all of them at once
+        self.widgets = pgui.WidgetGroup(self.entry, self.button, self.slider)
 
     def clear(self):
         # This will clear the text in the Entry widget
@@ -56,11 +56,11 @@ class Main:
     def update(self):
         self.screen.fill((200, 200, 200))
 
-        # Update each widget
-        for w in self.widgets:
-            w.update()
+        # Update all the widgets
+        self.widgets.update()
 
-        self.slider.max = self.entry.get_text_pixel_length() - self.entry.width + self.entry.get_font_size()
+        # How far the text can be scrolled
+        self.slider.max = self.entry.get_max_offset()
 
         if self.entry.get_text_pixel_length() > self.entry.width:
             self.entry.offset = self.slider.mark
@@ -73,6 +73,8 @@ class Main:
         # The loop does not need to have anything in it but we
         # can use it however we want
         for event in pygame.event.get():
+            # Send the keyboard events to the Entry being typed in
+            pgui.text_input.handle_event(event)
             if event.type == pygame.QUIT:
                 raise SystemExit  # This is just the same as sys.exit()
             if event.type == pygame.KEYDOWN:
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+#####################################################################################
+# This example opens its own source code in a text area. The lines are wrapped      #
+# and rendered when they are shown, and typing only renders the edited line again   #
+#####################################################################################
+
+import pgui
+import pygame
+import sys
+
+pygame.init()
+
+
+class Main:
+    def __init__(self):
+        # Create a screen so we can display our widgets
+        self.screen = pygame.display.set_mode((600, 600))
+
+        with open(__file__, encoding="utf-8") as file:
+            text = file.read()
+        self.area = pgui.TextArea(self, x=20, y=20, width=560, height=490, size=16, text=text)
+        self.area.set_cursor(0, 0)
+        self.button = pgui.Button(self, x=480, y=530, func=sys.exit, text="Exit")
+
+        # The manager sends the keys, the clicks and the mouse wheel to the widgets
+        self.manager = pgui.UIManager()
+        self.manager.add(self.area, self.button)
+        self.manager.set_focus(self.area)
+        self.compositor = pgui.Compositor(self.screen, background=(200, 200, 200))
+        self.compositor.add(self.area, self.button)
+
+        self.loop = pgui.MainLoop(self.compositor, self.manager, max_fps=60)
+
+
+main = Main()
+main.loop.run()
@@ -0,0 +1,173 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from collections import OrderedDict
+
+import pygame as pg
+
+
+class FontCache:
+    """
+    ### Description
+    Process-wide registry of `pygame.font.Font` objects shared by every widget.
+    Fonts are keyed by (name or path, size, bold, italic) and the least recently
+    used ones are dropped once the cache grows past its limit.
+
+    ### Usage
+    `FontCache(limit=64)`
+
+    #### Parameters
+    `limit: int`
+    Maximum number of fonts kept in the cache.
+
+    ---
+
+    """
+
+    def __init__(self, limit=64):
+        if type(limit) != int:
+            raise TypeError("limit must be an integer, not", type(limit))
+        elif limit < 1:
+            raise ValueError("limit must be greater than 0.")
+        self._limit = limit
+        self._fonts = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, name, size, bold=False, italic=False):
+        """
+        #### Description
+        Get a font from the cache, loading it if it is not there yet.
+
+        #### Parameters
+        `name: str`
+        A font name such as "Arial" or a path to a font file '.ttf' or '.otf'.
+
+        `size: int`
+        Font size in pixels.
+
+        `bold: bool`
+        Use the bold version of the font.
+
+        `italic: bool`
+        Use the italic version of the font.
+
+        #### Returns
+        `pygame.font.Font`
+
+        #### Usage
+        `font_cache.get("Arial", 20)`
+
+        ---
+
+        """
+        key = (name, size, bool(bold), bool(italic))
+        font = self._fonts.get(key)
+        if font is not None:
+            self._hits += 1
+            self._fonts.move_to_end(key)
+            return font
+
+        self._misses += 1
+        font = self._load(*key)
+        self._fonts[key] = font
+        # Drop the least recently used fonts. Widgets holding them keep them alive
+        while len(self._fonts) > self._limit:
+            self._fonts.popitem(last=False)
+        return font
+
+    @staticmethod
+    def _load(name, size, bold, italic):
+        # The font module is started the first time a font is needed
+        if not pg.font.get_init():
+            pg.font.init()
+        # Try to find a font file using the name as a path
+        try:
+            font = pg.font.Font(name, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+        # If it does not find a font file, look for a font installed in the system
+        except (FileNotFoundError, OSError):
+            font = pg.font.SysFont(name, size, bold, italic)
+        return font
+
+    def set_limit(self, limit):
+        """
+        #### Description
+        Set the maximum number of fonts kept in the cache.
+
+        #### Parameters
+        `limit: int`
+        Maximum number of fonts.
+
+        #### Returns
+        None
+
+        #### Usage
+        `font_cache.set_limit(128)`
+
+        ---
+
+        """
+        if type(limit) != int:
+            raise TypeError("limit must be an integer, not", type(limit))
+        elif limit < 1:
+            raise ValueError("limit must be greater than 0.")
+        self._limit = limit
+        while len(self._fonts) > self._limit:
+            self._fonts.popitem(last=False)
+
+    def clear(self):
+        """
+        #### Description
+        Remove every font from the cache and reset the hit/miss counters.
+
+        #### Usage
+        `font_cache.clear()`
+
+        ---
+
+        """
+        self._fonts.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self):
+        """
+        #### Description
+        Get the cache statistics.
+
+        #### Returns
+        `dict` with the `hits`, `misses`, `size` and `limit` of the cache.
+
+        #### Usage
+        `font_cache.info()`
+
+        ---
+
+        """
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._fonts), "limit": self._limit}
+
+
+# Cache shared by every widget
+font_cache = FontCache()
+
+
+def get_font(name, size, bold=False, italic=False):
+    """
+    #### Description
+    Get a font from the shared font cache.
+
+    #### Usage
+    `get_font("Arial", 20)`
+
+    ---
+
+    """
+    return font_cache.get(name, size, bold, italic)
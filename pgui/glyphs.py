@@ -0,0 +1,312 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
+from .fonts import font_cache, get_font
+
+
+class GlyphTable:
+    """
+    ### Description
+    Width in pixels of the characters of a font, measured without rendering anything.
+    The width of a character is how much longer the text gets when it is added after the characters before it,
+    so the widths of a text add up to the width of the rendered text, kerning and overhangs included.
+
+    Use `get_glyph_table()` to share the tables between widgets.
+
+    ### Usage
+    `GlyphTable(font)`
+
+    #### Parameters
+    `font: pygame.font.Font`
+    The font to measure.
+
+    ---
+
+    """
+
+    # Texts are measured in runs of this many characters. The widths of a run add up to its rendered width,
+    # a longer text can be off by a pixel at the start of each run
+    _run_length = 64
+
+    def __init__(self, font):
+        self._font = font
+        self._widths = {}
+
+    def width(self, char, prev=""):
+        """Return the width in pixels of a character after another one"""
+        pair = prev + char
+        width = self._widths.get(pair)
+        if width is None:
+            size = self._font.size
+            width = size(pair)[0] - size(prev)[0] if prev else size(char)[0]
+            self._widths[pair] = width
+        return width
+
+    def measure(self, text, prev=""):
+        """
+        #### Description
+        Get the width of each character of a text.
+        The widths add up to the rendered width of the text, for texts of up to 64 characters.
+
+        #### Parameters
+        `text: str`
+        The text to measure.
+
+        `prev: str`
+        The character before the text, for the kerning of the first character.
+
+        #### Returns
+        `list` of `int`
+
+        #### Usage
+        `GlyphTable.measure("Hello")`
+
+        ---
+
+        """
+        size = self._font.size
+        widths = []
+        length = self._run_length
+        for first in range(0, len(text), length):
+            # The character before the run is measured with it, for the kerning of its first character.
+            # Each width is how much the run grows when the character is added to it
+            before = text[first - 1] if first else prev
+            run = before + text[first:first + length]
+            x = size(before)[0] if before else 0
+            for end in range(len(before) + 1, len(run) + 1):
+                width = size(run[:end])[0]
+                widths.append(width - x)
+                x = width
+        return widths
+
+    def size(self, text):
+        """
+        #### Description
+        Get the size a text would have once rendered, without rendering it.
+
+        #### Parameters
+        `text: str`
+        The text to measure.
+
+        #### Returns
+        `tuple` with the width and the height in pixels.
+
+        #### Usage
+        `GlyphTable.size("Hello")`
+
+        ---
+
+        """
+        return self._font.size(text)[0], self._font.get_height()
+
+
+# Tables shared by every widget, one per font, with the least recently used ones first.
+# They are kept with the same limit as the font cache, so they don't keep alive the fonts it dropped
+_tables = OrderedDict()
+
+
+def get_glyph_table(name, size, bold=False, italic=False):
+    """
+    #### Description
+    Get the shared glyph table of a font from the font cache.
+
+    #### Usage
+    `get_glyph_table("Arial", 20)`
+
+    ---
+
+    """
+    key = (name, size, bool(bold), bool(italic))
+    font = get_font(name, size, bold, italic)
+    table = _tables.get(key)
+    # The font was dropped from the font cache and loaded again, measure the new one
+    if table is None or table._font is not font:
+        table = _tables[key] = GlyphTable(font)
+    _tables.move_to_end(key)
+    while len(_tables) > font_cache._limit:
+        _tables.popitem(last=False)
+    return table
+
+
+class TextWidths:
+    """
+    ### Description
+    Prefix sums of the widths of the characters of a text, kept up to date while it is edited.
+    The widths are stored in chunks, each one with its own prefix sums, so an edit only
+    adds up one chunk again and the positions of the chunks after it.
+
+    Getting the x position of a character, the total width or the character at a position
+    only needs two binary searches.
+
+    ### Usage
+    `TextWidths(widths=())`
+
+    #### Parameters
+    `widths: list`
+    Width in pixels of each character.
+
+    ---
+
+    """
+
+    _chunk_size = 256
+
+    def __init__(self, widths=()):
+        self.set(widths)
+
+    def __len__(self):
+        return self._counts[-1]
+
+    def set(self, widths):
+        """
+        #### Description
+        Replace every width.
+
+        #### Parameters
+        `widths: list`
+        Width in pixels of each character.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextWidths.set([10, 12, 8])`
+
+        ---
+
+        """
+        widths = list(widths)
+        size = self._chunk_size
+        self._chunks = [widths[i:i + size] for i in range(0, len(widths), size)] or [[]]
+        self._sums = [[0] + list(accumulate(chunk)) for chunk in self._chunks]
+        self._counts = [0]
+        self._offsets = [0]
+        self._update(0)
+
+    def _update(self, first):
+        # Character count and x position at the start of each chunk from the first one changed
+        del self._counts[first + 1:]
+        del self._offsets[first + 1:]
+        for chunk, sums in zip(self._chunks[first:], self._sums[first:]):
+            self._counts.append(self._counts[-1] + len(chunk))
+            self._offsets.append(self._offsets[-1] + sums[-1])
+
+    def _chunk_of(self, index):
+        return min(bisect_right(self._counts, index) - 1, len(self._chunks) - 1)
+
+    def _splice(self, start, end, widths):
+        if not 0 <= start <= end <= len(self):
+            raise IndexError(f"range must be between 0 and {len(self)}, not {start}:{end}")
+        first = self._chunk_of(start)
+        last = self._chunk_of(end)
+        base = self._counts[first]
+        merged = []
+        for chunk in self._chunks[first:last + 1]:
+            merged.extend(chunk)
+        merged[start - base:end - base] = widths
+        size = self._chunk_size
+        # Join small chunks with the next one, so they don't pile up after many deletions
+        while len(merged) < size // 2 and last + 1 < len(self._chunks):
+            last += 1
+            merged.extend(self._chunks[last])
+        chunks = [merged[i:i + size] for i in range(0, len(merged), size)]
+        if not chunks and last - first + 1 == len(self._chunks):
+            chunks = [[]]
+        self._chunks[first:last + 1] = chunks
+        self._sums[first:last + 1] = [[0] + list(accumulate(chunk)) for chunk in chunks]
+        self._update(first)
+
+    def insert(self, index, widths):
+        """Insert the widths of new characters before the character at index"""
+        self._splice(index, index, list(widths))
+
+    def delete(self, start, end):
+        """Remove the widths of the characters between start and end"""
+        self._splice(start, end, [])
+
+    def replace(self, index, width):
+        """Change the width of a single character"""
+        self._splice(index, index + 1, [width])
+
+    def position(self, index):
+        """
+        #### Description
+        Get the x position of a character, relative to the start of the text.
+
+        #### Parameters
+        `index: int`
+        Position in characters, between 0 and the length of the text.
+
+        #### Returns
+        `int`
+
+        #### Usage
+        `TextWidths.position(5)`
+
+        ---
+
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError(f"index must be between 0 and {len(self)}, not {index}")
+        chunk = self._chunk_of(index)
+        return self._offsets[chunk] + self._sums[chunk][index - self._counts[chunk]]
+
+    def total(self):
+        """Return the width in pixels of the whole text"""
+        return self._offsets[-1]
+
+    def find(self, x):
+        """
+        #### Description
+        Get the last character that starts at or before a position.
+
+        #### Parameters
+        `x: int`
+        Position in pixels, relative to the start of the text.
+
+        #### Returns
+        `int` between 0 and the length of the text.
+
+        #### Usage
+        `TextWidths.find(120)`
+
+        ---
+
+        """
+        if x < 0:
+            return 0
+        chunk = min(bisect_right(self._offsets, x) - 1, len(self._chunks) - 1)
+        return self._counts[chunk] + bisect_right(self._sums[chunk], x - self._offsets[chunk]) - 1
+
+    def index_at(self, x):
+        """
+        #### Description
+        Get the position in characters closest to a position in pixels, to place a cursor.
+
+        #### Parameters
+        `x: int`
+        Position in pixels, relative to the start of the text.
+
+        #### Returns
+        `int` between 0 and the length of the text.
+
+        #### Usage
+        `TextWidths.index_at(mouse_x - text_x)`
+
+        ---
+
+        """
+        index = self.find(x)
+        if index < len(self) and x - self.position(index) > self.position(index + 1) - x:
+            index += 1
+        return index
@@ -0,0 +1,313 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from itertools import count
+
+import pygame as pg
+
+from .textinput import text_input
+from .timers import scheduler
+
+
+class WidgetGroup:
+    """
+    ### Description
+    Container that updates and draws a set of widgets at once.
+    The mouse is checked once per frame for every widget, and all the widgets are drawn
+    with a single `Surface.blits()` call, in z-order.
+
+    Widgets can be hidden, so they are neither drawn nor checked, or disabled, so they are drawn
+    but don't react to the mouse and keyboard. Widgets in a `UIManager` get their input from it.
+
+    ### Usage
+    `WidgetGroup(*widgets)`
+
+    #### Parameters
+    `widgets: Widget`
+    Widgets to add to the group, with a z-order of 0.
+
+    ---
+
+    """
+
+    def __init__(self, *widgets):
+        self._widgets = []
+        # z-order of each widget, and the order they were added in to break ties
+        self._z = {}
+        self._count = count()
+        self._hidden = set()
+        self._disabled = set()
+        self.add(*widgets)
+
+    def __len__(self):
+        return len(self._widgets)
+
+    def __iter__(self):
+        return iter(list(self._widgets))
+
+    def __contains__(self, widget):
+        return widget in self._z
+
+    def _sort(self):
+        self._widgets.sort(key=self._z.__getitem__)
+
+    def add(self, *widgets, z=0):
+        """
+        #### Description
+        Add widgets to the group. Widgets with a higher z-order are drawn on top,
+        widgets with the same z-order are drawn in the order they were added.
+
+        #### Parameters
+        `widgets: Widget`
+        The widgets to add.
+
+        `z: int`
+        z-order of the widgets.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.add(button, entry, z=1)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget not in self._z:
+                self._widgets.append(widget)
+            self._z[widget] = (z, next(self._count))
+        self._sort()
+
+    def remove(self, *widgets):
+        """
+        #### Description
+        Remove widgets from the group.
+
+        #### Parameters
+        `widgets: Widget`
+        The widgets to remove.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.remove(button)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget in self._z:
+                self._widgets.remove(widget)
+                del self._z[widget]
+                self._hidden.discard(widget)
+                if widget in self._disabled:
+                    self._disabled.remove(widget)
+                    widget._disabled -= 1
+
+    def set_z(self, widget, z):
+        """
+        #### Description
+        Change the z-order of a widget. It is drawn on top of the other widgets with the same z-order.
+
+        #### Parameters
+        `widget: Widget`
+        A widget of the group.
+
+        `z: int`
+        The new z-order.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.set_z(button, 10)`
+
+        ---
+
+        """
+        if widget not in self._z:
+            raise ValueError("The widget is not in the group.")
+        self._z[widget] = (z, next(self._count))
+        self._sort()
+
+    def get_z(self, widget):
+        """Return the z-order of a widget"""
+        return self._z[widget][0]
+
+    def hide(self, *widgets):
+        """
+        #### Description
+        Stop drawing and checking some widgets until they are shown again.
+
+        #### Parameters
+        `widgets: Widget`
+        Widgets of the group.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.hide(button)`
+
+        ---
+
+        """
+        self._hidden.update(widget for widget in widgets if widget in self._z)
+        self._drop_focus(widgets)
+
+    def show(self, *widgets):
+        """
+        #### Description
+        Draw and check widgets hidden with `hide()` again.
+
+        #### Parameters
+        `widgets: Widget`
+        Widgets of the group.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.show(button)`
+
+        ---
+
+        """
+        self._hidden.difference_update(widgets)
+
+    def disable(self, *widgets):
+        """
+        #### Description
+        Keep drawing some widgets, but stop checking the mouse and keyboard for them.
+        They don't get events from a `UIManager` or the keyboard focus either.
+
+        #### Parameters
+        `widgets: Widget`
+        Widgets of the group.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.disable(button)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget in self._z and widget not in self._disabled:
+                self._disabled.add(widget)
+                widget._disabled += 1
+        self._drop_focus(widgets)
+
+    def enable(self, *widgets):
+        """
+        #### Description
+        Check the mouse and keyboard again for widgets disabled with `disable()`.
+
+        #### Parameters
+        `widgets: Widget`
+        Widgets of the group.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.enable(button)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget in self._disabled:
+                self._disabled.remove(widget)
+                widget._disabled -= 1
+
+    def _drop_focus(self, widgets):
+        # Hidden and disabled widgets can't keep typing
+        if text_input.get_focus() in widgets:
+            text_input.set_focus(None)
+
+    def is_visible(self, widget):
+        """Return True if the widget is not hidden"""
+        return widget not in self._hidden
+
+    def is_enabled(self, widget):
+        """Return True if the widget is not disabled"""
+        return widget not in self._disabled
+
+    def poll_input(self):
+        """
+        #### Description
+        Let the visible and enabled widgets that are not in a `UIManager` check the mouse and keyboard.
+        The mouse is only checked once for all of them.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.poll_input()`
+
+        ---
+
+        """
+        mousepos = pg.mouse.get_pos()
+        pressed = pg.mouse.get_pressed()
+        skip = self._hidden | self._disabled
+        for widget in self._widgets:
+            if widget._manager is None and widget not in skip:
+                widget._poll_input(mousepos, pressed)
+
+    def draw(self):
+        """
+        #### Description
+        Display the visible widgets without checking the user input.
+        Only the widgets that changed are composed again, and every widget is drawn with a single blit call.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.draw()`
+
+        ---
+
+        """
+        batches = {}
+        for widget in self._widgets:
+            if widget not in self._hidden:
+                widget.refresh()
+                batches.setdefault(widget._screen, []).append(widget)
+        # Usually every widget is in the same screen, so this is a single call
+        for screen, widgets in batches.items():
+            self._blit_widgets(screen, widgets)
+
+    def _blit_widgets(self, screen, widgets):
+        # A method of its own so the profiler can blit and time each widget on its own
+        screen.blits([(widget._surface, widget._bounds) for widget in widgets], doreturn=False)
+
+    def update(self):
+        """
+        #### Description
+        Check the user input and display the widgets.
+
+        #### Returns
+        None
+
+        #### Usage
+        `WidgetGroup.update()`
+
+        ---
+
+        """
+        self.poll_input()
+        scheduler.run()
+        self.draw()
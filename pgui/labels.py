@@ -0,0 +1,290 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from collections import OrderedDict
+from math import ceil
+
+from .fonts import font_cache
+from .glyphs import get_glyph_table
+
+
+class LabelCache:
+    """
+    ### Description
+    Bounded cache of rendered text surfaces shared by every widget.
+    Labels are keyed by (font key, text, color, antialias) and the least recently
+    used ones are dropped once the cached surfaces use more memory than the budget.
+
+    The surfaces returned are shared, so they must never be drawn on.
+
+    ### Usage
+    `LabelCache(budget=8388608)`
+
+    #### Parameters
+    `budget: int`
+    Maximum amount of memory in bytes used by the cached surfaces.
+
+    ---
+
+    """
+
+    def __init__(self, budget=8 * 1024 * 1024):
+        if type(budget) != int:
+            raise TypeError("budget must be an integer, not", type(budget))
+        elif budget < 0:
+            raise ValueError("budget must be equal or greater than 0.")
+        self._budget = budget
+        self._labels = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, font_key, text, color, antialias=True):
+        """
+        #### Description
+        Get a rendered label from the cache, rendering it if it is not there yet.
+
+        #### Parameters
+        `font_key: tuple`
+        The (name or path, size, bold, italic) key of the font in the font cache.
+
+        `text: str`
+        Text to render.
+
+        `color: tuple`
+        A 3-tuple containing an RGB value.
+
+        `antialias: bool`
+        Render the text with antialiased edges.
+
+        #### Returns
+        `pygame.Surface`
+
+        #### Usage
+        `label_cache.render(("Arial", 20, False, False), "OK", (0, 0, 0))`
+
+        ---
+
+        """
+        key = (font_key, text, tuple(color), bool(antialias))
+        label = self._labels.get(key)
+        if label is not None:
+            self._hits += 1
+            self._labels.move_to_end(key)
+            return label
+
+        self._misses += 1
+        label = font_cache.get(*font_key).render(text, antialias, color)
+        size = self._sizeof(label)
+        # Labels bigger than the whole budget are never stored
+        if size <= self._budget:
+            self._labels[key] = label
+            self._bytes += size
+            self._shrink(self._budget)
+        return label
+
+    @staticmethod
+    def _sizeof(label):
+        return label.get_pitch() * label.get_height()
+
+    def _shrink(self, budget):
+        # Drop the least recently used labels until they fit in the budget
+        while self._bytes > budget:
+            key, label = self._labels.popitem(last=False)
+            self._bytes -= self._sizeof(label)
+
+    def set_budget(self, budget):
+        """
+        #### Description
+        Set the maximum amount of memory used by the cached labels.
+
+        #### Parameters
+        `budget: int`
+        Memory budget in bytes.
+
+        #### Returns
+        None
+
+        #### Usage
+        `label_cache.set_budget(16 * 1024 * 1024)`
+
+        ---
+
+        """
+        if type(budget) != int:
+            raise TypeError("budget must be an integer, not", type(budget))
+        elif budget < 0:
+            raise ValueError("budget must be equal or greater than 0.")
+        self._budget = budget
+        self._shrink(budget)
+
+    def clear(self):
+        """
+        #### Description
+        Remove every label from the cache and reset the hit/miss counters.
+
+        #### Usage
+        `label_cache.clear()`
+
+        ---
+
+        """
+        self._labels.clear()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def info(self):
+        """
+        #### Description
+        Get the cache statistics.
+
+        #### Returns
+        `dict` with the `hits`, `misses`, `size` (number of labels), `bytes` and `budget` of the cache.
+
+        #### Usage
+        `label_cache.info()`
+
+        ---
+
+        """
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._labels),
+                "bytes": self._bytes, "budget": self._budget}
+
+
+# Cache shared by every widget
+label_cache = LabelCache()
+
+
+class LabelLayout:
+    """
+    ### Description
+    Places the label of a widget on a side of the widget.
+    The position is only computed again when the label size, the widget rect,
+    the side, the alignment, the padding or the font size change.
+
+    ### Usage
+    `LabelLayout()`
+
+    ---
+
+    """
+
+    __slots__ = ("_key", "_pos")
+
+    def __init__(self):
+        self._key = None
+        self._pos = (0, 0)
+
+    def place(self, rect, label, side, align, padding, font_size):
+        """
+        #### Description
+        Get the screen position of a label.
+
+        #### Parameters
+        `rect: pygame.Rect`
+        Screen area of the widget.
+
+        `label: pygame.Surface`
+        The rendered label.
+
+        `side: str`
+        "top", "bottom", "left" or "right".
+
+        `align: str`
+        "left", "center" or "right". Only used on the top and bottom sides.
+
+        `padding: int`
+        Space in pixels between the widget and the label.
+
+        `font_size: int`
+        Size of the font in pixels. Labels on top are placed one font size above the widget.
+
+        #### Returns
+        `tuple` with the position of the top left corner of the label.
+
+        #### Usage
+        `LabelLayout.place(self._rect, self._label, "top", "left", 3, 20)`
+
+        ---
+
+        """
+        key = (rect.x, rect.y, rect.width, rect.height, label.get_width(), label.get_height(), side, align, padding, font_size)
+        if key != self._key:
+            self._pos = self._layout(*key)
+            self._key = key
+        return self._pos
+
+    @staticmethod
+    def margins(size, text, font_name, font_size, side, align, padding):
+        """
+        #### Description
+        Get how far the label of a widget goes past each side of the widget, measured without rendering it.
+
+        #### Parameters
+        `size: tuple`
+        Width and height of the widget.
+
+        `text: str`
+        Text of the label.
+
+        `font_name: str`
+        Name or path of the font.
+
+        `font_size: int`
+        Size of the font in pixels.
+
+        `side`, `align` and `padding` are the ones given to `place()`.
+
+        #### Returns
+        `tuple` with the space in pixels taken by the label on the left, top, right and bottom of the widget.
+
+        #### Usage
+        `LabelLayout.margins((200, 20), "Volume", "Arial", 20, "top", "left", 3)`
+
+        ---
+
+        """
+        label_width, label_height = get_glyph_table(font_name, font_size).size(text)
+        width, height = size
+        x, y = LabelLayout._layout(0, 0, width, height, label_width, label_height, side, align, padding, font_size)
+        margins = (-x, -y, x + label_width - width, y + label_height - height)
+        return tuple(max(ceil(margin), 0) for margin in margins)
+
+    @staticmethod
+    def _layout(x, y, width, height, label_width, label_height, side, align, padding, font_size):
+        if side == "top" or side == "bottom":
+            top = y - font_size - padding if side == "top" else y + height + padding
+            if align == "left":
+                return x, top
+            elif align == "center":
+                return x + width // 2 - label_width / 2, top
+            elif align == "right":
+                return x + width - label_width, top
+            raise ValueError("label_align must be either \"left\", \"center\" or \"right\".")
+        # The labels on the sides are aligned to the bottom of the widget
+        if side == "left":
+            return x - label_width - padding, y + height - label_height
+        elif side == "right":
+            return x + width + padding, y + height - label_height
+        raise ValueError("label_side must be either \"top\", \"bottom\", \"left\" or \"right\".")
+
+
+def render_label(font_name, font_size, text, color, antialias=True):
+    """
+    #### Description
+    Render a label through the shared label cache.
+
+    #### Usage
+    `render_label("Arial", 20, "OK", (0, 0, 0))`
+
+    ---
+
+    """
+    return label_cache.render((font_name, font_size, False, False), text, color, antialias)
@@ -0,0 +1,771 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import pygame as pg
+
+from .widget import Widget
+
+_ALIGNS = ("fill", "start", "center", "end")
+_ANCHORS = ("topleft", "midtop", "topright", "midleft", "center", "midright", "bottomleft", "midbottom", "bottomright")
+_FILLS = (None, "x", "y", "both")
+
+
+def _check_size(name, value, minimum):
+    if type(value) != int:
+        raise TypeError(f"{name} must be an integer, not", type(value))
+    elif value < minimum:
+        raise ValueError(f"{name} must be equal or greater than {minimum}.")
+
+
+def _align(start, space, size, align):
+    # Position of something of the given size inside a space
+    if align == "center":
+        return start + (space - size) // 2
+    elif align == "end":
+        return start + space - size
+    return start
+
+
+def _share(sizes, space, stretches):
+    # Give the space left to the items with a stretch, in proportion to it.
+    # The rest of the division goes to the last stretched item
+    extra = space - sum(sizes)
+    total = sum(stretches)
+    if extra <= 0 or not total:
+        return sizes
+    sizes = list(sizes)
+    given = 0
+    last = 0
+    for index, stretch in enumerate(stretches):
+        if stretch:
+            share = extra * stretch // total
+            sizes[index] += share
+            given += share
+            last = index
+    sizes[last] += extra - given
+    return sizes
+
+
+def _offsets(start, sizes, spacing):
+    offsets = []
+    for size in sizes:
+        offsets.append(start)
+        start += size + spacing
+    return offsets
+
+
+class _Item:
+    # A widget or a layout inside a layout, with the options it was added with
+    __slots__ = ("layout", "target", "stretch", "align", "width", "height", "options",
+                 "_added", "_size", "_hint", "_margins", "_rect", "_dirty")
+
+    def __init__(self, layout, target, stretch, align, width, height, options):
+        self.layout = layout
+        self.target = target
+        self.stretch = stretch
+        self.align = align
+        self.width = width
+        self.height = height
+        self.options = options
+        # Size of the widget when it was added, for the sizes it can't measure
+        self._added = target._rect.size if isinstance(target, Widget) else None
+        # Size of the widget, and of the cell it needs with its label, measured when they are needed
+        self._size = None
+        self._hint = None
+        self._margins = (0, 0, 0, 0)
+        # Cell given to the item the last time it was laid out
+        self._rect = None
+        self._dirty = True
+
+    def invalidate(self):
+        # Measure the item again, and lay out every layout above it
+        self._hint = None
+        self._dirty = True
+        self.layout._invalidate()
+
+    def hint(self):
+        if self._hint is None:
+            target = self.target
+            if isinstance(target, Layout):
+                width, height = target.get_size_hint()
+                width = self.width if self.width is not None else width
+                height = self.height if self.height is not None else height
+                self._hint = (width, height)
+            else:
+                width, height = target._size_hint()
+                width = self.width if self.width is not None else width if width is not None else self._added[0]
+                height = self.height if self.height is not None else height if height is not None else self._added[1]
+                self._size = (width, height)
+                self._margins = left, top, right, bottom = target._label_margins(width, height)
+                self._hint = (width + left + right, height + top + bottom)
+        return self._hint
+
+    def place(self, cell):
+        target = self.target
+        if isinstance(target, Layout):
+            # A layout whose cell did not change and that was not invalidated is skipped with everything in it
+            if self._dirty or cell != target._rect:
+                target._arrange(cell)
+        elif self._dirty or cell != self._rect:
+            self._place_widget(cell)
+        self._rect = cell
+        self._dirty = False
+
+    def _place_widget(self, cell):
+        widget = self.target
+        old = self._rect
+        if not self._dirty and old is not None and old.size == cell.size:
+            # Only the cell moved, so the widget keeps its size
+            x, y = widget._rect.topleft
+            widget.move(x + cell.x - old.x, y + cell.y - old.y)
+            return
+        left, top, right, bottom = self._margins
+        area = pg.Rect(cell.x + left, cell.y + top, cell.width - left - right, cell.height - top - bottom)
+        if self.align == "fill":
+            # Widgets that can't take the size of the cell are centered in it
+            width, height = widget._layout_resize(max(area.width, 1), max(area.height, 1))
+            align = "center"
+        else:
+            width, height = widget._layout_resize(*self._size)
+            align = self.align
+        x = int(_align(area.x, area.width, width, align))
+        y = int(_align(area.y, area.height, height, align))
+        if (x, y) != tuple(widget._rect.topleft):
+            widget.move(x, y)
+
+
+class Layout:
+    """
+    ### Description
+    Base class of the layouts. A layout places widgets and other layouts inside a rect,
+    moving and resizing them with their `move()`, `set_size()`, `set_length()` and `set_width()` methods.
+
+    The size each widget needs is measured from the shared glyph tables, without rendering anything,
+    and kept until the widget changes its label, font, border or size.
+    Then only the layouts above the widget are laid out again, and inside them,
+    only the widgets and layouts whose cell changed are moved.
+
+    Call `apply(rect)` when the window is resized, and `apply()` once per frame to lay out
+    the widgets that changed. It does nothing if nothing changed.
+
+    ### Usage
+    `Layout(*, spacing=0, padding=0)`
+
+    #### Parameters
+    `spacing: int`
+    Space in pixels between the items.
+
+    `padding: int`
+    Space in pixels between the items and the border of the layout.
+
+    ---
+
+    """
+
+    __slots__ = ("_spacing", "_padding", "_items", "_item", "_hint", "_dirty", "_rect")
+
+    def __init__(self, *, spacing=0, padding=0):
+        _check_size("spacing", spacing, 0)
+        _check_size("padding", padding, 0)
+        self._spacing = spacing
+        self._padding = padding
+        self._items = []
+        # Item holding the layout inside another layout
+        self._item = None
+        # Size the layout needs, measured when it is needed
+        self._hint = None
+        self._dirty = True
+        # Rect the layout was given the last time it was laid out
+        self._rect = None
+
+    @property
+    def spacing(self):
+        return self._spacing
+
+    @spacing.setter
+    def spacing(self, spacing):
+        _check_size("spacing", spacing, 0)
+        if spacing != self._spacing:
+            self._spacing = spacing
+            self._invalidate()
+
+    @property
+    def padding(self):
+        return self._padding
+
+    @padding.setter
+    def padding(self, padding):
+        _check_size("padding", padding, 0)
+        if padding != self._padding:
+            self._padding = padding
+            self._invalidate()
+
+    def _add(self, target, stretch, align, width, height, options):
+        if isinstance(target, Layout):
+            layout = self
+            while layout is not None:
+                if layout is target:
+                    raise ValueError("A layout can't be added to itself or to a layout inside it.")
+                layout = layout._item.layout if layout._item is not None else None
+            previous = target._item
+        elif isinstance(target, Widget):
+            previous = target._layout_item
+        else:
+            raise TypeError("Only widgets and layouts can be added to a layout, not", type(target))
+        _check_size("stretch", stretch, 0)
+        if align not in _ALIGNS:
+            raise ValueError("align must be either \"fill\", \"start\", \"center\" or \"end\".")
+        if width is not None:
+            _check_size("width", width, 1)
+        if height is not None:
+            _check_size("height", height, 1)
+
+        # A widget or a layout can only be in one layout
+        if previous is not None:
+            previous.layout.remove(target)
+        item = _Item(self, target, stretch, align, width, height, options)
+        if isinstance(target, Layout):
+            target._item = item
+        else:
+            target._layout_item = item
+        self._items.append(item)
+        self._invalidate()
+
+    def remove(self, *targets):
+        """
+        #### Description
+        Remove widgets or layouts from the layout. They stay where they are.
+
+        #### Parameters
+        `targets: Widget or Layout`
+        The widgets and layouts to remove.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Layout.remove(button)`
+
+        ---
+
+        """
+        for target in targets:
+            item = target._item if isinstance(target, Layout) else getattr(target, "_layout_item", None)
+            if item is None or item.layout is not self:
+                continue
+            self._items.remove(item)
+            if isinstance(target, Layout):
+                target._item = None
+            else:
+                target._layout_item = None
+            self._invalidate()
+
+    def invalidate(self, *widgets):
+        """
+        #### Description
+        Measure widgets again the next time the layout is applied.
+        The widgets do it themselves when their label, font, border, label position or size change,
+        use it after changing something else that changes their size.
+
+        #### Parameters
+        `widgets: Widget`
+        The widgets to measure again. Without widgets, everything in the layout is measured again.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Layout.invalidate(checkbox)`
+
+        ---
+
+        """
+        if widgets:
+            for widget in widgets:
+                if widget._layout_item is not None:
+                    widget._layout_item.invalidate()
+            return
+        for item in self._items:
+            if isinstance(item.target, Layout):
+                item.target.invalidate()
+            else:
+                item.invalidate()
+        self._invalidate()
+
+    def _invalidate(self):
+        self._hint = None
+        self._dirty = True
+        if self._item is not None:
+            self._item.invalidate()
+
+    def is_dirty(self):
+        """
+        #### Description
+        Check if something in the layout changed since it was last applied.
+
+        #### Returns
+        `bool`
+
+        #### Usage
+        `Layout.is_dirty()`
+
+        ---
+
+        """
+        return self._dirty
+
+    def get_rect(self):
+        """
+        #### Description
+        Get the rect the layout was last applied to.
+
+        #### Returns
+        `pygame.Rect` or None if it was not applied yet.
+
+        #### Usage
+        `Layout.get_rect()`
+
+        ---
+
+        """
+        return self._rect.copy() if self._rect is not None else None
+
+    def get_size_hint(self):
+        """
+        #### Description
+        Get the size the layout needs to show every item without stretching them.
+
+        #### Returns
+        `tuple` with the width and the height in pixels.
+
+        #### Usage
+        `Layout.get_size_hint()`
+
+        ---
+
+        """
+        if self._hint is None:
+            width, height = self._measure()
+            self._hint = (width + self._padding * 2, height + self._padding * 2)
+        return self._hint
+
+    def apply(self, rect=None):
+        """
+        #### Description
+        Lay out the items inside a rect. Only the items that changed, or whose cell changed, are moved and resized.
+
+        #### Parameters
+        `rect: pygame.Rect`
+        Screen area of the layout. If it is not given, the last one is used.
+
+        #### Returns
+        `bool` True if something was laid out.
+
+        #### Usage
+        ```python
+        if event.type == pygame.VIDEORESIZE:
+            layout.apply(screen.get_rect())
+        layout.apply()
+        ```
+
+        ---
+
+        """
+        if rect is None:
+            if self._rect is None:
+                raise ValueError("The layout was never applied, a rect must be given.")
+            rect = self._rect
+        else:
+            rect = pg.Rect(rect)
+        if not self._dirty and rect == self._rect:
+            return False
+        self._arrange(rect)
+        return True
+
+    def _arrange(self, rect):
+        self._rect = pg.Rect(rect)
+        self._dirty = False
+        inner = self._rect.inflate(-self._padding * 2, -self._padding * 2)
+        for item, cell in zip(self._items, self._cells(inner)):
+            item.place(cell)
+
+    def _measure(self):
+        # Size the items need, without the padding
+        raise NotImplementedError
+
+    def _cells(self, rect):
+        # Rect of each item inside the layout, without the padding
+        raise NotImplementedError
+
+
+class _Box(Layout):
+    # Items in a row (axis 0) or in a column (axis 1)
+    __slots__ = ()
+    _axis = 0
+
+    def add(self, target, *, stretch=0, align="fill", width=None, height=None):
+        """
+        #### Description
+        Add a widget or a layout after the last item.
+
+        #### Parameters
+        `target: Widget or Layout`
+        The widget or layout to add. It is removed from the layout it was in.
+
+        `stretch: int`
+        Share of the space left that the item takes. Items with a stretch of 0 keep the size they need.
+
+        `align: str`
+        "fill" resizes the widget to its cell, "start", "center" and "end" keep its size and place it in the cell.
+
+        `width: int`
+        Width of the widget without its label, instead of the measured one.
+
+        `height: int`
+        Height of the widget without its label, instead of the measured one.
+
+        #### Returns
+        None
+
+        #### Usage
+        `HBox.add(slider, stretch=1)`
+
+        ---
+
+        """
+        self._add(target, stretch, align, width, height, None)
+
+    def _measure(self):
+        axis = self._axis
+        hints = [item.hint() for item in self._items]
+        length = sum(hint[axis] for hint in hints) + self._spacing * max(len(hints) - 1, 0)
+        thickness = max((hint[1 - axis] for hint in hints), default=0)
+        return (length, thickness) if axis == 0 else (thickness, length)
+
+    def _cells(self, rect):
+        axis = self._axis
+        items = self._items
+        sizes = [item.hint()[axis] for item in items]
+        space = rect.size[axis] - self._spacing * max(len(items) - 1, 0)
+        sizes = _share(sizes, space, [item.stretch for item in items])
+        offsets = _offsets(rect.topleft[axis], sizes, self._spacing)
+        if axis == 0:
+            return [pg.Rect(x, rect.y, width, rect.height) for x, width in zip(offsets, sizes)]
+        return [pg.Rect(rect.x, y, rect.width, height) for y, height in zip(offsets, sizes)]
+
+
+class HBox(_Box):
+    """
+    ### Description
+    Layout placing its items in a row, from left to right.
+    The items with a stretch share the width left, and every item takes the whole height.
+
+    ### Usage
+    `HBox(*, spacing=0, padding=0)`
+
+    #### Parameters
+    `spacing: int`
+    Space in pixels between the items.
+
+    `padding: int`
+    Space in pixels between the items and the border of the layout.
+
+    ---
+
+    """
+
+    __slots__ = ()
+    _axis = 0
+
+
+class VBox(_Box):
+    """
+    ### Description
+    Layout placing its items in a column, from top to bottom.
+    The items with a stretch share the height left, and every item takes the whole width.
+
+    ### Usage
+    `VBox(*, spacing=0, padding=0)`
+
+    #### Parameters
+    `spacing: int`
+    Space in pixels between the items.
+
+    `padding: int`
+    Space in pixels between the items and the border of the layout.
+
+    ---
+
+    """
+
+    __slots__ = ()
+    _axis = 1
+
+
+def _track_sizes(spans, spacing):
+    # Size of each column or row, from the (first track, number of tracks, size) of the items
+    count = max((first + number for first, number, size in spans), default=0)
+    sizes = [0] * count
+    for first, number, size in spans:
+        if number == 1 and size > sizes[first]:
+            sizes[first] = size
+    # The last track of an item spanning several tracks grows if they are not big enough
+    for first, number, size in spans:
+        if number > 1:
+            missing = size - sum(sizes[first:first + number]) - spacing * (number - 1)
+            if missing > 0:
+                sizes[first + number - 1] += missing
+    return sizes
+
+
+class Grid(Layout):
+    """
+    ### Description
+    Layout placing its items in the cells of a grid. An item can span several rows and columns.
+    Each column is as wide as its widest item and each row as high as its highest item.
+    The columns and rows with a stretch share the space left.
+
+    ### Usage
+    `Grid(*, spacing=0, padding=0)`
+
+    #### Parameters
+    `spacing: int`
+    Space in pixels between the rows and the columns.
+
+    `padding: int`
+    Space in pixels between the items and the border of the layout.
+
+    ---
+
+    """
+
+    __slots__ = ("_column_stretch", "_row_stretch", "_tracks")
+
+    def __init__(self, *, spacing=0, padding=0):
+        super().__init__(spacing=spacing, padding=padding)
+        self._column_stretch = {}
+        self._row_stretch = {}
+        # Sizes of the columns and rows, measured when they are needed
+        self._tracks = None
+
+    def add(self, target, row, column, *, rowspan=1, columnspan=1, align="fill", width=None, height=None):
+        """
+        #### Description
+        Add a widget or a layout to a cell of the grid.
+
+        #### Parameters
+        `target: Widget or Layout`
+        The widget or layout to add. It is removed from the layout it was in.
+
+        `row: int`
+        `column: int`
+        Cell of the top left corner of the item, starting at 0.
+
+        `rowspan: int`
+        `columnspan: int`
+        Number of rows and columns taken by the item.
+
+        `align: str`
+        "fill" resizes the widget to its cell, "start", "center" and "end" keep its size and place it in the cell.
+
+        `width: int`
+        `height: int`
+        Size of the widget without its label, instead of the measured one.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Grid.add(entry, 0, 1, columnspan=2)`
+
+        ---
+
+        """
+        _check_size("row", row, 0)
+        _check_size("column", column, 0)
+        _check_size("rowspan", rowspan, 1)
+        _check_size("columnspan", columnspan, 1)
+        self._add(target, 0, align, width, height, (row, column, rowspan, columnspan))
+
+    def set_column_stretch(self, column, stretch):
+        """
+        #### Description
+        Set the share of the width left that a column takes. Columns have a stretch of 0 by default.
+
+        #### Parameters
+        `column: int`
+        The column.
+
+        `stretch: int`
+        The share of the width left.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Grid.set_column_stretch(1, 1)`
+
+        ---
+
+        """
+        _check_size("column", column, 0)
+        _check_size("stretch", stretch, 0)
+        self._column_stretch[column] = stretch
+        self._invalidate()
+
+    def set_row_stretch(self, row, stretch):
+        """
+        #### Description
+        Set the share of the height left that a row takes. Rows have a stretch of 0 by default.
+
+        #### Parameters
+        `row: int`
+        The row.
+
+        `stretch: int`
+        The share of the height left.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Grid.set_row_stretch(0, 1)`
+
+        ---
+
+        """
+        _check_size("row", row, 0)
+        _check_size("stretch", stretch, 0)
+        self._row_stretch[row] = stretch
+        self._invalidate()
+
+    def _invalidate(self):
+        self._tracks = None
+        super()._invalidate()
+
+    def _get_tracks(self):
+        if self._tracks is None:
+            hints = [item.hint() for item in self._items]
+            columns = _track_sizes([(item.options[1], item.options[3], hint[0])
+                                    for item, hint in zip(self._items, hints)], self._spacing)
+            rows = _track_sizes([(item.options[0], item.options[2], hint[1])
+                                 for item, hint in zip(self._items, hints)], self._spacing)
+            self._tracks = (columns, rows)
+        return self._tracks
+
+    def _measure(self):
+        columns, rows = self._get_tracks()
+        return (sum(columns) + self._spacing * max(len(columns) - 1, 0),
+                sum(rows) + self._spacing * max(len(rows) - 1, 0))
+
+    def _cells(self, rect):
+        columns, rows = self._get_tracks()
+        columns = _share(columns, rect.width - self._spacing * max(len(columns) - 1, 0),
+                         [self._column_stretch.get(column, 0) for column in range(len(columns))])
+        rows = _share(rows, rect.height - self._spacing * max(len(rows) - 1, 0),
+                      [self._row_stretch.get(row, 0) for row in range(len(rows))])
+        xs = _offsets(rect.x, columns, self._spacing)
+        ys = _offsets(rect.y, rows, self._spacing)
+        cells = []
+        for item in self._items:
+            row, column, rowspan, columnspan = item.options
+            right = column + columnspan - 1
+            bottom = row + rowspan - 1
+            cells.append(pg.Rect(xs[column], ys[row], xs[right] + columns[right] - xs[column],
+                                 ys[bottom] + rows[bottom] - ys[row]))
+        return cells
+
+
+class AnchorLayout(Layout):
+    """
+    ### Description
+    Layout placing each item at a side, a corner or the center of its rect.
+    Items can be stretched to the whole width or height of the layout.
+
+    ### Usage
+    `AnchorLayout(*, padding=0)`
+
+    #### Parameters
+    `padding: int`
+    Space in pixels between the items and the border of the layout.
+
+    ---
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *, padding=0):
+        super().__init__(padding=padding)
+
+    def add(self, target, anchor="center", *, offset=(0, 0), fill=None, align="fill", width=None, height=None):
+        """
+        #### Description
+        Add a widget or a layout anchored to a point of the layout.
+
+        #### Parameters
+        `target: Widget or Layout`
+        The widget or layout to add. It is removed from the layout it was in.
+
+        `anchor: str`
+        Point of the item placed on the same point of the layout, named like the `pygame.Rect` attributes:
+        "topleft", "midtop", "topright", "midleft", "center", "midright", "bottomleft", "midbottom" or "bottomright".
+
+        `offset: tuple`
+        Distance in pixels from the anchor point.
+
+        `fill: str`
+        "x", "y" or "both" to stretch the cell of the item to the width, the height or the whole layout.
+
+        `align: str`
+        "fill" resizes the widget to its cell, "start", "center" and "end" keep its size and place it in the cell.
+
+        `width: int`
+        `height: int`
+        Size of the widget without its label, instead of the measured one.
+
+        #### Returns
+        None
+
+        #### Usage
+        `AnchorLayout.add(button, "bottomright", offset=(-10, -10))`
+
+        ---
+
+        """
+        if anchor not in _ANCHORS:
+            raise ValueError("anchor must be the name of a point of a pygame.Rect, like \"topleft\" or \"center\".")
+        if type(offset) != tuple or len(offset) != 2 or any(type(value) != int for value in offset):
+            raise TypeError("offset must be a tuple of 2 integers, not", offset)
+        if fill not in _FILLS:
+            raise ValueError("fill must be either None, \"x\", \"y\" or \"both\".")
+        self._add(target, 0, align, width, height, (anchor, offset, fill))
+
+    def _measure(self):
+        width = height = 0
+        for item in self._items:
+            hint = item.hint()
+            offset = item.options[1]
+            width = max(width, hint[0] + abs(offset[0]))
+            height = max(height, hint[1] + abs(offset[1]))
+        return width, height
+
+    def _cells(self, rect):
+        cells = []
+        for item in self._items:
+            anchor, offset, fill = item.options
+            width, height = item.hint()
+            if fill in ("x", "both"):
+                width = rect.width
+            if fill in ("y", "both"):
+                height = rect.height
+            cell = pg.Rect(0, 0, width, height)
+            setattr(cell, anchor, getattr(rect, anchor))
+            cells.append(cell.move(offset))
+        return cells
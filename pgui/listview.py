@@ -0,0 +1,552 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import pygame as pg
+
+from .attributes import Color, Function, Integer, String
+from .labels import render_label
+from .scrolling import _Scrollable
+from .style import Style
+from .widget import Widget
+
+
+class ListRow(Widget):
+    """
+    ### Description
+    A row of a `ListView`. The rows are created by the list and reused for other rows when they scroll out of it,
+    so a list only has the rows it shows, plus a few more above and below.
+    The row is composed again when it shows another row or its selection changes.
+
+    Subclass it and set `ListView.row_class` to draw other things than a text.
+
+    ### Usage
+    `ListRow(view)`
+
+    #### Parameters
+    `view: ListView`
+    The list the row belongs to.
+
+    ---
+
+    """
+
+    __slots__ = ("_view", "_rect", "index", "value", "selected")
+
+    def __init__(self, view):
+        super().__init__(view.parent)
+        self._view = view
+        self._rect = pg.Rect(0, 0, view._rect.width - view.scrollbar_width, view._row_height)
+        # Index of the row shown, the value returned by the provider for it, and if it is selected
+        self.index = None
+        self.value = None
+        self.selected = False
+
+    def bind(self, index, value, selected):
+        """
+        #### Description
+        Show another row. It is only composed again if something changed.
+
+        #### Parameters
+        `index: int`
+        Index of the row.
+
+        `value`
+        The value returned by the provider for the row.
+
+        `selected: bool`
+        True if the row is selected.
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListRow.bind(12, "Row 12", False)`
+
+        ---
+
+        """
+        if index != self.index or value != self.value or selected != self.selected:
+            self.index = index
+            self.value = value
+            self.selected = selected
+            self._dirty = True
+
+    def _compose(self):
+        view = self._view
+        image = self._begin_compose(self._rect)
+        if self.selected:
+            image.fill(view.select_color)
+        elif self.index % 2:
+            image.fill(view.alt_row_color)
+        else:
+            image.fill(view.row_color)
+        label = render_label(view.font_name, view.font_size, str(self.value), view.font_color)
+        image.blit(label, (view.row_padding, (self._rect.height - label.get_height()) // 2))
+
+
+class ListView(_Scrollable):
+    """
+    ### Description
+    Scrollable list of text rows that only builds the rows it shows.
+    The text of each row is asked to the provider when the row scrolls into the list, so the list can have
+    millions of rows. Only the rows in the list, plus `overscan` rows above and below, have a row widget
+    and a composed surface, and the row widgets are reused when they scroll out, so scrolling does not
+    depend on the number of rows.
+
+    A vertical `Slider` on the right is used as the scrollbar, and the mouse wheel scrolls the list
+    when it is in a `UIManager`. Clicking a row selects it and calls `func` with its index.
+
+    ### Usage
+    `ListView(parent, *, x=0, y=0, width=300, height=200, row_count=0, provider=None, row_height=24, func=None)`
+
+    #### Parameters
+    `x: int`
+    x position in pixels.
+
+    `y: int`
+    y position in pixels.
+
+    `width: int`
+    Width in pixels, with the scrollbar.
+
+    `height: int`
+    Height in pixels.
+
+    `row_count: int`
+    Number of rows.
+
+    `provider: function or method`
+    Function taking the index of a row and returning its text. If it is not specified, the rows show their index.
+
+    `row_height: int`
+    Height of each row in pixels.
+
+    `func: function or method`
+    Function called with the index of a row when it is clicked.
+
+    ---
+
+    """
+
+    # ------- ATTRIBUTES -------
+    bg_color = Color()
+    row_color = Color()
+    alt_row_color = Color()
+    select_color = Color()
+    border_width = Integer()
+    border_color = Color()
+    row_padding = Integer()
+    overscan = Integer()
+    font_name = String()
+    font_size = Integer(minimum=1)
+    font_color = Color()
+    func = Function(optional=True)
+    # --------------------------
+
+    __slots__ = ("_bg_color", "_row_color", "_alt_row_color", "_select_color", "_border_width", "_border_color",
+                 "_row_padding", "_overscan", "_font_name", "_font_size", "_font_color", "_func",
+                 "_rect", "_row_height", "_row_count", "_provider", "_selected", "_rows", "_pool", "_look")
+
+    style = Style(bg_color=(255, 255, 255), row_color=(255, 255, 255), alt_row_color=(240, 240, 240),
+                  select_color=(180, 210, 255), border_width=1, border_color=(0, 0, 0), row_padding=4, overscan=2,
+                  font_name="Arial", font_size=16, font_color=(0, 0, 0))
+
+    # The size of the list does not depend on its font
+    _layout_attributes = ()
+
+    # Class of the row widgets
+    row_class = ListRow
+
+    def __init__(self, parent, *, x=0, y=0, width=300, height=200, row_count=0, provider=None, row_height=24,
+                 func=None):
+        super().__init__(parent)
+        if type(row_height) != int:
+            raise TypeError("row_height must be an integer, not", type(row_height))
+        elif row_height < 1:
+            raise ValueError("row_height must be greater than 0.")
+        if provider is not None and not callable(provider):
+            raise TypeError("provider must be a function or method, not", type(provider))
+        self._rect = pg.Rect(x, y, width, height)
+        self._row_height = row_height
+        self._row_count = 0
+        self._provider = provider
+
+        # ------- ATTRIBUTES -------
+        # The colors, the border and the font come from ListView.style
+        self.func = func
+        # --------------------------
+
+        # Index of the selected row
+        self._selected = None
+        self._place_scrollbar()
+        # Row widgets by the index of the row they show, and row widgets ready to be reused
+        self._rows = {}
+        self._pool = []
+        # Colors and font of the composed rows
+        self._look = None
+        self.set_row_count(row_count)
+
+    def _viewport(self):
+        # Screen area where the rows are shown
+        return pg.Rect(self._rect.x, self._rect.y, self._rect.width - self.scrollbar_width, self._rect.height)
+
+    def _max_scroll(self):
+        return max(self._row_count * self._row_height - self._rect.height, 0)
+
+    def _sync_rows(self):
+        # Give a row widget to every row in the list or close to it, and take it from the rows that left
+        start = max(self._scroll // self._row_height - self.overscan, 0)
+        end = min((self._scroll + self._rect.height - 1) // self._row_height + 1 + self.overscan, self._row_count)
+        rows = self._rows
+        for index in [index for index in rows if index < start or index >= end]:
+            self._pool.append(rows.pop(index))
+        for index in range(start, end):
+            row = rows.get(index)
+            if row is None:
+                row = rows[index] = self._pool.pop() if self._pool else self.row_class(self)
+                row.bind(index, self._get_value(index), index == self._selected)
+
+    def _get_value(self, index):
+        return self._provider(index) if self._provider is not None else index
+
+    def _compose(self):
+        # The rows are composed again when the colors or the font change
+        look = (self.row_color, self.alt_row_color, self.select_color, self.row_padding,
+                self.font_name, self.font_size, self.font_color)
+        if look != self._look:
+            self._look = look
+            for row in self._rows.values():
+                row.mark_dirty()
+            for row in self._pool:
+                row.mark_dirty()
+        self._sync_rows()
+
+        image = self._begin_compose(self._rect)
+        image.fill(self.bg_color)
+        viewport = self._local(self._viewport())
+        image.set_clip(viewport)
+        for index, row in self._rows.items():
+            y = index * self._row_height - self._scroll
+            # Rows above and below the list are composed but not drawn
+            if -self._row_height < y < viewport.height:
+                row.refresh()
+                image.blit(row._surface, (viewport.x, viewport.y + y))
+        image.set_clip(None)
+
+        self._draw_scrollbar(image)
+        if self.border_width > 0:
+            pg.draw.rect(image, self.border_color, image.get_rect(), self.border_width)
+
+    def _row_at(self, pos):
+        # Index of the row under a position of the screen, or None
+        if not self._viewport().collidepoint(pos):
+            return None
+        index = (pos[1] - self._rect.y + self._scroll) // self._row_height
+        return index if index < self._row_count else None
+
+    def _click(self, pos):
+        index = self._row_at(pos)
+        if index is not None:
+            self.set_selected(index)
+            if self.func:
+                self.func(index)
+
+    def _wheel_step(self):
+        # Three rows for each step of the wheel
+        return self._row_height * 3
+
+    def get_scrollbar(self):
+        """
+        #### Description
+        Get the slider used as the scrollbar, to change how it looks.
+
+        #### Returns
+        `Slider`
+
+        #### Usage
+        `ListView.get_scrollbar().pointer_color = (100, 100, 100)`
+
+        ---
+
+        """
+        return self._scrollbar
+
+    def get_row_count(self):
+        """
+        #### Description
+        Get the number of rows.
+
+        #### Returns
+        `int`
+
+        #### Usage
+        `ListView.get_row_count()`
+
+        ---
+
+        """
+        return self._row_count
+
+    def set_row_count(self, count):
+        """
+        #### Description
+        Set the number of rows. The rows that are still in the list keep their text, call `refresh_rows()` if it changed.
+
+        #### Parameters
+        `count: int`
+        Number of rows.
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListView.set_row_count(len(log))`
+
+        ---
+
+        """
+        if type(count) != int:
+            raise TypeError("count must be an integer, not", type(count))
+        elif count < 0:
+            raise ValueError("count must be equal or greater than 0.")
+        self._row_count = count
+        for index in [index for index in self._rows if index >= count]:
+            self._pool.append(self._rows.pop(index))
+        if self._selected is not None and self._selected >= count:
+            self._selected = None
+        self._scroll = min(self._scroll, self._max_scroll())
+        self._update_scrollbar()
+        self.mark_dirty()
+
+    def refresh_rows(self):
+        """
+        #### Description
+        Ask the provider again for the text of the rows that are built. Call it when the data changed.
+        Only the rows whose text changed are composed again.
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListView.refresh_rows()`
+
+        ---
+
+        """
+        for index, row in self._rows.items():
+            row.bind(index, self._get_value(index), index == self._selected)
+        self.mark_dirty()
+
+    def get_scroll(self):
+        """
+        #### Description
+        Get how far the list is scrolled.
+
+        #### Returns
+        `int` distance in pixels from the top of the first row to the top of the list.
+
+        #### Usage
+        `ListView.get_scroll()`
+
+        ---
+
+        """
+        return self._scroll
+
+    def set_scroll(self, scroll):
+        """
+        #### Description
+        Scroll the list. The value is kept between 0 and the end of the last row.
+
+        #### Parameters
+        `scroll: int`
+        Distance in pixels from the top of the first row to the top of the list.
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListView.set_scroll(240)`
+
+        ---
+
+        """
+        if type(scroll) != int:
+            raise TypeError("scroll must be an integer, not", type(scroll))
+        scroll = min(max(scroll, 0), self._max_scroll())
+        if scroll != self._scroll:
+            self._scroll = scroll
+            self._update_scrollbar()
+            self.mark_dirty()
+
+    def scroll_to(self, index):
+        """
+        #### Description
+        Scroll the list as little as possible to show a row.
+
+        #### Parameters
+        `index: int`
+        Index of the row.
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListView.scroll_to(ListView.get_row_count() - 1)`
+
+        ---
+
+        """
+        if type(index) != int:
+            raise TypeError("index must be an integer, not", type(index))
+        top = index * self._row_height
+        if top < self._scroll:
+            self.set_scroll(top)
+        elif top + self._row_height > self._scroll + self._rect.height:
+            self.set_scroll(top + self._row_height - self._rect.height)
+
+    def get_visible_rows(self):
+        """
+        #### Description
+        Get the rows shown in the list, even partially.
+
+        #### Returns
+        `range` with the indices of the rows.
+
+        #### Usage
+        `ListView.get_visible_rows()`
+
+        ---
+
+        """
+        start = self._scroll // self._row_height
+        end = min((self._scroll + self._rect.height - 1) // self._row_height + 1, self._row_count)
+        return range(start, max(end, start))
+
+    def get_selected(self):
+        """
+        #### Description
+        Get the selected row.
+
+        #### Returns
+        `int` or None if no row is selected.
+
+        #### Usage
+        `ListView.get_selected()`
+
+        ---
+
+        """
+        return self._selected
+
+    def set_selected(self, index):
+        """
+        #### Description
+        Select a row.
+
+        #### Parameters
+        `index: int`
+        Index of the row, or None to select no row.
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListView.set_selected(3)`
+
+        ---
+
+        """
+        if index is not None:
+            if type(index) != int:
+                raise TypeError("index must be an integer, not", type(index))
+            elif not 0 <= index < self._row_count:
+                raise ValueError("index out of range.")
+        if index == self._selected:
+            return
+        previous = self._selected
+        self._selected = index
+        # Only the rows that were selected or are selected now are composed again
+        for changed in (previous, index):
+            row = self._rows.get(changed)
+            if row is not None:
+                row.bind(changed, row.value, changed == index)
+        self.mark_dirty()
+
+    def move(self, x, y):
+        """
+        #### Description
+        Change the widget's position
+
+        #### Parameters
+        `x: int`
+        Set widget's position along the x axis
+        `y: int`
+        Set widget's position along the y axis
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListView.move(200,300)`
+
+        ---
+
+        """
+        if type(x) != int:
+            raise TypeError("x must be an integer, not", type(x))
+        if type(y) != int:
+            raise TypeError("y must be an integer, not", type(y))
+        self._rect.topleft = (x, y)
+        self._place_scrollbar()
+        self.mark_dirty()
+        self._geometry_changed()
+
+    def set_size(self, width, height):
+        """
+        #### Description
+        Set the size of the widget.
+
+        #### Parameters
+        `width: int`
+        Width in pixels, with the scrollbar.
+
+        `height: int`
+        Height in pixels.
+
+        #### Returns
+        None
+
+        #### Usage
+        `ListView.set_size(400, 300)`
+
+        ---
+
+        """
+        if type(width) != int:
+            raise TypeError("width must be an integer, not", type(width))
+        if type(height) != int:
+            raise TypeError("height must be an integer, not", type(height))
+        if width <= self.scrollbar_width or height < 1:
+            raise ValueError(f"width must be greater than {self.scrollbar_width} and height greater than 0.")
+        if (width, height) == self._rect.size:
+            return
+        self._rect.size = (width, height)
+        for row in [*self._rows.values(), *self._pool]:
+            row._rect.width = width - self.scrollbar_width
+            row.mark_dirty()
+        self._place_scrollbar()
+        self._scroll = min(self._scroll, self._max_scroll())
+        self._update_scrollbar()
+        self.mark_dirty()
+        self._geometry_changed()
+
+    def _layout_resize(self, width, height):
+        self.set_size(max(width, self.scrollbar_width + 1), height)
+        return self._rect.size
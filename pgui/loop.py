@@ -0,0 +1,190 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import pygame as pg
+
+from .textinput import text_input
+from .timers import scheduler
+
+
+class MainLoop:
+    """
+    ### Description
+    Main loop that only draws when a widget changed or a timer is due.
+    While nothing changes it sleeps in `pygame.event.wait()` until the next event or timer,
+    so a static interface uses almost no CPU.
+
+    The widgets are drawn with a `Compositor` and only the changed areas of the screen are updated.
+    If a `UIManager` is given it sends the events to the widgets, otherwise the widgets
+    check the mouse on their own after every event.
+
+    ### Usage
+    `MainLoop(compositor, manager=None, max_fps=60)`
+
+    #### Parameters
+    `compositor: Compositor`
+    Compositor with the widgets to draw.
+
+    `manager: UIManager`
+    Manager that sends the events to the widgets.
+
+    `max_fps: int`
+    Maximum number of frames drawn per second.
+
+    ---
+
+    """
+
+    def __init__(self, compositor, manager=None, max_fps=60):
+        self._compositor = compositor
+        self._manager = manager
+        self.set_max_fps(max_fps)
+        self._running = False
+        self._next_frame = 0
+        self._start = pg.time.get_ticks()
+        self._frames = 0
+        self._wakeups = 0
+        self._idle_time = 0
+
+    def set_max_fps(self, max_fps):
+        """
+        #### Description
+        Set the maximum number of frames drawn per second.
+
+        #### Parameters
+        `max_fps: int`
+        Frames per second.
+
+        #### Returns
+        None
+
+        #### Usage
+        `MainLoop.set_max_fps(30)`
+
+        ---
+
+        """
+        if type(max_fps) != int:
+            raise TypeError("max_fps must be an integer, not", type(max_fps))
+        elif max_fps < 1:
+            raise ValueError("max_fps must be greater than 0.")
+        self._max_fps = max_fps
+        self._frame_time = 1000 // max_fps
+
+    def _timeout(self):
+        # Time to wait for events: until the next frame if something changed, or until the next timer
+        if self._compositor.is_dirty():
+            return max(self._next_frame - pg.time.get_ticks(), 0)
+        return scheduler.time_to_next()
+
+    def step(self):
+        """
+        #### Description
+        Wait for events or timers, send the events to the widgets and draw the ones that changed.
+
+        #### Returns
+        `list` with the events, so the application can handle them too.
+
+        #### Usage
+        ```python
+        for event in MainLoop.step():
+            if event.type == pygame.QUIT:
+                raise SystemExit
+        ```
+
+        ---
+
+        """
+        timeout = self._timeout()
+        events = []
+        if timeout != 0:
+            start = pg.time.get_ticks()
+            event = pg.event.wait() if timeout is None else pg.event.wait(timeout)
+            self._idle_time += pg.time.get_ticks() - start
+            if event.type != pg.NOEVENT:
+                events.append(event)
+        events.extend(pg.event.get())
+        self._wakeups += 1
+
+        if self._manager is not None:
+            self._manager.process_events(events)
+        else:
+            for event in events:
+                text_input.handle_event(event)
+            self._compositor.poll_input()
+            scheduler.run()
+
+        now = pg.time.get_ticks()
+        if now >= self._next_frame and self._compositor.is_dirty():
+            self._draw_frame()
+            self._frames += 1
+            self._next_frame = now + self._frame_time
+        return events
+
+    def _draw_frame(self):
+        # Draw the widgets that changed and update the screen. The profiler ends its frames here
+        pg.display.update(self._compositor.draw())
+
+    def run(self):
+        """
+        #### Description
+        Run the loop until the window is closed or `stop()` is called.
+
+        #### Returns
+        None
+
+        #### Usage
+        `MainLoop.run()`
+
+        ---
+
+        """
+        self._running = True
+        while self._running:
+            for event in self.step():
+                if event.type == pg.QUIT:
+                    self._running = False
+
+    def stop(self):
+        """
+        #### Description
+        Stop the loop started with `run()` after the current step.
+
+        #### Usage
+        `MainLoop.stop()`
+
+        ---
+
+        """
+        self._running = False
+
+    def get_stats(self):
+        """
+        #### Description
+        Get the statistics of the loop since it was created.
+
+        #### Returns
+        `dict` with the number of `frames` drawn, the number of `wakeups`, the `idle_time`
+        spent waiting and the total `time` in milliseconds, the `idle_ratio` and the average `fps`.
+
+        #### Usage
+        `MainLoop.get_stats()`
+
+        ---
+
+        """
+        time = max(pg.time.get_ticks() - self._start, 1)
+        return {
+            "frames": self._frames,
+            "wakeups": self._wakeups,
+            "idle_time": self._idle_time,
+            "time": time,
+            "idle_ratio": self._idle_time / time,
+            "fps": self._frames * 1000 / time,
+        }
@@ -0,0 +1,360 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import pygame as pg
+
+from .spatial import SpatialGrid
+from .textinput import text_input
+from .timers import scheduler
+
+
+class UIManager:
+    """
+    ### Description
+    Reads the pygame events once per frame and sends each one only to the widget that needs it.
+    Mouse events go to the widget under the pointer, or to the widget that got the mouse button
+    down while the button is held. Keyboard events go to the widget with the focus,
+    through the shared `pgui.text_input` dispatcher.
+
+    Widgets added to a manager stop checking the mouse and keyboard on their own.
+    The manager keeps the widgets in a spatial grid, so finding the widget under
+    the mouse does not depend on the number of widgets.
+
+    ### Usage
+    `UIManager(cell_size=128)`
+
+    #### Parameters
+    `cell_size: int`
+    Size in pixels of the cells of the spatial grid.
+
+    ---
+
+    """
+
+    def __init__(self, cell_size=128):
+        # Widgets added later are on top
+        self._widgets = []
+        self._order = {}
+        self._count = 0
+        self._grid = SpatialGrid(cell_size)
+        # Widgets that moved or changed their size since the grid was last used.
+        # A widget moved several times in a frame, like by a layout, is only put in the grid once
+        self._moved = set()
+        # True after most widgets moved at once. The grid is built again once they stop moving,
+        # until then the widgets are checked one by one
+        self._stale = False
+        # Widget that got the last mouse button down
+        self._capture = None
+        # Widget under the mouse, told when the mouse leaves it
+        self._hover = None
+        # Position of the mouse in the last mouse event, None until the first one
+        self._pointer = None
+
+    def add(self, *widgets):
+        """
+        #### Description
+        Add widgets to the manager. Widgets added later are on top.
+
+        #### Parameters
+        `widgets: Widget`
+        The widgets to add.
+
+        #### Returns
+        None
+
+        #### Usage
+        `UIManager.add(button, entry)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget._manager is not None:
+                widget._manager.remove(widget)
+            widget._manager = self
+            self._widgets.append(widget)
+            self._order[widget] = self._count
+            self._count += 1
+            self._grid.insert(widget, widget._rect)
+
+    def remove(self, *widgets):
+        """
+        #### Description
+        Remove widgets from the manager. They will check the mouse and keyboard on their own again.
+
+        #### Parameters
+        `widgets: Widget`
+        The widgets to remove.
+
+        #### Returns
+        None
+
+        #### Usage
+        `UIManager.remove(button)`
+
+        ---
+
+        """
+        for widget in widgets:
+            if widget._manager is not self:
+                continue
+            if widget is text_input.get_focus():
+                text_input.set_focus(None)
+            if widget is self._capture:
+                self._capture = None
+            if widget is self._hover:
+                self._hover = None
+            self._widgets.remove(widget)
+            del self._order[widget]
+            self._moved.discard(widget)
+            self._grid.remove(widget)
+            widget._manager = None
+
+    def set_focus(self, widget):
+        """
+        #### Description
+        Give the focus to a widget, so it receives the keyboard events.
+
+        #### Parameters
+        `widget: Widget`
+        The widget to focus, or None to remove the focus.
+
+        #### Returns
+        None
+
+        #### Usage
+        `UIManager.set_focus(entry)`
+
+        ---
+
+        """
+        text_input.set_focus(widget)
+
+    def get_focus(self):
+        """
+        #### Description
+        Get the widget with the focus.
+
+        #### Returns
+        `Widget` or None
+
+        #### Usage
+        `UIManager.get_focus()`
+
+        ---
+
+        """
+        return text_input.get_focus()
+
+    def widget_at(self, pos):
+        """
+        #### Description
+        Get the topmost widget at a position of the screen.
+
+        #### Parameters
+        `pos: tuple`
+        Position in pixels.
+
+        #### Returns
+        `Widget` or None
+
+        #### Usage
+        `UIManager.widget_at(pygame.mouse.get_pos())`
+
+        ---
+
+        """
+        if not self._update_grid():
+            x, y = int(pos[0]), int(pos[1])
+            for widget in reversed(self._widgets):
+                if not widget._disabled and widget._rect.collidepoint(x, y):
+                    return widget
+            return None
+        # Disabled widgets are not hit, the mouse goes to the widgets below them
+        widgets = [widget for widget in self._grid.query_point(pos) if not widget._disabled]
+        if not widgets:
+            return None
+        return max(widgets, key=self._order.__getitem__)
+
+    def widgets_in(self, rect):
+        """
+        #### Description
+        Get the widgets that intersect an area of the screen.
+
+        #### Parameters
+        `rect: pygame.Rect`
+        Area in pixels.
+
+        #### Returns
+        `list` of widgets, from bottom to top.
+
+        #### Usage
+        `UIManager.widgets_in(pygame.Rect(0, 0, 100, 100))`
+
+        ---
+
+        """
+        if not self._update_grid():
+            rect = pg.Rect(rect)
+            return [widget for widget in self._widgets if widget._rect.colliderect(rect)]
+        return sorted(self._grid.query_rect(rect), key=self._order.__getitem__)
+
+    def _reindex(self, widget):
+        # Called by the widgets when they move or change their size
+        self._moved.add(widget)
+
+    def _update_grid(self):
+        # Returns False while the grid is stale and the widgets have to be checked one by one
+        if not self._moved:
+            if self._stale:
+                # The widgets stopped moving, build the grid again in one pass
+                self._grid.rebuild((widget, widget._rect) for widget in self._widgets)
+                self._stale = False
+            return True
+        if len(self._moved) * 2 > len(self._widgets):
+            # Most widgets moved, like while the window is resized. Checking every widget costs less than
+            # building the grid again, which is done once they stop moving
+            self._stale = True
+        elif not self._stale:
+            for widget in self._moved:
+                self._grid.insert(widget, widget._rect)
+        self._moved.clear()
+        return not self._stale
+
+    def process_events(self, events=None):
+        """
+        #### Description
+        Send the events to the widgets.
+
+        #### Parameters
+        `events: list`
+        The events to send. If it is not specified, the pygame event queue is read.
+
+        #### Returns
+        `list` with the events, so the application can handle them too.
+
+        #### Usage
+        ```python
+        for event in UIManager.process_events():
+            if event.type == pygame.QUIT:
+                raise SystemExit
+        ```
+
+        ---
+
+        """
+        if events is None:
+            events = pg.event.get()
+        for event in events:
+            self.handle_event(event)
+        # Send the keys queued by the keyboard backend, if it is used
+        text_input.pump()
+        scheduler.run()
+        return events
+
+    def handle_event(self, event):
+        """
+        #### Description
+        Send a single event to the widget that needs it.
+
+        #### Parameters
+        `event: pygame.event.Event`
+        The event to send.
+
+        #### Returns
+        `bool` True if a widget received the event.
+
+        #### Usage
+        `UIManager.handle_event(event)`
+
+        ---
+
+        """
+        if event.type == pg.MOUSEBUTTONDOWN:
+            self._pointer = event.pos
+            widget = self.widget_at(event.pos)
+            if event.button == 1:
+                # Clicking a widget gives it the focus, clicking anywhere else removes it
+                self._capture = widget
+                self.set_focus(widget)
+            if widget is not None:
+                widget.on_mouse_down(event.pos, event.button)
+                return True
+
+        elif event.type == pg.MOUSEBUTTONUP:
+            self._pointer = event.pos
+            widget = self._capture if event.button == 1 and self._capture else self.widget_at(event.pos)
+            if event.button == 1:
+                self._capture = None
+            if widget is not None and not widget._disabled:
+                widget.on_mouse_up(event.pos, event.button)
+                return True
+
+        elif event.type == pg.MOUSEMOTION:
+            self._pointer = event.pos
+            hover = self.widget_at(event.pos)
+            if hover is not self._hover:
+                if self._hover is not None:
+                    self._hover.on_mouse_leave()
+                self._hover = hover
+            widget = self._capture or hover
+            if widget is not None and not widget._disabled:
+                widget.on_mouse_motion(event.pos, event.buttons)
+                return True
+
+        elif event.type == pg.MOUSEWHEEL:
+            # The wheel event has no position, it goes to the widget under the last position of the mouse
+            widget = self.widget_at(self._pointer if self._pointer is not None else pg.mouse.get_pos())
+            if widget is not None:
+                widget.on_mouse_wheel(event.x, event.y)
+                return True
+
+        elif event.type == pg.KEYDOWN or event.type == pg.TEXTINPUT:
+            return text_input.handle_event(event)
+
+        return False
+
+    def draw(self):
+        """
+        #### Description
+        Display every widget. Only the widgets that changed are composed again.
+
+        #### Returns
+        None
+
+        #### Usage
+        `UIManager.draw()`
+
+        ---
+
+        """
+        for widget in self._widgets:
+            widget.draw()
+
+    def update(self, events=None):
+        """
+        #### Description
+        Send the events to the widgets and display them.
+
+        #### Parameters
+        `events: list`
+        The events to send. If it is not specified, the pygame event queue is read.
+
+        #### Returns
+        `list` with the events, so the application can handle them too.
+
+        #### Usage
+        `UIManager.update()`
+
+        ---
+
+        """
+        events = self.process_events(events)
+        self.draw()
+        return events
@@ -0,0 +1,401 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import importlib
+from collections import deque
+from functools import wraps
+from time import perf_counter
+
+import pygame as pg
+
+from .compositor import Compositor
+from .entry import Entry
+from .fonts import font_cache
+from .group import WidgetGroup
+from .labels import LabelCache
+from .loop import MainLoop
+from .widget import Widget
+
+# Methods of the widgets timed as input handling
+_INPUT = ("on_mouse_down", "on_mouse_up", "on_mouse_motion", "on_mouse_wheel", "on_mouse_leave", "on_key_down",
+          "on_text_input", "on_focus", "on_blur", "_poll_input")
+
+# Parts of a frame, in the order they are shown
+_PHASES = ("input", "label", "compose", "blit")
+_COUNTERS = ("renders", "surfaces", "blits")
+
+
+class Profiler:
+    """
+    ### Description
+    Opt-in instrumentation that records, for every frame and every widget, the time spent
+    handling the input, rendering labels, composing the widget surfaces and blitting them to the screen.
+    It also counts the text renders, the surfaces allocated and the blits to the screen.
+
+    The methods of the widgets, caches and containers are only wrapped while the profiler is enabled,
+    and the original methods are put back when it is disabled, so a disabled profiler costs nothing.
+    A frame ends every time a `MainLoop` updates the screen. Other loops end their frames with `end_frame()`.
+
+    ### Usage
+    `Profiler(history=120)`
+
+    #### Parameters
+    `history: int`
+    Number of frames kept.
+
+    ---
+
+    """
+
+    def __init__(self, history=120):
+        if type(history) != int:
+            raise TypeError("history must be an integer, not", type(history))
+        elif history < 1:
+            raise ValueError("history must be greater than 0.")
+        self._frames = deque(maxlen=history)
+        # Original methods, to restore them when the profiler is disabled
+        self._patches = []
+        # Time spent in the nested sections of each running section, and the widget it belongs to
+        self._stack = []
+        self._new_frame()
+
+    def _new_frame(self):
+        self._frame = dict.fromkeys(_PHASES + _COUNTERS, 0)
+        self._widgets = {}
+        self._start = perf_counter()
+
+    def is_enabled(self):
+        """Return True if the profiler is recording"""
+        return bool(self._patches)
+
+    def enable(self):
+        """
+        #### Description
+        Start recording. Every pgui module is imported so all the widget classes can be instrumented.
+        Widget classes defined after this call are not instrumented.
+
+        #### Returns
+        None
+
+        #### Usage
+        `pgui.profiler.enable()`
+
+        ---
+
+        """
+        if self._patches:
+            return
+        from . import _submodules
+        for name in _submodules:
+            importlib.import_module("." + name, __package__)
+
+        # Every widget class, so the methods they override are wrapped too
+        classes = [Widget]
+        for cls in classes:
+            classes.extend(cls.__subclasses__())
+        for cls in classes:
+            for name in _INPUT:
+                self._wrap(cls, name, "input")
+            self._wrap(cls, "_compose", "compose")
+        self._wrap(Widget, "_begin_compose", "compose", lambda widget: widget._surface, self._count_surface)
+        # Every blit to the screen is timed for the widget blitted
+        self._wrap(Widget, "draw", "blit", after=self._count_blit)
+        self._wrap(Compositor, "_blit_widget", "blit", after=self._count_blit, target=lambda args: args[0])
+        self._wrap(Compositor, "_restore", "blit", after=self._count_background, target=lambda args: None)
+        self._patches.append((WidgetGroup, "_blit_widgets", WidgetGroup.__dict__["_blit_widgets"]))
+        WidgetGroup._blit_widgets = self._blit_widgets
+        self._wrap(LabelCache, "render", "label", lambda cache: cache._misses, self._count_labels)
+        self._wrap(Entry, "_get_window", "label", lambda entry: entry._window, self._count_window)
+
+        # The frames end when the main loop updates the screen
+        function = MainLoop.__dict__["_draw_frame"]
+        self._patches.append((MainLoop, "_draw_frame", function))
+        MainLoop._draw_frame = self._end_frame_after(function)
+        self._new_frame()
+
+    def disable(self):
+        """
+        #### Description
+        Stop recording and put the original methods back. The recorded frames are kept.
+
+        #### Returns
+        None
+
+        #### Usage
+        `pgui.profiler.disable()`
+
+        ---
+
+        """
+        for owner, name, function in reversed(self._patches):
+            setattr(owner, name, function)
+        self._patches = []
+        self._stack = []
+
+    def reset(self):
+        """
+        #### Description
+        Forget the recorded frames.
+
+        #### Returns
+        None
+
+        #### Usage
+        `pgui.profiler.reset()`
+
+        ---
+
+        """
+        self._frames.clear()
+        self._new_frame()
+
+    def _wrap(self, owner, name, phase, before=None, after=None, target=None):
+        # Replace a method defined by the class with one that times it.
+        # before(obj) is called before the method, and its result is passed to after(obj, value, result).
+        # target(args) returns the widget the time belongs to, if it is not the object of the method
+        function = owner.__dict__.get(name)
+        if function is None:
+            return
+        stack = self._stack
+        record = self._record
+
+        @wraps(function)
+        def wrapper(obj, *args, **kwargs):
+            # Labels and blits done for a widget are counted for that widget
+            if target is not None:
+                widget = target(args)
+            else:
+                widget = obj if isinstance(obj, Widget) else (stack[-1][1] if stack else None)
+            value = before(obj) if before is not None else None
+            section = [0.0, widget]
+            stack.append(section)
+            start = perf_counter()
+            try:
+                result = function(obj, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][0] += elapsed
+                # Only the time not spent in the nested sections
+                record(widget, phase, elapsed - section[0])
+            if after is not None:
+                after(obj, value, result)
+            return result
+
+        self._patches.append((owner, name, function))
+        setattr(owner, name, wrapper)
+
+    def _record(self, widget, phase, elapsed):
+        self._frame[phase] += elapsed
+        if widget is not None:
+            times = self._widgets.get(widget)
+            if times is None:
+                times = self._widgets[widget] = dict.fromkeys(_PHASES, 0)
+            times[phase] += elapsed
+
+    def _count_surface(self, widget, surface, result):
+        if widget._surface is not surface:
+            self._frame["surfaces"] += 1
+
+    def _count_blit(self, obj, value, result):
+        self._frame["blits"] += 1
+
+    def _count_background(self, compositor, value, result):
+        # A background color is filled, not blitted
+        if isinstance(compositor._background, pg.Surface):
+            self._frame["blits"] += 1
+
+    def _blit_widgets(self, screen, widgets):
+        # Replaces WidgetGroup._blit_widgets, each widget is blitted on its own to time it.
+        # It is a bound method of the profiler, so it does not get the group
+        for widget in widgets:
+            start = perf_counter()
+            screen.blit(widget._surface, widget._bounds)
+            elapsed = perf_counter() - start
+            if self._stack:
+                self._stack[-1][0] += elapsed
+            self._record(widget, "blit", elapsed)
+            self._frame["blits"] += 1
+
+    def _count_labels(self, cache, misses, result):
+        # Every label missing from the cache is rendered into a new surface
+        rendered = cache._misses - misses
+        self._frame["renders"] += rendered
+        self._frame["surfaces"] += rendered
+
+    def _count_window(self, entry, window, result):
+        if result is not window:
+            self._frame["renders"] += 1
+            self._frame["surfaces"] += 1
+
+    def _end_frame_after(self, function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            result = function(*args, **kwargs)
+            self.end_frame()
+            return result
+
+        return wrapper
+
+    def end_frame(self):
+        """
+        #### Description
+        End the current frame and start a new one.
+        A `MainLoop` calls it when it updates the screen. Call it once per frame if you write your own loop.
+
+        #### Returns
+        None
+
+        #### Usage
+        `pgui.profiler.end_frame()`
+
+        ---
+
+        """
+        frame = self._frame
+        frame["time"] = perf_counter() - self._start
+        frame["widgets"] = self._widgets
+        self._frames.append(frame)
+        self._new_frame()
+
+    @staticmethod
+    def _summary(frame):
+        # Frame record with the times in milliseconds and the slowest widgets first
+        summary = {"time": frame["time"] * 1000}
+        summary.update((phase, frame[phase] * 1000) for phase in _PHASES)
+        summary.update((counter, frame[counter]) for counter in _COUNTERS)
+        summary["widgets"] = Profiler._widget_list(frame["widgets"].items(), 1)
+        return summary
+
+    @staticmethod
+    def _widget_list(items, frames):
+        widgets = []
+        for widget, times in items:
+            entry = {"widget": widget}
+            entry.update((phase, times[phase] * 1000 / frames) for phase in _PHASES)
+            entry["total"] = sum(times.values()) * 1000 / frames
+            widgets.append(entry)
+        widgets.sort(key=lambda entry: entry["total"], reverse=True)
+        return widgets
+
+    def stats(self):
+        """
+        #### Description
+        Get the recorded statistics. Times are in milliseconds.
+
+        #### Returns
+        `dict` with:
+        - `enabled`: True if the profiler is recording.
+        - `frames`: number of frames recorded.
+        - `last` and `slowest`: the last and the slowest frame, or None. Each one has its `time`, the time spent in
+        `input`, `label`, `compose` and `blit`, the number of `renders`, `surfaces` and `blits`, and the
+        `widgets` with their times, slowest first.
+        - `average`: the same values averaged over the recorded frames, with the average time of each widget per frame.
+
+        #### Usage
+        `pgui.stats()["slowest"]["widgets"][0]`
+
+        ---
+
+        """
+        frames = list(self._frames)
+        stats = {"enabled": self.is_enabled(), "frames": len(frames), "last": None, "slowest": None, "average": None}
+        if not frames:
+            return stats
+        stats["last"] = self._summary(frames[-1])
+        stats["slowest"] = self._summary(max(frames, key=lambda frame: frame["time"]))
+
+        totals = {}
+        for frame in frames:
+            for widget, times in frame["widgets"].items():
+                total = totals.setdefault(widget, dict.fromkeys(_PHASES, 0))
+                for phase in _PHASES:
+                    total[phase] += times[phase]
+        average = {"time": sum(frame["time"] for frame in frames) * 1000 / len(frames)}
+        average.update((phase, sum(frame[phase] for frame in frames) * 1000 / len(frames)) for phase in _PHASES)
+        average.update((counter, sum(frame[counter] for frame in frames) / len(frames)) for counter in _COUNTERS)
+        average["widgets"] = self._widget_list(totals.items(), len(frames))
+        stats["average"] = average
+        return stats
+
+    def draw_overlay(self, screen, pos=(0, 0), rows=5):
+        """
+        #### Description
+        Draw the statistics of the last frame and its slowest widgets on the screen.
+        Call it after drawing the widgets and before updating the screen.
+
+        #### Parameters
+        `screen: pygame.Surface`
+        Surface to draw on.
+
+        `pos: tuple`
+        Position of the top left corner of the overlay.
+
+        `rows: int`
+        Number of widgets shown.
+
+        #### Returns
+        `pygame.Rect` with the area of the screen covered by the overlay.
+
+        #### Usage
+        ```python
+        rects = compositor.draw()
+        rects.append(pgui.profiler.draw_overlay(screen))
+        pygame.display.update(rects)
+        ```
+
+        ---
+
+        """
+        if type(rows) != int:
+            raise TypeError("rows must be an integer, not", type(rows))
+        lines = ["no frames recorded"]
+        if self._frames:
+            frame = self._summary(self._frames[-1])
+            lines = [
+                "frame {time:.2f} ms  input {input:.2f}  label {label:.2f}  compose {compose:.2f}  blit {blit:.2f}".format(**frame),
+                "renders {renders}  surfaces {surfaces}  blits {blits}".format(**frame),
+            ]
+            for entry in frame["widgets"][:rows]:
+                widget = entry["widget"]
+                lines.append(f"{type(widget).__name__} {tuple(widget._bounds.topleft)}  {entry['total']:.2f} ms")
+
+        # The overlay is rendered directly, so it is not counted and does not fill the label cache
+        font = font_cache.get(None, 18)
+        labels = [font.render(line, True, (255, 255, 255)) for line in lines]
+        rect = pg.Rect(pos, (max(label.get_width() for label in labels) + 8,
+                             sum(label.get_height() for label in labels) + 8))
+        background = pg.Surface(rect.size, pg.SRCALPHA)
+        background.fill((0, 0, 0, 180))
+        screen.blit(background, rect)
+        y = rect.top + 4
+        for label in labels:
+            screen.blit(label, (rect.left + 4, y))
+            y += label.get_height()
+        return rect
+
+
+# Profiler shared by every widget
+profiler = Profiler()
+
+
+def stats():
+    """
+    #### Description
+    Get the statistics recorded by `pgui.profiler`, see `Profiler.stats()`.
+    `pgui.profiler.enable()` starts recording.
+
+    #### Usage
+    `pgui.stats()`
+
+    ---
+
+    """
+    return profiler.stats()
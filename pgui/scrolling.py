@@ -0,0 +1,98 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from .slider import Slider
+from .widget import Widget
+
+
+class _Scrollable(Widget):
+    # Base of the widgets that scroll their content vertically with a scrollbar on the right, like ListView and
+    # TextArea. The subclasses have a set_scroll(scroll) method, and give the scroll limit with _max_scroll(),
+    # the pixels scrolled by a step of the mouse wheel with _wheel_step(), and what a click on the content does
+    # with _click(pos)
+    __slots__ = ("_scroll", "_scrollbar", "_clicked")
+
+    # Width in pixels of the scrollbar
+    scrollbar_width = 15
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        # Scroll in pixels from the top of the content
+        self._scroll = 0
+        # The scrollbar is composed with the widget, it is not drawn on its own.
+        # It is placed with _place_scrollbar() once the widget has its rect
+        self._scrollbar = Slider(parent, orientation="vertical", max=1)
+        self._scrollbar.set_width(self.scrollbar_width)
+        self._clicked = False
+
+    def _max_scroll(self):
+        raise NotImplementedError
+
+    def _wheel_step(self):
+        raise NotImplementedError
+
+    def _click(self, pos):
+        pass
+
+    def _place_scrollbar(self):
+        # Fit the scrollbar to the right side of the widget, after it moved or changed its size
+        rect = self._rect
+        self._scrollbar.set_length(max(rect.height - 15, 1))
+        self._scrollbar.move(rect.x + rect.width - self.scrollbar_width, rect.y)
+
+    def _update_scrollbar(self):
+        scrollbar = self._scrollbar
+        scrollbar.max = max(self._max_scroll(), 1)
+        if scrollbar.mark != self._scroll:
+            scrollbar.set_mark(self._scroll)
+
+    def _scrollbar_moved(self):
+        # Scroll the content to the mark of the scrollbar
+        scrollbar = self._scrollbar
+        if scrollbar._dirty:
+            self.mark_dirty()
+        scroll = min(scrollbar.mark, self._max_scroll())
+        if scroll != self._scroll:
+            self._scroll = scroll
+            self.mark_dirty()
+
+    def _draw_scrollbar(self, image):
+        scrollbar = self._scrollbar
+        scrollbar.refresh()
+        image.blit(scrollbar._surface, self._local(scrollbar._bounds))
+
+    def _poll_input(self, mousepos, pressed):
+        p1 = pressed[0]
+        scrollbar = self._scrollbar
+        if scrollbar._dragging or (p1 and scrollbar._rect.collidepoint(mousepos)):
+            scrollbar._poll_input(mousepos, pressed)
+            self._scrollbar_moved()
+        elif p1 and not self._clicked:
+            self._click(mousepos)
+        self._clicked = p1
+
+    def on_mouse_down(self, pos, button):
+        if button != 1:
+            return
+        if self._scrollbar._rect.collidepoint(pos):
+            self._scrollbar.on_mouse_down(pos, button)
+            self._scrollbar_moved()
+        else:
+            self._click(pos)
+
+    def on_mouse_motion(self, pos, buttons):
+        if self._scrollbar._dragging:
+            self._scrollbar.on_mouse_motion(pos, buttons)
+            self._scrollbar_moved()
+
+    def on_mouse_up(self, pos, button):
+        self._scrollbar.on_mouse_up(pos, button)
+
+    def on_mouse_wheel(self, x, y):
+        self.set_scroll(self._scroll - y * self._wheel_step())
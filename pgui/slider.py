@@ -9,18 +9,49 @@
 
 import pygame as pg
 
+from .attributes import Attribute
+from .fonts import get_font
+from .labels import LabelLayout, render_label
+from .style import Style
+from .widget import Widget
 
-class Slider:
+
+class Slider(Widget):
     """
     Slider widget.
     It can be used to select a value from a range from 0 to a maximum value
     """
 
+    # ------- ATTRIBUTES -------
+    max = Attribute()
+    mark = Attribute()
+    border_width = Attribute()
+    border_color = Attribute()
+    pointer_color = Attribute()
+    pointer_border_color = Attribute()
+    pointer_border_width = Attribute()
+    bg_color = Attribute()
+    label_padding = Attribute()
+    label_side = Attribute()
+    label_align = Attribute()
+    font_name = Attribute()
+    font_size = Attribute()
+    font_color = Attribute()
+    # --------------------------
+
+    __slots__ = ("_max", "_mark", "_border_width", "_border_color", "_pointer_color", "_pointer_border_color",
+                 "_pointer_border_width", "_bg_color", "_label_padding", "_label_side", "_label_align",
+                 "_orientation", "_length", "_size", "_dragging", "_width", "_x", "_y", "_pos", "_rect", "_prect",
+                 "_text", "_font_size", "_font_color", "_font_name", "_label", "_label_layout")
+
+    style = Style(border_width=0, border_color=(0, 0, 0), pointer_color=(128, 128, 128), pointer_border_color=(0, 0, 0),
+                  pointer_border_width=0, bg_color=(255, 255, 255), label_padding=3, label_side="top", label_align="left",
+                  font_name="Arial", font_size=20, font_color=(0, 0, 0))
+
     def __init__(self, parent, *, x=0, y=0, orientation="horizontal", length=200, max=100):
         """Initialize the Widget"""
 
-        self.parent = parent
-        self._screen = parent.screen
+        super().__init__(parent)
         self._orientation = orientation
         self._length = length
         self._size = length + 15
@@ -33,49 +64,33 @@ class Slider:
         # ------- ATTRIBUTES -------
         self.max = max
         self.mark = 0
-        self.border_width = 0
-        self.border_color = (0, 0, 0)
-        self.pointer_color = (128, 128, 128)
-        self.pointer_border_color = (0, 0, 0)
-        self.pointer_border_width = 0
-        self.bg_color = (255, 255, 255)
-        self.label_padding = 3
-        self.label_side = "top"
-        self.label_align = "left"
+        # The colors, the borders, the font and the label position come from Slider.style
         # --------------------------
 
         if self._orientation == "vertical":
             self._rect = pg.Rect(self._pos, (self._width, self._size))
-            self._pointer = pg.Surface((self._width, 15)).convert_alpha()
+            self._prect = pg.Rect(self._pos, (self._width, 15))
         elif self._orientation == "horizontal":
             self._rect = pg.Rect(self._pos, (self._size, self._width))
-            self._pointer = pg.Surface((15, self._width)).convert_alpha()
+            self._prect = pg.Rect(self._pos, (15, self._width))
         else:
             print("Orientation must be either \"vertical\" or \"horizontal\"")
             raise SystemExit
 
-        self._image = pg.Surface(self._rect.size).convert_alpha()
-        self._image.fill((255, 255, 255))
-        self._pointer.fill((150, 150, 150))
-        self._prect = self._pointer.get_rect()
-        self._prect.topleft = self._rect.topleft
-
         self._text = ""
-        self._font_size = 20
-        self._font_color = (0, 0, 0)
-        self._font = pg.font.SysFont("Arial", self._font_size)
-        self._font_name = "Arial"
-        self._label = self._font.render(self._text, 1, self._font_color)
+        # The label is taken from the shared label cache when the slider is composed
+        self._label = None
+        # Position of the label, computed when something it depends on changes
+        self._label_layout = LabelLayout()
 
-    def update(self):
-        """Update the widget"""
-        mousepos = pg.mouse.get_pos()
-        p1, p2, p3 = pg.mouse.get_pressed()
+    def _poll_input(self, mousepos, pressed):
+        p1, p2, p3 = pressed
 
-        self.max = int(self.max)
+        if type(self.max) != int:
+            self.max = int(self.max)
 
-        self._pos = (self._x, self._y)
-        self._x, self._y = self._pos
+        # Remember where the pointer was to know if the slider has to be composed again
+        pointer = self._prect.topleft
 
         if self._prect.collidepoint(mousepos) and p1:
             self._dragging = True
@@ -86,7 +101,6 @@ class Slider:
             elif self._orientation == "horizontal":
                 self._prect.centerx = mousepos[0]
 
-        self._screen.blit(self._image, self._pos)
         if self._orientation == "vertical":
             if self._dragging:
                 if self._prect.y >= self._y:
@@ -117,46 +131,90 @@ class Slider:
 
                 if not p1:
                     self._dragging = False
-        self._image.fill(self.bg_color)
-        pg.draw.rect(self._screen, self.pointer_color, self._prect)
 
+        if self._prect.topleft != pointer:
+            self.mark_dirty()
+
+        self._update_mark()
+
+    def on_mouse_down(self, pos, button):
+        if button == 1:
+            self._dragging = True
+            self._drag_pointer(pos)
+
+    def on_mouse_motion(self, pos, buttons):
+        if self._dragging:
+            self._drag_pointer(pos)
+
+    def on_mouse_up(self, pos, button):
+        if button == 1:
+            self._dragging = False
+
+    def _drag_pointer(self, pos):
+        # Center the pointer on the mouse without leaving the slider
+        pointer = self._prect.topleft
+        if type(self.max) != int:
+            self.max = int(self.max)
+        if self._orientation == "vertical":
+            self._prect.centery = pos[1]
+            self._prect.y = min(max(self._prect.y, self._y), self._y + self._length)
+        elif self._orientation == "horizontal":
+            self._prect.centerx = pos[0]
+            self._prect.x = min(max(self._prect.x, self._x), self._x + self._length)
+        if self._prect.topleft != pointer:
+            self.mark_dirty()
+            self._update_mark()
+
+    def _update_mark(self):
         if self._orientation == "horizontal":
             self.mark = round(((self._prect.x - self._x) / self._length) * self.max)
         elif self._orientation == "vertical":
             self.mark = round(((self._prect.y - self._y) / self._length) * self.max)
 
+    def _compose(self):
+        # Only show the label if the text string is not empty
+        show_label = self._text.strip() != ""
+        bounds = self._rect.union(self._prect)
+        if show_label:
+            self._label = render_label(self.font_name, self.font_size, self._text, self.font_color)
+            label_pos = self._label_layout.place(self._rect, self._label, self.label_side, self.label_align,
+                                                 self.label_padding, self.font_size)
+            bounds.union_ip(self._label.get_rect(topleft=label_pos))
+        image = self._begin_compose(bounds)
+        prect = self._local(self._prect)
+
+        image.fill(self.bg_color, self._local(self._rect))
+        pg.draw.rect(image, self.pointer_color, prect)
+
         if self.pointer_border_width > 0:
-            pg.draw.rect(self._screen, self.pointer_border_color, self._prect, self.pointer_border_width)
+            pg.draw.rect(image, self.pointer_border_color, prect, self.pointer_border_width)
 
         if self.border_width > 0:
-            pg.draw.rect(self._screen, self.border_color, self._rect, self.border_width)
-
-        if self._text.strip() != "":
-            if self.label_side == "top":
-                if self.label_align == "left":
-                    self._screen.blit(self._label, (self._rect.x, self._rect.y - self._font_size - self.label_padding))
-                elif self.label_align == "center":
-                    self._screen.blit(self._label, (
-                        self._rect.centerx - self._label.get_rect().width / 2, self._rect.y - self._font_size - self.label_padding))
-                elif self.label_align == "right":
-                    self._screen.blit(self._label, (
-                        self._rect.x + self._rect.width - self._label.get_rect().width, self._rect.y - self._font_size - self.label_padding))
-            if self.label_side == "bottom":
-                if self.label_align == "left":
-                    self._screen.blit(self._label, (self._rect.x, self._rect.y +
-                                                    self._rect.height + self.label_padding))
-                elif self.label_align == "center":
-                    self._screen.blit(self._label, (
-                        self._rect.centerx - self._label.get_rect().width / 2, self._rect.y + self._rect.height + self.label_padding))
-                elif self.label_align == "right":
-                    self._screen.blit(self._label, (
-                        self._rect.x + self._rect.width - self._label.get_rect().width, self._rect.y + self._rect.height + self.label_padding))
-            if self.label_side == "left":
-                self._screen.blit(self._label, (self._rect.x - self._label.get_rect().width - self.label_padding,
-                                                self._rect.y + self._rect.height - self._label.get_rect().height))
-            if self.label_side == "right":
-                self._screen.blit(self._label, (self._rect.x + self._rect.width + self.label_padding,
-                                                self._rect.y + self._rect.height - self._label.get_rect().height))
+            pg.draw.rect(image, self.border_color, self._local(self._rect), self.border_width)
+
+        if show_label:
+            self._blit_outside(self._label, label_pos)
+
+    def _size_hint(self):
+        # The length is the one the slider had when it was added to the layout
+        if self._orientation == "vertical":
+            return self._width, None
+        return None, self._width
+
+    def _label_margins(self, width, height):
+        if self._text.strip() == "":
+            return 0, 0, 0, 0
+        return LabelLayout.margins((width, height), self._text, self.font_name, self.font_size,
+                                   self.label_side, self.label_align, self.label_padding)
+
+    def _layout_resize(self, width, height):
+        # Only the length changes, the pointer takes 15 pixels of it
+        length = (height if self._orientation == "vertical" else width) - 15
+        if length > 0 and length != self._length:
+            self.set_length(length)
+            # Keep the pointer on the mark
+            self.set_mark(self.mark)
+        return self._rect.size
 
     def set_label(self, text):
         """
@@ -177,7 +235,8 @@ class Slider:
 
         """
         self._text = text
-        self._label = self._font.render(text, 1, self._font_color)
+        self.mark_dirty()
+        self._hint_changed()
 
     def set_mark(self, mark):
         if mark not in range(0, self.max+1):
@@ -188,6 +247,7 @@ class Slider:
                 self._prect.x = round(self._x + (self.mark / self.max) * self._length)
             if self._orientation == "vertical":
                 self._prect.y = round(self._y + (self.mark / self.max) * self._length)
+            self.mark_dirty()
 
     def set_font(self, font):
         """
@@ -204,11 +264,8 @@ class Slider:
         #### Usage
         `Slider.set_font("Arial")`
         """
-        self._font_name = font
-        try:
-            self._font = pg.font.Font(font, self._font_size)
-        except:
-            self._font = pg.font.SysFont(font, self._font_size)
+        get_font(font, self.font_size)
+        self.font_name = font
 
     def set_font_size(self, size):
         """
@@ -229,15 +286,7 @@ class Slider:
 
         """
         if type(size) == int:
-            try:
-                self._font = pg.font.Font(self._font_name, size)
-
-            # If it is installed in the system, use the system one
-            except FileNotFoundError:
-                self._font = pg.font.SysFont(self._font_name, size)
-                # Store the font size in a variable
-                self._font_size = size
-            self._label = self._font.render(self._text, 1, self._font_color)
+            self.font_size = size
         else:
             raise TypeError(f"size must be an integer, not {type(size)}")
 
@@ -261,9 +310,8 @@ class Slider:
         """
         if type(color) == tuple:
             if len(color) == 3:
-                # Change the font color and re-render the label
-                self._font_color = color
-                self._label = self._font.render(self._text, 1, color)
+                # Change the font color, the label is rendered again when the slider is composed
+                self.font_color = color
             else:
                 raise ValueError("Expected 3 values, got", len(color))
         else:
@@ -290,13 +338,13 @@ class Slider:
         self._width = width
         if self._orientation == "vertical":
             self._rect = pg.Rect(self._pos, (self._width, self._size))
-            self._pointer = pg.Surface((self._width, 15)).convert_alpha()
+            self._prect = pg.Rect(self._pos, (self._width, 15))
         elif self._orientation == "horizontal":
             self._rect = pg.Rect(self._pos, (self._size, self._width))
-            self._pointer = pg.Surface((15, self._width)).convert_alpha()
-        self._image = pg.Surface(self._rect.size).convert_alpha()
-        self._prect = self._pointer.get_rect()
-        self._prect.topleft = self._pos
+            self._prect = pg.Rect(self._pos, (15, self._width))
+        self.mark_dirty()
+        self._geometry_changed()
+        self._hint_changed()
 
     def get_length(self):
         """
@@ -341,11 +389,10 @@ class Slider:
         self._size = length + 15
         if self._orientation == "vertical":
             self._rect = pg.Rect(self._pos, (self._width, self._size))
-            self._pointer = pg.Surface((self._width, 15)).convert_alpha()
         elif self._orientation == "horizontal":
             self._rect = pg.Rect(self._pos, (self._size, self._width))
-            self._pointer = pg.Surface((15, self._width)).convert_alpha()
-        self._image = pg.Surface(self._rect.size).convert_alpha()
+        self.mark_dirty()
+        self._geometry_changed()
 
     def move(self, x, y):
         """
@@ -376,3 +423,4 @@ class Slider:
         self._rect.topleft = self._pos
         self._prect.topleft = self._pos
         self.set_mark(m)
+        self._geometry_changed()
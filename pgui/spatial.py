@@ -0,0 +1,234 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from collections import defaultdict
+from itertools import product
+
+import pygame as pg
+
+
+class SpatialGrid:
+    """
+    ### Description
+    Uniform grid used to find the objects at a point or inside an area without checking all of them.
+    Each object is stored in every cell its rect touches, so a query only looks at the objects
+    in the cells it covers.
+
+    ### Usage
+    `SpatialGrid(cell_size=128)`
+
+    #### Parameters
+    `cell_size: int`
+    Width and height of the cells in pixels. It works best when it is close to the size of the objects.
+
+    ---
+
+    """
+
+    def __init__(self, cell_size=128):
+        if type(cell_size) != int:
+            raise TypeError("cell_size must be an integer, not", type(cell_size))
+        elif cell_size < 1:
+            raise ValueError("cell_size must be greater than 0.")
+        self._cell_size = cell_size
+        # Objects in each cell, and rect and cells covered by each object
+        self._cells = {}
+        self._rects = {}
+        self._spans = {}
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, obj):
+        return obj in self._rects
+
+    def _span_of(self, rect):
+        # First and last column and row of the cells covered by a rect.
+        # Empty rects are still stored in the cell of their top left corner
+        x, y, width, height = rect
+        size = self._cell_size
+        return (x // size, (x + width - 1 if width > 0 else x) // size,
+                y // size, (y + height - 1 if height > 0 else y) // size)
+
+    @staticmethod
+    def _cells_of(span):
+        left, right, top, bottom = span
+        return product(range(left, right + 1), range(top, bottom + 1))
+
+    def insert(self, obj, rect):
+        """
+        #### Description
+        Add an object to the grid, or move it if it is already there.
+
+        #### Parameters
+        `obj`
+        The object to store.
+
+        `rect: pygame.Rect`
+        Area covered by the object.
+
+        #### Returns
+        None
+
+        #### Usage
+        `SpatialGrid.insert(widget, widget.get_bounds())`
+
+        ---
+
+        """
+        rect = pg.Rect(rect)
+        span = self._span_of(rect)
+        if obj in self._rects:
+            # Moving inside the same cells only changes the rect
+            if self._spans[obj] == span:
+                self._rects[obj] = rect
+                return
+            self.remove(obj)
+        cells = self._cells
+        for key in self._cells_of(span):
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = set()
+            cell.add(obj)
+        self._rects[obj] = rect
+        self._spans[obj] = span
+
+    def remove(self, obj):
+        """
+        #### Description
+        Remove an object from the grid.
+
+        #### Parameters
+        `obj`
+        The object to remove.
+
+        #### Returns
+        None
+
+        #### Usage
+        `SpatialGrid.remove(widget)`
+
+        ---
+
+        """
+        if obj not in self._rects:
+            return
+        cells = self._cells
+        for key in self._cells_of(self._spans.pop(obj)):
+            cell = cells[key]
+            cell.discard(obj)
+            if not cell:
+                del cells[key]
+        del self._rects[obj]
+
+    def query_point(self, pos):
+        """
+        #### Description
+        Get the objects whose rect contains a point.
+
+        #### Parameters
+        `pos: tuple`
+        Position in pixels.
+
+        #### Returns
+        `list` with the objects found, in no particular order.
+
+        #### Usage
+        `SpatialGrid.query_point((120, 40))`
+
+        ---
+
+        """
+        x, y = int(pos[0]), int(pos[1])
+        cell = self._cells.get((x // self._cell_size, y // self._cell_size))
+        if not cell:
+            return []
+        return [obj for obj in cell if self._rects[obj].collidepoint(x, y)]
+
+    def query_rect(self, rect):
+        """
+        #### Description
+        Get the objects whose rect intersects an area.
+
+        #### Parameters
+        `rect: pygame.Rect`
+        Area to look in.
+
+        #### Returns
+        `set` with the objects found.
+
+        #### Usage
+        `SpatialGrid.query_rect(pygame.Rect(0, 0, 100, 100))`
+
+        ---
+
+        """
+        rect = pg.Rect(rect)
+        found = set()
+        for key in self._cells_of(self._span_of(rect)):
+            cell = self._cells.get(key)
+            if cell:
+                found.update(cell)
+        return {obj for obj in found if self._rects[obj].colliderect(rect)}
+
+    def rebuild(self, items):
+        """
+        #### Description
+        Replace every object in the grid at once. It is faster than clearing the grid
+        and inserting the objects one by one, like when most of them moved.
+
+        #### Parameters
+        `items`
+        Iterable of `(obj, rect)` pairs.
+
+        #### Returns
+        None
+
+        #### Usage
+        `SpatialGrid.rebuild((widget, widget.get_bounds()) for widget in widgets)`
+
+        ---
+
+        """
+        size = self._cell_size
+        cells = defaultdict(set)
+        rects = {}
+        spans = {}
+        for obj, rect in items:
+            rect = pg.Rect(rect)
+            x, y, width, height = rect
+            left = x // size
+            right = (x + width - 1 if width > 0 else x) // size
+            top = y // size
+            bottom = (y + height - 1 if height > 0 else y) // size
+            rows = range(top, bottom + 1)
+            for column in range(left, right + 1):
+                for row in rows:
+                    cells[column, row].add(obj)
+            rects[obj] = rect
+            spans[obj] = (left, right, top, bottom)
+        # A plain dict, so looking up an empty cell does not add it
+        self._cells = dict(cells)
+        self._rects = rects
+        self._spans = spans
+
+    def clear(self):
+        """
+        #### Description
+        Remove every object from the grid.
+
+        #### Usage
+        `SpatialGrid.clear()`
+
+        ---
+
+        """
+        self._cells.clear()
+        self._rects.clear()
+        self._spans.clear()
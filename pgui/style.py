@@ -0,0 +1,255 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from weakref import WeakSet
+
+from .attributes import Attribute, _missing
+
+
+class Style:
+    """
+    ### Description
+    Default values of the attributes of a kind of widget, shared by all of them.
+    A widget only stores the attributes that were given a value, the rest are read from the style,
+    so thousands of widgets don't keep a copy of each default.
+    Styles can't be changed, use `copy()` to make a new one.
+
+    ### Usage
+    `Style(**values)`
+
+    #### Parameters
+    `values`
+    Default value of each attribute, such as `bg_color=(255, 255, 255)`.
+
+    ---
+
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, **values):
+        self._values = values
+
+    def __contains__(self, name):
+        return name in self._values
+
+    def get(self, name, default=None):
+        """
+        #### Description
+        Get the default value of an attribute.
+
+        #### Parameters
+        `name: str`
+        Name of the attribute.
+
+        `default`
+        Value returned if the style does not have the attribute.
+
+        #### Returns
+        The value of the attribute.
+
+        #### Usage
+        `Style.get("bg_color")`
+
+        ---
+
+        """
+        return self._values.get(name, default)
+
+    def copy(self, **values):
+        """
+        #### Description
+        Get a new style with the same values, changing some of them.
+
+        #### Parameters
+        `values`
+        Values to change.
+
+        #### Returns
+        `Style`
+
+        #### Usage
+        `CheckBox.style.copy(check_color=(200, 0, 0))`
+
+        ---
+
+        """
+        return Style(**{**self._values, **values})
+
+
+class Theme:
+    """
+    ### Description
+    Set of styles for the widget classes, applied to every widget at once with `set_theme()`.
+    Each style only needs the values that change. The values for "Widget" are used by every class,
+    the values for a class are also used by its subclasses.
+
+    Widgets keep the values they were given, so they override the theme.
+    Only the widgets that use a changed value are composed again, and each different label is rendered once
+    through the shared label cache.
+
+    ### Usage
+    `Theme(**styles)`
+
+    #### Parameters
+    `styles: Style or dict`
+    Values for each widget class, by class name, such as `Button=Style(bg_color=(40, 40, 40))`.
+
+    ---
+
+    """
+
+    __slots__ = ("_styles",)
+
+    def __init__(self, **styles):
+        self._styles = {}
+        for name, style in styles.items():
+            if type(style) == dict:
+                style = Style(**style)
+            elif not isinstance(style, Style):
+                raise TypeError(f"The style of {name} must be a Style or a dict, not", type(style))
+            self._styles[name] = style
+
+    def get(self, name):
+        """
+        #### Description
+        Get the style of a widget class.
+
+        #### Parameters
+        `name: str`
+        Name of the class, such as "Button".
+
+        #### Returns
+        `Style` or None if the theme does not change the class.
+
+        #### Usage
+        `Theme.get("Button")`
+
+        ---
+
+        """
+        return self._styles.get(name)
+
+    def copy(self, **styles):
+        """
+        #### Description
+        Get a new theme with the same styles, changing some of them.
+
+        #### Parameters
+        `styles: Style or dict`
+        Styles to change. They replace the style of the class in this theme.
+
+        #### Returns
+        `Theme`
+
+        #### Usage
+        `dark.copy(Button={"bg_color": (0, 0, 80)})`
+
+        ---
+
+        """
+        return Theme(**{**self._styles, **styles})
+
+    def _style(self, cls):
+        # Style of a widget class: its own style with the values of the theme for the class and its bases
+        values = dict(cls._base_style._values)
+        for base in reversed(cls.__mro__):
+            style = self._styles.get(base.__name__)
+            if style is not None:
+                for name, value in style._values.items():
+                    attribute = getattr(cls, name, None)
+                    if isinstance(attribute, Attribute):
+                        attribute.check(value)
+                values.update(style._values)
+        return Style(**values)
+
+
+_theme = None
+# Every live widget, composed again when the theme changes
+_widgets = WeakSet()
+
+
+def get_theme():
+    """
+    #### Description
+    Get the theme used by the widgets.
+
+    #### Returns
+    `Theme` or None.
+
+    #### Usage
+    `pgui.get_theme()`
+
+    ---
+
+    """
+    return _theme
+
+
+def set_theme(theme):
+    """
+    #### Description
+    Change the style of every widget class. The widgets that use a changed value are composed again
+    the next time they are drawn, and laid out again if their size changed.
+
+    #### Parameters
+    `theme: Theme`
+    The new theme, or None to use the styles of the classes.
+
+    #### Returns
+    None
+
+    #### Usage
+    `pgui.set_theme(pgui.Theme(Widget={"font_color": (255, 255, 255)}, Button={"bg_color": (40, 40, 40)}))`
+
+    ---
+
+    """
+    global _theme
+    if theme is not None and not isinstance(theme, Theme):
+        raise TypeError("theme must be a Theme, not", type(theme))
+    from .widget import Widget
+
+    classes = [Widget]
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
+    # Check every value before changing anything
+    styles = {cls: theme._style(cls) if theme is not None else cls._base_style for cls in classes}
+    _theme = theme
+
+    # Attributes of each class whose value changed
+    changed = {}
+    for cls in classes:
+        old, new = cls.style, styles[cls]
+        names = [name for name in old._values.keys() | new._values.keys()
+                 if isinstance(getattr(cls, name, None), Attribute) and old.get(name, _missing) != new.get(name, _missing)]
+        if names:
+            changed[cls] = names
+    for cls in classes:
+        if cls.style._values != styles[cls]._values:
+            cls.style = styles[cls]
+
+    if not changed:
+        return
+    for widget in list(_widgets):
+        names = changed.get(type(widget))
+        if names:
+            # Widgets that override every changed value look the same
+            names = [name for name in names if getattr(widget, "_" + name, _missing) is _missing]
+            if names:
+                widget.mark_dirty()
+                if any(name in widget._layout_attributes for name in names):
+                    widget._hint_changed()
+
+
+def _apply_theme(cls):
+    # Called for each new widget class
+    cls._base_style = cls.__dict__.get("style", cls._base_style)
+    if _theme is not None:
+        cls.style = _theme._style(cls)
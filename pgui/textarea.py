@@ -0,0 +1,689 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from bisect import bisect_right
+from itertools import accumulate
+
+import pygame as pg
+
+from .attributes import Attribute, Color, Integer, String
+from .editable import _Editable
+from .fonts import get_font
+from .glyphs import TextWidths, get_glyph_table
+from .scrolling import _Scrollable
+from .style import Style
+from .textinput import text_input
+
+
+class _Line:
+    # A line of the text, the characters where each of its wrapped rows starts, and the rendered rows.
+    # breaks is None until the line is wrapped, surfaces is None until it is drawn
+    __slots__ = ("text", "breaks", "surfaces")
+
+    def __init__(self, text):
+        self.text = text
+        self.breaks = None
+        self.surfaces = None
+
+
+class TextArea(_Editable, _Scrollable):
+    """
+    ### Description
+    Multi-line text editor with word wrap, for editing config files or reading logs.
+
+    Each line keeps the surfaces of its wrapped rows until it is edited, and only the lines that can be seen are
+    rendered and drawn. The lines are wrapped when they are shown or edited: until then their number of rows is
+    estimated from their length. Typing only wraps and renders the edited line again, so it does not depend on the
+    number of lines.
+
+    It uses the shared fonts and glyph tables, and the keyboard focus and cursor blinking of the `Entry`.
+    A vertical `Slider` on the right is used as the scrollbar, and the mouse wheel scrolls the text when it is
+    in a `UIManager`.
+
+    ### Usage
+    `TextArea(parent, *, x=0, y=0, width=300, height=200, size=20, border=1, text="")`
+
+    #### Parameters
+    `parent: class`
+    A python class that has a 'screen' attribute of type 'pygame.Surface'.
+
+    `x: int`
+    x position in pixels.
+
+    `y: int`
+    y position in pixels.
+
+    `width: int`
+    Width in pixels, with the scrollbar.
+
+    `height: int`
+    Height in pixels.
+
+    `size: int`
+    Font size in pixels.
+
+    `border: int`
+    Width of the widget's border. Set to 0 to remove the border.
+
+    `text: str`
+    Initial text. Lines are separated by "\\n".
+
+    ---
+
+    """
+
+    # ------- ATTRIBUTES -------
+    border_width = Integer()
+    border_color = Color()
+    bg_color = Color()
+    padding = Integer()
+    typing = Attribute()
+    font_name = String()
+    font_color = Color()
+    # --------------------------
+
+    __slots__ = ("_border_width", "_border_color", "_bg_color", "_padding", "_typing", "_font_name", "_font_color",
+                 "_rect", "_font_size", "_font", "_glyphs", "_line_height", "_average", "_lines", "_rows",
+                 "_line", "_column", "_rendered", "_look", "_blink", "_cursor_visible")
+
+    style = Style(border_width=1, border_color=(0, 0, 0), bg_color=(255, 255, 255), padding=4,
+                  font_name="Arial", font_color=(0, 0, 0))
+
+    # The size of the text area does not depend on its font
+    _layout_attributes = ()
+
+    # Number of spaces typed with the tab key
+    tab_size = 4
+
+    def __init__(self, parent, *, x=0, y=0, width=300, height=200, size=20, border=1, text=""):
+        super().__init__(parent)
+        if type(size) != int:
+            raise TypeError("size must be an integer, not", type(size))
+        self._rect = pg.Rect(x, y, width, height)
+
+        # ------- ATTRIBUTES -------
+        # The border comes from the style, or the theme, unless another one is given
+        if border != self.border_width:
+            self.border_width = border
+        self.typing = False
+        # The colors, the padding and the font name come from TextArea.style
+        # --------------------------
+
+        self._font_size = size
+        # Line the cursor is in, and its position in characters in the line
+        self._line = 0
+        self._column = 0
+        self._place_scrollbar()
+        # Lines with rendered rows
+        self._rendered = set()
+
+        # Font, measures and wrap width the lines were wrapped and rendered with
+        self._look = None
+        self._lines = []
+        # Number of rows of each line, so the first row of a line and the line at a row are found with two binary
+        # searches, and changing a line only adds up a chunk of lines again
+        self._rows = TextWidths()
+        self._sync_look()
+        self.text = text
+
+    # ------- TEXT -------
+
+    @property
+    def text(self):
+        return "\n".join(line.text for line in self._lines)
+
+    @text.setter
+    def text(self, text):
+        if type(text) != str:
+            raise TypeError("text must be a string, not", type(text))
+        self._lines = [_Line(line) for line in text.split("\n")]
+        self._rendered = set()
+        self._rows.set(self._estimate(line.text) for line in self._lines)
+        self._line = len(self._lines) - 1
+        self._column = len(self._lines[-1].text)
+        self._scroll = 0
+        self.mark_dirty()
+
+    def _text_rect(self):
+        # Screen area where the text is shown
+        inset = self.border_width + self.padding
+        return pg.Rect(self._rect.x + inset, self._rect.y + inset,
+                       max(self._rect.width - self.scrollbar_width - inset * 2, 1), max(self._rect.height - inset * 2, 1))
+
+    def _sync_look(self):
+        # Wrap every line again when the font or the width change, like when the theme changes,
+        # and render them again when the color changes. The lines are wrapped when they are shown
+        font = get_font(self.font_name, self._font_size)
+        look = (font, self._text_rect().width, self.font_color)
+        if look == self._look:
+            return
+        if self._look is None or look[:2] != self._look[:2]:
+            self._font = font
+            self._glyphs = get_glyph_table(self.font_name, self._font_size)
+            self._line_height = font.get_linesize()
+            self._average = max(self._glyphs.width("x"), 1)
+            self._look = look
+            for line in self._lines:
+                line.breaks = None
+            self._rows.set(self._estimate(line.text) for line in self._lines)
+        self._look = look
+        for line in self._rendered:
+            line.surfaces = None
+        self._rendered = set()
+
+    def _estimate(self, text):
+        # Number of rows of a line that was not wrapped yet
+        return max(-(-len(text) * self._average // self._look[1]), 1)
+
+    def _break_line(self, text):
+        # Characters where each row of a line starts. Rows are broken after the last space that fits,
+        # or after the last character that fits if the row has no space.
+        # The end of a row is guessed from the widths of the characters, and then checked with the width of
+        # the row rendered on its own, so every row fits
+        size = self._font.size
+        limit = self._look[1]
+        positions = [0, *accumulate(self._glyphs.measure(text))]
+        breaks = [0]
+        start = 0
+        while True:
+            end = max(bisect_right(positions, positions[start] + limit) - 1, start + 1)
+            while end < len(text) and size(text[start:end + 1])[0] <= limit:
+                end += 1
+            while end > start + 1 and size(text[start:end])[0] > limit:
+                end -= 1
+            if end >= len(text):
+                return breaks
+            space = text.rfind(" ", start, end)
+            start = space + 1 if space >= start else end
+            breaks.append(start)
+
+    def _wrap_line(self, index):
+        # Wrap a line if it was not wrapped yet, and fix its number of rows
+        line = self._lines[index]
+        if line.breaks is None:
+            line.breaks = self._break_line(line.text)
+            line.surfaces = None
+            rows = self._rows
+            if rows.position(index + 1) - rows.position(index) != len(line.breaks):
+                rows.replace(index, len(line.breaks))
+        return line
+
+    def _render_line(self, line):
+        # Render the rows of a line, they are kept until the line is edited or scrolls out
+        if line.surfaces is None:
+            text = line.text
+            ends = line.breaks[1:] + [len(text)]
+            line.surfaces = [self._font.render(text[start:end], True, self.font_color)
+                             for start, end in zip(line.breaks, ends)]
+        return line.surfaces
+
+    def _changed_line(self, index):
+        # Wrap and render a line again after it was edited
+        self._lines[index].breaks = None
+        self._wrap_line(index)
+
+    # ------- VIEW -------
+
+    def _max_scroll(self):
+        return max(self._rows.total() * self._line_height - self._text_rect().height, 0)
+
+    def _visible_lines(self):
+        # Wrap the lines that can be seen, from the first one down, so the position of the first one does not move
+        height = self._text_rect().height
+        lines = []
+        if self._lines:
+            index = min(self._rows.find(self._scroll // self._line_height), len(self._lines) - 1)
+            y = self._rows.position(index) * self._line_height - self._scroll
+            while index < len(self._lines) and y < height:
+                line = self._wrap_line(index)
+                lines.append((line, y))
+                y += len(line.breaks) * self._line_height
+                index += 1
+        return lines
+
+    def _compose(self):
+        self._sync_look()
+        lines = self._visible_lines()
+        # The estimated rows may have been too many, so the text could be scrolled past its end
+        if self._scroll > self._max_scroll():
+            self._scroll = self._max_scroll()
+            lines = self._visible_lines()
+        self._update_scrollbar()
+
+        image = self._begin_compose(self._rect)
+        image.fill(self.bg_color)
+        view = self._local(self._text_rect())
+        image.set_clip(view)
+        rendered = set()
+        for line, y in lines:
+            for row, surface in enumerate(self._render_line(line)):
+                image.blit(surface, (view.x, view.y + y + row * self._line_height))
+            rendered.add(line)
+        # Forget the rows of the lines that scrolled out
+        for line in self._rendered - rendered:
+            line.surfaces = None
+        self._rendered = rendered
+
+        if self.typing and self._cursor_visible:
+            x, row = self._caret_position()
+            cursor = pg.Rect(view.x + x, view.y + row * self._line_height - self._scroll,
+                             max(self._font_size // 10, 1), self._font.get_height())
+            image.fill(self.font_color, cursor)
+        image.set_clip(None)
+
+        self._draw_scrollbar(image)
+        if self.border_width > 0:
+            pg.draw.rect(image, self.border_color, image.get_rect(), self.border_width)
+
+    def _scroll_to_cursor(self):
+        row = self._caret_position()[1]
+        top = row * self._line_height
+        height = self._text_rect().height
+        if top < self._scroll:
+            self._scroll = top
+        elif top + self._line_height > self._scroll + height:
+            self._scroll = min(top + self._line_height - height, self._max_scroll())
+
+    # ------- CURSOR -------
+
+    def _caret_position(self):
+        # x position in pixels of the cursor in its row, and the row of the text it is in
+        line = self._wrap_line(self._line)
+        row = bisect_right(line.breaks, self._column) - 1
+        x = self._font.size(line.text[line.breaks[row]:self._column])[0]
+        return x, self._rows.position(self._line) + row
+
+    def _column_at(self, index, row, x):
+        # Position in characters closest to a position in pixels in a row of a line
+        line = self._wrap_line(index)
+        row = min(max(row, 0), len(line.breaks) - 1)
+        start = line.breaks[row]
+        end = line.breaks[row + 1] if row + 1 < len(line.breaks) else len(line.text)
+        column = start
+        left = 0
+        for width in self._glyphs.measure(line.text[start:end]):
+            if x < left + width / 2:
+                break
+            left += width
+            column += 1
+        # The end of a wrapped row is the start of the next one, keep the cursor in the row
+        if column == end and row + 1 < len(line.breaks):
+            column = max(end - 1, start)
+        return column
+
+    def _caret_at(self, pos):
+        # Line and position in characters closest to a position of the screen
+        view = self._text_rect()
+        row = max((pos[1] - view.y + self._scroll) // self._line_height, 0)
+        index = min(self._rows.find(row), len(self._lines) - 1)
+        self._wrap_line(index)
+        return index, self._column_at(index, row - self._rows.position(index), pos[0] - view.x)
+
+    def _move_rows(self, count):
+        # Move the cursor up or down some rows, keeping its x position
+        x, row = self._caret_position()
+        row = min(max(row + count, 0), self._rows.total() - 1)
+        index = min(self._rows.find(row), len(self._lines) - 1)
+        self._wrap_line(index)
+        self.set_cursor(index, self._column_at(index, row - self._rows.position(index), x))
+
+    def _show_cursor(self):
+        super()._show_cursor()
+        self._scroll_to_cursor()
+        self.mark_dirty()
+
+    # ------- INPUT -------
+
+    def _poll_input(self, mousepos, pressed):
+        super()._poll_input(mousepos, pressed)
+        self._sync_focus()
+
+    def _click(self, pos):
+        # Clicking the text area gives it the focus, clicking anywhere else removes it
+        if self._rect.collidepoint(pos):
+            self.typing = True
+            self.set_cursor(*self._caret_at(pos))
+        else:
+            self.typing = False
+
+    def _wheel_step(self):
+        # Three rows for each step of the wheel
+        return self._line_height * 3
+
+    def on_key_down(self, event):
+        line, column = self._line, self._column
+        if event.key == pg.K_BACKSPACE:
+            if column > 0:
+                self.delete((line, column - 1), (line, column))
+            elif line > 0:
+                self.delete((line - 1, len(self._lines[line - 1].text)), (line, 0))
+        elif event.key == pg.K_DELETE:
+            if column < len(self._lines[line].text):
+                self.delete((line, column), (line, column + 1))
+            elif line + 1 < len(self._lines):
+                self.delete((line, column), (line + 1, 0))
+        elif event.key == pg.K_LEFT:
+            if column > 0:
+                self.set_cursor(line, column - 1)
+            elif line > 0:
+                self.set_cursor(line - 1, len(self._lines[line - 1].text))
+        elif event.key == pg.K_RIGHT:
+            if column < len(self._lines[line].text):
+                self.set_cursor(line, column + 1)
+            elif line + 1 < len(self._lines):
+                self.set_cursor(line + 1, 0)
+        elif event.key == pg.K_UP:
+            self._move_rows(-1)
+        elif event.key == pg.K_DOWN:
+            self._move_rows(1)
+        elif event.key == pg.K_PAGEUP:
+            self._move_rows(-(self._text_rect().height // self._line_height))
+        elif event.key == pg.K_PAGEDOWN:
+            self._move_rows(self._text_rect().height // self._line_height)
+        elif event.key == pg.K_HOME:
+            self.set_cursor(line, 0)
+        elif event.key == pg.K_END:
+            self.set_cursor(line, len(self._lines[line].text))
+        elif event.key == pg.K_ESCAPE:
+            text_input.set_focus(None)
+        elif event.key in (pg.K_RETURN, pg.K_KP_ENTER):
+            self.insert("\n")
+        elif event.key == pg.K_TAB:
+            self.insert(" " * self.tab_size)
+
+    def on_text_input(self, text):
+        # Pasted text is inserted at once
+        self.insert(text)
+
+    # ------- EDITING -------
+
+    def _check_position(self, position):
+        if type(position) != tuple or len(position) != 2:
+            raise TypeError("position must be a tuple (line, column), not", type(position))
+        line, column = position
+        if type(line) != int or type(column) != int:
+            raise TypeError("line and column must be integers, not", (type(line), type(column)))
+        if not 0 <= line < len(self._lines):
+            raise ValueError(f"line must be between 0 and {len(self._lines) - 1}, not {line}")
+        if not 0 <= column <= len(self._lines[line].text):
+            raise ValueError(f"column must be between 0 and {len(self._lines[line].text)}, not {column}")
+        return line, column
+
+    def insert(self, text, position=None):
+        """
+        #### Description
+        Insert text in the text area. The cursor is moved to the end of the inserted text.
+        Only the line where the text is inserted is wrapped and rendered again.
+
+        #### Parameters
+        `text: str`
+        The text to insert. Lines are separated by "\\n".
+
+        `position: tuple`
+        Line and position in characters in the line where the text is inserted.
+        If it is not specified the text is inserted at the cursor.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.insert("Hello\\nWorld")`
+
+        ---
+
+        """
+        if type(text) != str:
+            raise TypeError("text must be a string, not", type(text))
+        index, column = self._check_position((self._line, self._column) if position is None else position)
+        if not text:
+            return
+        line = self._lines[index]
+        tail = line.text[column:]
+        parts = (line.text[:column] + text).split("\n")
+        line.text = parts[0]
+        if len(parts) > 1:
+            # The lines in the middle are wrapped when they are shown
+            new = [_Line(part) for part in parts[1:]]
+            new[-1].text += tail
+            self._lines[index + 1:index + 1] = new
+            self._rows.insert(index + 1, [self._estimate(line.text) for line in new])
+            self._changed_line(index)
+            index += len(new)
+        else:
+            line.text += tail
+        self._changed_line(index)
+        self._line = index
+        self._column = len(parts[-1])
+        self._show_cursor()
+
+    def delete(self, start, end):
+        """
+        #### Description
+        Remove text from the text area. The lines between start and end are joined.
+
+        #### Parameters
+        `start: tuple`
+        Line and position in characters of the first removed character.
+
+        `end: tuple`
+        Line and position in characters after the last removed character.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.delete((0, 0), (2, 0))`
+
+        ---
+
+        """
+        first, start_column = self._check_position(start)
+        last, end_column = self._check_position(end)
+        if (last, end_column) <= (first, start_column):
+            return
+        line = self._lines[first]
+        line.text = line.text[:start_column] + self._lines[last].text[end_column:]
+        if last > first:
+            del self._lines[first + 1:last + 1]
+            self._rows.delete(first + 1, last + 1)
+        self._changed_line(first)
+        # Keep the cursor on the same character
+        if (self._line, self._column) >= (last, end_column):
+            if self._line == last:
+                self._column += start_column - end_column
+            self._line -= last - first
+        elif (self._line, self._column) > (first, start_column):
+            self._line, self._column = first, start_column
+        self._show_cursor()
+
+    def clear(self):
+        """
+        #### Description
+        Remove all the text.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.clear()`
+
+        ---
+
+        """
+        self.text = ""
+
+    def get_line_count(self):
+        """Return the number of lines"""
+        return len(self._lines)
+
+    def get_line(self, index):
+        """Return the text of a line, without the line break"""
+        return self._lines[index].text
+
+    def get_cursor(self):
+        """Return the line and the position in characters in the line of the cursor"""
+        return self._line, self._column
+
+    def set_cursor(self, line, column):
+        """
+        #### Description
+        Move the cursor, and scroll the text to show it.
+
+        #### Parameters
+        `line: int`
+        Index of the line.
+
+        `column: int`
+        Position in characters, between 0 and the length of the line.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.set_cursor(0, 0)`
+
+        ---
+
+        """
+        line, column = self._check_position((line, column))
+        if (line, column) != (self._line, self._column):
+            self._line = line
+            self._column = column
+            self._show_cursor()
+
+    def get_scroll(self):
+        """Return the distance in pixels from the top of the text to the top of the text area"""
+        return self._scroll
+
+    def set_scroll(self, scroll):
+        """
+        #### Description
+        Scroll the text. The value is kept between 0 and the end of the text.
+
+        #### Parameters
+        `scroll: int`
+        Distance in pixels from the top of the text to the top of the text area.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.set_scroll(0)`
+
+        ---
+
+        """
+        if type(scroll) != int:
+            raise TypeError("scroll must be an integer, not", type(scroll))
+        scroll = min(max(scroll, 0), self._max_scroll())
+        if scroll != self._scroll:
+            self._scroll = scroll
+            self.mark_dirty()
+
+    def get_scrollbar(self):
+        """Return the slider used as the scrollbar, to change how it looks"""
+        return self._scrollbar
+
+    # ------- GEOMETRY -------
+
+    def get_font_size(self):
+        return self._font_size
+
+    def set_font_size(self, size):
+        """
+        #### Description
+        Change the font size of the text area. The lines are wrapped again when they are shown.
+
+        #### Parameters
+        `size: int`
+        The size in pixels of the font
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.set_font_size(14)`
+
+        ---
+
+        """
+        if type(size) != int:
+            raise TypeError(f"size must be an integer, not {type(size)}")
+        self._font_size = size
+        self._sync_look()
+        self.mark_dirty()
+
+    def move(self, x, y):
+        """
+        #### Description
+        Change the widget's position
+
+        #### Parameters
+        `x: int`
+        Set widget's position along the x axis
+        `y: int`
+        Set widget's position along the y axis
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.move(200,300)`
+
+        ---
+
+        """
+        if type(x) != int:
+            raise TypeError("x must be an integer, not", type(x))
+        if type(y) != int:
+            raise TypeError("y must be an integer, not", type(y))
+        self._rect.topleft = (x, y)
+        self._place_scrollbar()
+        self.mark_dirty()
+        self._geometry_changed()
+
+    def set_size(self, width, height):
+        """
+        #### Description
+        Set the size of the widget. The lines are wrapped again when they are shown.
+
+        #### Parameters
+        `width: int`
+        Width in pixels, with the scrollbar.
+
+        `height: int`
+        Height in pixels.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextArea.set_size(400, 300)`
+
+        ---
+
+        """
+        if type(width) != int:
+            raise TypeError("width must be an integer, not", type(width))
+        if type(height) != int:
+            raise TypeError("height must be an integer, not", type(height))
+        if width <= self.scrollbar_width or height < 1:
+            raise ValueError(f"width must be greater than {self.scrollbar_width} and height greater than 0.")
+        if (width, height) == self._rect.size:
+            return
+        self._rect.size = (width, height)
+        self._place_scrollbar()
+        self._sync_look()
+        self._scroll = min(self._scroll, self._max_scroll())
+        self.mark_dirty()
+        self._geometry_changed()
+
+    def _layout_resize(self, width, height):
+        self.set_size(max(width, self.scrollbar_width + 1), max(height, 1))
+        return self._rect.size
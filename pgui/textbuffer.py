@@ -0,0 +1,204 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+class TextBuffer:
+    """
+    ### Description
+    Gap buffer holding the text of an editable widget.
+    The characters are kept in a list with an empty gap at the cursor, so inserting or deleting
+    near the cursor only touches the characters being edited instead of copying the whole text.
+    Moving the gap costs as many characters as the cursor moved.
+
+    `str(buffer)` builds the text once and keeps it until the next edit.
+
+    ### Usage
+    `TextBuffer(text="")`
+
+    #### Parameters
+    `text: str`
+    Initial text.
+
+    ---
+
+    """
+
+    def __init__(self, text=""):
+        if type(text) != str:
+            raise TypeError("text must be a string, not", type(text))
+        self._chars = list(text) + [""] * 16
+        # The gap goes from self._start to self._end
+        self._start = len(text)
+        self._end = len(self._chars)
+        self._string = text
+
+    def __len__(self):
+        return len(self._chars) - self._end + self._start
+
+    def __str__(self):
+        if self._string is None:
+            self._string = "".join(self._chars[:self._start]) + "".join(self._chars[self._end:])
+        return self._string
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.step is None or key.step == 1:
+                return self.slice(key.start, key.stop)
+            return str(self)[key]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("TextBuffer index out of range")
+        return self._chars[key if key < self._start else key + self._end - self._start]
+
+    def _move_gap(self, index):
+        chars = self._chars
+        if index < self._start:
+            n = self._start - index
+            chars[self._end - n:self._end] = chars[index:self._start]
+            self._start -= n
+            self._end -= n
+        elif index > self._start:
+            n = index - self._start
+            chars[self._start:index] = chars[self._end:self._end + n]
+            self._start += n
+            self._end += n
+
+    def _grow(self, size):
+        if self._end - self._start >= size:
+            return
+        # At least double the buffer, so growing is amortized
+        extra = max(size, len(self._chars))
+        self._chars[self._end:self._end] = [""] * extra
+        self._end += extra
+
+    def _check(self, index):
+        if type(index) != int:
+            raise TypeError("index must be an integer, not", type(index))
+        if not 0 <= index <= len(self):
+            raise IndexError(f"index must be between 0 and {len(self)}, not {index}")
+
+    def insert(self, index, text):
+        """
+        #### Description
+        Insert text at a position.
+
+        #### Parameters
+        `index: int`
+        Position of the first inserted character.
+
+        `text: str`
+        Text to insert. Long texts, like a paste, are inserted at once.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextBuffer.insert(0, "Hello")`
+
+        ---
+
+        """
+        self._check(index)
+        if type(text) != str:
+            raise TypeError("text must be a string, not", type(text))
+        if not text:
+            return
+        self._move_gap(index)
+        self._grow(len(text))
+        self._chars[self._start:self._start + len(text)] = text
+        self._start += len(text)
+        self._string = None
+
+    def delete(self, start, end):
+        """
+        #### Description
+        Remove the characters between two positions.
+
+        #### Parameters
+        `start: int`
+        Position of the first removed character.
+
+        `end: int`
+        Position after the last removed character.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextBuffer.delete(0, 5)`
+
+        ---
+
+        """
+        self._check(start)
+        self._check(end)
+        if end <= start:
+            return
+        self._move_gap(start)
+        # The removed characters just become part of the gap
+        self._end += end - start
+        self._string = None
+
+    def set(self, text):
+        """
+        #### Description
+        Replace the whole text.
+
+        #### Parameters
+        `text: str`
+        The new text.
+
+        #### Returns
+        None
+
+        #### Usage
+        `TextBuffer.set("Hello")`
+
+        ---
+
+        """
+        if type(text) != str:
+            raise TypeError("text must be a string, not", type(text))
+        self._chars = list(text) + [""] * 16
+        self._start = len(text)
+        self._end = len(self._chars)
+        self._string = text
+
+    def slice(self, start=None, end=None):
+        """
+        #### Description
+        Get a part of the text without building the whole string.
+
+        #### Parameters
+        `start: int`
+        Position of the first character. Negative values count from the end.
+
+        `end: int`
+        Position after the last character. Negative values count from the end.
+
+        #### Returns
+        `str`
+
+        #### Usage
+        `TextBuffer.slice(10, 20)`
+
+        ---
+
+        """
+        start, end, _ = slice(start, end).indices(len(self))
+        if end <= start:
+            return ""
+        if self._string is not None:
+            return self._string[start:end]
+        gap = self._end - self._start
+        if end <= self._start:
+            return "".join(self._chars[start:end])
+        if start >= self._start:
+            return "".join(self._chars[start + gap:end + gap])
+        return "".join(self._chars[start:self._start]) + "".join(self._chars[self._end:end + gap])
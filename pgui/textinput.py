@@ -0,0 +1,184 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import queue
+
+import pygame as pg
+
+
+class TextInput:
+    """
+    ### Description
+    Shared keyboard dispatcher. Only the widget with the focus receives the KEYDOWN and TEXTINPUT events.
+
+    The `keyboard` module can be used as an optional backend with `use_keyboard()`.
+    Its key presses are put in a thread-safe queue from its own thread and are only
+    sent to the focused widget from the main loop, when `pump()` is called.
+
+    There is a single dispatcher shared by every widget, `pgui.text_input`.
+
+    ### Usage
+    `TextInput()`
+
+    ---
+
+    """
+
+    # Names the keyboard module uses for the keys that edit the text
+    _keys = {
+        "backspace": pg.K_BACKSPACE,
+        "esc": pg.K_ESCAPE,
+        "enter": pg.K_RETURN,
+        "return": pg.K_RETURN,
+        "delete": pg.K_DELETE,
+        "left": pg.K_LEFT,
+        "right": pg.K_RIGHT,
+        "home": pg.K_HOME,
+        "end": pg.K_END,
+    }
+
+    def __init__(self):
+        self._focus = None
+        self._queue = queue.Queue()
+        self._hooked = False
+
+    def set_focus(self, widget):
+        """
+        #### Description
+        Give the focus to a widget, so it receives the keyboard events. A disabled widget removes the focus instead.
+
+        #### Parameters
+        `widget: Widget`
+        The widget to focus, or None to remove the focus.
+
+        #### Returns
+        None
+
+        #### Usage
+        `text_input.set_focus(entry)`
+
+        ---
+
+        """
+        # Disabled widgets can't take the focus
+        if getattr(widget, "_disabled", 0):
+            widget = None
+        if widget is self._focus:
+            return
+        previous = self._focus
+        self._focus = widget
+        if previous is not None:
+            previous.on_blur()
+        if widget is not None:
+            widget.on_focus()
+
+    def get_focus(self):
+        """
+        #### Description
+        Get the widget with the focus.
+
+        #### Returns
+        `Widget` or None
+
+        #### Usage
+        `text_input.get_focus()`
+
+        ---
+
+        """
+        return self._focus
+
+    def handle_event(self, event):
+        """
+        #### Description
+        Send a KEYDOWN or TEXTINPUT event to the widget with the focus.
+        Other events are ignored.
+
+        #### Parameters
+        `event: pygame.event.Event`
+        The event to send.
+
+        #### Returns
+        `bool` True if a widget received the event.
+
+        #### Usage
+        ```python
+        for event in pygame.event.get():
+            pgui.text_input.handle_event(event)
+        ```
+
+        ---
+
+        """
+        if self._focus is None:
+            return False
+        if event.type == pg.KEYDOWN:
+            self._focus.on_key_down(event)
+            return True
+        elif event.type == pg.TEXTINPUT:
+            self._focus.on_text_input(event.text)
+            return True
+        return False
+
+    def use_keyboard(self):
+        """
+        #### Description
+        Also take the key presses from the `keyboard` module.
+        It must be installed, and it needs root privileges on Linux.
+
+        #### Returns
+        None
+
+        #### Usage
+        `text_input.use_keyboard()`
+
+        ---
+
+        """
+        if not self._hooked:
+            import keyboard
+            # Only one hook for every widget. It runs in the keyboard thread, so it just queues the key
+            keyboard.on_press(self._queue.put)
+            self._hooked = True
+
+    def pump(self):
+        """
+        #### Description
+        Send the key presses queued by the `keyboard` backend to the widget with the focus.
+        It must be called from the main loop. `UIManager` and `Entry` call it on their own.
+
+        #### Returns
+        None
+
+        #### Usage
+        `text_input.pump()`
+
+        ---
+
+        """
+        if not self._hooked:
+            return
+        while True:
+            try:
+                key = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            # Ignore the keys pressed while the window is out of focus
+            if self._focus is None or not pg.key.get_focused():
+                continue
+            if key.name in self._keys:
+                self._focus.on_key_down(pg.event.Event(pg.KEYDOWN, key=self._keys[key.name], mod=0, unicode=""))
+            elif key.name == "space":
+                self._focus.on_text_input(" ")
+            elif len(key.name) == 1:
+                self._focus.on_text_input(key.name)
+
+
+# Dispatcher shared by every widget
+text_input = TextInput()
@@ -0,0 +1,203 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+from heapq import heappop, heappush
+from itertools import count
+from weakref import WeakMethod
+
+import pygame as pg
+
+
+class Timer:
+    """
+    ### Description
+    A function scheduled by a `Scheduler`. It is returned by `Scheduler.schedule()`.
+
+    ---
+
+    """
+
+    def __init__(self, func, interval, repeat, weak=False):
+        # A weak timer only keeps a weak reference to the object of its method
+        self._func = WeakMethod(func) if weak else func
+        self._weak = weak
+        self._interval = interval
+        self._repeat = repeat
+        self._active = True
+
+    def _target(self):
+        # The function to call, or None if the object of a weak timer was deleted
+        return self._func() if self._weak else self._func
+
+    def cancel(self):
+        """
+        #### Description
+        Stop the timer. Its function will not be called again.
+
+        #### Usage
+        `Timer.cancel()`
+
+        ---
+
+        """
+        self._active = False
+
+    def is_active(self):
+        """Return True if the timer will still call its function"""
+        return self._active
+
+
+class Scheduler:
+    """
+    ### Description
+    Calls functions after a delay or periodically, using the time of `pygame.time.get_ticks()`
+    instead of counting frames. The timers are kept in a heap ordered by their deadline,
+    so checking them when none is due is a single comparison.
+
+    `UIManager`, `Compositor` and the `update()` method of the widgets run the due timers on their own.
+    There is a single scheduler shared by every widget, `pgui.scheduler`.
+
+    ### Usage
+    `Scheduler(clock=pygame.time.get_ticks)`
+
+    #### Parameters
+    `clock: function`
+    Function returning the current time in milliseconds.
+
+    ---
+
+    """
+
+    def __init__(self, clock=pg.time.get_ticks):
+        self._clock = clock
+        self._heap = []
+        # Keeps the timers with the same deadline in the order they were scheduled
+        self._count = count()
+
+    def __len__(self):
+        return sum(1 for entry in self._heap if entry[2]._active)
+
+    def schedule(self, func, delay, repeat=False, weak=False):
+        """
+        #### Description
+        Call a function after a delay.
+
+        #### Parameters
+        `func: function`
+        Function to call, without arguments.
+
+        `delay: int`
+        Delay in milliseconds. It is also the interval between calls if the timer repeats.
+
+        `repeat: bool`
+        Keep calling the function every `delay` milliseconds until the timer is cancelled.
+
+        `weak: bool`
+        Only keep a weak reference to the object of a method. The timer is cancelled when the object is deleted,
+        so a repeating timer does not keep a widget alive.
+
+        #### Returns
+        `Timer`
+
+        #### Usage
+        `scheduler.schedule(entry.mark_dirty, 500, repeat=True)`
+
+        ---
+
+        """
+        if not callable(func):
+            raise TypeError("func must be a function or method, not", type(func))
+        if type(delay) != int:
+            raise TypeError("delay must be an integer, not", type(delay))
+        elif delay < 0 or (repeat and delay == 0):
+            raise ValueError("delay must be greater than 0.")
+        if weak and not hasattr(func, "__self__"):
+            raise TypeError("func must be a method to be weak, not", type(func))
+        timer = Timer(func, delay, repeat, weak)
+        heappush(self._heap, (self._clock() + delay, next(self._count), timer))
+        return timer
+
+    def _drop_cancelled(self):
+        while self._heap and not self._heap[0][2]._active:
+            heappop(self._heap)
+
+    def run(self):
+        """
+        #### Description
+        Call the functions of the timers that are due.
+
+        #### Returns
+        `int` number of functions called.
+
+        #### Usage
+        `scheduler.run()`
+
+        ---
+
+        """
+        heap = self._heap
+        if not heap:
+            return 0
+        now = self._clock()
+        called = 0
+        while heap and heap[0][0] <= now:
+            deadline, _, timer = heappop(heap)
+            if not timer._active:
+                continue
+            func = timer._target()
+            if func is None:
+                timer._active = False
+                continue
+            if timer._repeat:
+                # Skip the calls that were missed instead of calling the function several times
+                missed = (now - deadline) // timer._interval
+                heappush(heap, (deadline + (missed + 1) * timer._interval, next(self._count), timer))
+            else:
+                timer._active = False
+            func()
+            called += 1
+        return called
+
+    def time_to_next(self):
+        """
+        #### Description
+        Get the time until the next timer is due.
+
+        #### Returns
+        `int` milliseconds, 0 if a timer is already due, or None if there are no timers.
+
+        #### Usage
+        `scheduler.time_to_next()`
+
+        ---
+
+        """
+        self._drop_cancelled()
+        if not self._heap:
+            return None
+        return max(self._heap[0][0] - self._clock(), 0)
+
+    def clear(self):
+        """
+        #### Description
+        Cancel every timer.
+
+        #### Usage
+        `scheduler.clear()`
+
+        ---
+
+        """
+        for entry in self._heap:
+            entry[2]._active = False
+        self._heap.clear()
+
+
+# Scheduler shared by every widget
+scheduler = Scheduler()
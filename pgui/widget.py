@@ -0,0 +1,350 @@
+# @Author: Ciro García <kolterdyx>
+# @Date:   18-Oct-2026
+# @Email:  kolterdev@gmail.com
+# @Project: Pygame GUI
+# @Last modified by:   kolterdyx
+# @Last modified time: 18-Oct-2026
+# @License: This file is subject to the terms and conditions defined in file 'LICENSE', which is part of this source code package.
+
+
+import pygame as pg
+
+from .style import Style, _apply_theme, _widgets
+from .timers import scheduler
+
+
+class Widget:
+    """
+    ### Description
+    Base class of every widget.
+    A widget keeps a composed surface with everything it displays and a dirty flag.
+    The surface is only composed again when the widget is dirty, otherwise drawing the widget is a single blit.
+
+    Subclasses must implement `_compose()` to draw the widget with `_begin_compose()`.
+    Widgets added to a `UIManager` react to the events it dispatches through the `on_*` methods,
+    otherwise `update()` checks the mouse and keyboard itself with `_poll_input()`.
+
+    ### Usage
+    `Widget(parent)`
+
+    #### Parameters
+    `parent: class`
+    A python class that has a 'screen' attribute of type 'pygame.Surface'.
+
+    ---
+
+    """
+
+    # Widgets only store the attributes listed in __slots__, so they don't need a __dict__.
+    # __weakref__ lets timers and the theme refer to a widget without keeping it alive
+    __slots__ = ("parent", "_screen", "_surface", "_bounds", "_dirty", "_manager", "_layout_item", "_disabled",
+                 "__weakref__")
+
+    # Default values of the attributes, shared by every widget of the class.
+    # The theme replaces the style, _base_style keeps the style of the class
+    style = Style()
+    _base_style = style
+
+    # Attributes that change the size the widget needs in a layout
+    _layout_attributes = ("font_name", "font_size", "border_width", "label_side", "label_align", "label_padding")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # New widget classes use the current theme too
+        _apply_theme(cls)
+
+    def __init__(self, parent):
+        # pygame is started when the first widget is created instead of when pgui is imported
+        if not pg.get_init():
+            pg.init()
+        self.parent = parent
+        # Take the parent's screen to display the widget
+        self._screen = parent.screen
+        # Surface holding the composed widget and the screen area it covers
+        self._surface = None
+        self._bounds = pg.Rect(0, 0, 0, 0)
+        self._dirty = True
+        # Manager dispatching the events to the widget, if any
+        self._manager = None
+        # Place of the widget in a layout, if any
+        self._layout_item = None
+        # Number of groups that disabled the widget. Disabled widgets get no mouse or keyboard input
+        self._disabled = 0
+        # Compose the widget again when the theme changes
+        _widgets.add(self)
+
+    def mark_dirty(self):
+        """
+        #### Description
+        Make the widget compose its surface again the next time it is drawn.
+
+        #### Returns
+        None
+
+        #### Usage
+        `Widget.mark_dirty()`
+
+        ---
+
+        """
+        self._dirty = True
+
+    def is_dirty(self):
+        """
+        #### Description
+        Check if the widget will compose its surface again the next time it is drawn.
+
+        #### Returns
+        `bool`
+
+        #### Usage
+        `Widget.is_dirty()`
+
+        ---
+
+        """
+        return self._dirty
+
+    def get_bounds(self):
+        """
+        #### Description
+        Get the screen area covered by the widget, including its label.
+
+        #### Returns
+        `pygame.Rect`
+
+        #### Usage
+        `Widget.get_bounds()`
+
+        ---
+
+        """
+        return self._bounds.copy()
+
+    def update(self):
+        """
+        #### Description
+        Update and display the widget.
+
+        #### Usage
+        `Widget.update()`
+
+        ---
+
+        """
+        if self._manager is None:
+            self._poll_input(pg.mouse.get_pos(), pg.mouse.get_pressed())
+        # Run the timers that are due, like the blinking of the cursors
+        scheduler.run()
+        self.draw()
+
+    def draw(self):
+        """
+        #### Description
+        Display the widget without checking the user input.
+        The widget is only composed again if it is dirty.
+
+        #### Usage
+        `Widget.draw()`
+
+        ---
+
+        """
+        self.refresh()
+        self._screen.blit(self._surface, self._bounds)
+
+    def refresh(self):
+        """
+        #### Description
+        Compose the widget surface again if the widget is dirty, without displaying it.
+
+        #### Returns
+        `bool` True if the surface was composed again.
+
+        #### Usage
+        `Widget.refresh()`
+
+        ---
+
+        """
+        if not self._dirty:
+            return False
+        self._compose()
+        self._dirty = False
+        return True
+
+    def on_mouse_down(self, pos, button):
+        """
+        #### Description
+        Called by the manager when a mouse button is pressed over the widget.
+
+        #### Parameters
+        `pos: tuple`
+        Position of the mouse.
+
+        `button: int`
+        The button pressed. 1 is the primary button.
+
+        ---
+
+        """
+        pass
+
+    def on_mouse_up(self, pos, button):
+        """
+        #### Description
+        Called by the manager when a mouse button is released over the widget,
+        or anywhere if the button was pressed over the widget.
+
+        #### Parameters
+        `pos: tuple`
+        Position of the mouse.
+
+        `button: int`
+        The button released. 1 is the primary button.
+
+        ---
+
+        """
+        pass
+
+    def on_mouse_motion(self, pos, buttons):
+        """
+        #### Description
+        Called by the manager when the mouse moves over the widget,
+        or anywhere while a button pressed over the widget is held.
+
+        #### Parameters
+        `pos: tuple`
+        Position of the mouse.
+
+        `buttons: tuple`
+        State of the mouse buttons.
+
+        ---
+
+        """
+        pass
+
+    def on_mouse_wheel(self, x, y):
+        """
+        #### Description
+        Called by the manager when the mouse wheel is turned over the widget.
+
+        #### Parameters
+        `x: int`
+        Horizontal steps of the wheel.
+
+        `y: int`
+        Vertical steps of the wheel, positive away from the user.
+
+        ---
+
+        """
+        pass
+
+    def on_mouse_leave(self):
+        """
+        #### Description
+        Called by the manager when the mouse moves out of the widget.
+
+        ---
+
+        """
+        pass
+
+    def on_key_down(self, event):
+        """
+        #### Description
+        Called by the manager when a key is pressed while the widget has the focus.
+
+        #### Parameters
+        `event: pygame.event.Event`
+        The KEYDOWN event.
+
+        ---
+
+        """
+        pass
+
+    def on_text_input(self, text):
+        """
+        #### Description
+        Called by the manager when text is typed while the widget has the focus.
+
+        #### Parameters
+        `text: str`
+        The text typed.
+
+        ---
+
+        """
+        pass
+
+    def on_focus(self):
+        """
+        #### Description
+        Called by the manager when the widget gets the focus.
+
+        ---
+
+        """
+        pass
+
+    def on_blur(self):
+        """
+        #### Description
+        Called by the manager when the widget loses the focus.
+
+        ---
+
+        """
+        pass
+
+    def _poll_input(self, mousepos, pressed):
+        # mousepos and pressed are the values of pygame.mouse.get_pos() and pygame.mouse.get_pressed()
+        pass
+
+    def _geometry_changed(self):
+        # Let the manager know the widget moved or changed its size
+        if self._manager is not None:
+            self._manager._reindex(self)
+
+    def _hint_changed(self):
+        # Let the layout know the size the widget needs changed
+        if self._layout_item is not None:
+            self._layout_item.invalidate()
+
+    def _size_hint(self):
+        # Width and height the widget needs, without its label, measured without rendering anything.
+        # None keeps the size the widget had when it was added to the layout
+        return None, None
+
+    def _label_margins(self, width, height):
+        # Space taken by the label outside a widget of the given size, on the left, top, right and bottom
+        return 0, 0, 0, 0
+
+    def _layout_resize(self, width, height):
+        # Resize the widget to fit in a layout, and return the size it takes
+        return self._rect.size
+
+    def _compose(self):
+        raise NotImplementedError
+
+    def _begin_compose(self, bounds):
+        # Reuse the surface if the size did not change, otherwise create a new one
+        self._bounds = pg.Rect(bounds)
+        if self._surface is None or self._surface.get_size() != self._bounds.size:
+            self._surface = pg.Surface(self._bounds.size, pg.SRCALPHA)
+        else:
+            self._surface.fill((0, 0, 0, 0))
+        return self._surface
+
+    def _local(self, rect):
+        # Move a rect from screen coordinates to the coordinates of the composed surface
+        return pg.Rect(rect).move(-self._bounds.x, -self._bounds.y)
+
+    def _blit_outside(self, label, pos):
+        # Copy a label to a transparent area of the composed surface.
+        # Blending would multiply the antialiased edges by their alpha twice
+        self._surface.blit(label, (pos[0] - self._bounds.x, pos[1] - self._bounds.y), special_flags=pg.BLEND_RGBA_MAX)
@@ -19,9 +19,11 @@ setuptools.setup(
     url="https://github.com/Kolterdyx/PyGameUI",
     packages=setuptools.find_namespace_packages(),
     install_requires=[
-        "keyboard",
         "pygame"
     ],
+    extras_require={
+        "keyboard": ["keyboard"]
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -56,9 +56,9 @@ class Main:
         # This is just a label we will later use to display the text of the entry
         self.entry_label = self.font.render(self.entry.text, 1, (0, 0, 0))
 
-        # This is optional but we can but the widgets inside a list so we can
-        # then iterate through it to update the widgets
-        self.widgets = [self.entry, self.button, self.print_button, self.slider, self.checkbox]
+        # This is optional but we can put the widgets inside a group so we can
+        # update and draw all of them at once
+        self.widgets = pgui.WidgetGroup(self.entry, self.button, self.print_button, self.slider, self.checkbox)
 
     # Define some functions
     def print_text(self):
@@ -77,9 +77,8 @@ class Main:
         checkbox_label = self.font.render(str(self.checkbox.checked), 1, (0, 0, 0))
         slider_label = self.font.render(str(self.slider.mark), 1, (0, 0, 0))
 
-        # Update each widget
-        for w in self.widgets:
-            w.update()
+        # Update all the widgets
+        self.widgets.update()
 
         # Display the checkbox label
         self.screen.blit(checkbox_label, (80, 50))
@@ -103,6 +102,8 @@ class Main:
         # The loop does not need to have anything in it but we
         # can use it however we want
         for event in pygame.event.get():
+            # Send the keyboard events to the Entry being typed in
+            pgui.text_input.handle_event(event)
             if event.type == pygame.QUIT:
                 raise SystemExit  # This is just the same as sys.exit()
             if event.type == pygame.KEYDOWN: